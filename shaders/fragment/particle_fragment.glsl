@@ -3,11 +3,15 @@
 // Inputs from vertex shader
 in vec2 texCoord;
 in vec4 particleColor;
+flat in float textureIndex;
 
 // Uniforms
-uniform sampler2D particleTexture;
+uniform sampler2D particleTexture;  // Atlas of square tiles, one per texture index
 uniform bool useTexture = false;
 
+const float ATLAS_TILES = 3.0;
+const float TILE_HALF_TEXEL = 0.5 / 64.0;
+
 // Output
 out vec4 fragColor;
 
@@ -16,8 +20,11 @@ void main()
     vec4 color = particleColor;
     
     if (useTexture) {
-        // Sample particle texture
-        vec4 texColor = texture(particleTexture, texCoord);
+        // Sample this particle's atlas tile, half a texel in from its
+        // edges so linear filtering never reads a neighbouring tile
+        float tileU = clamp(texCoord.x, TILE_HALF_TEXEL, 1.0 - TILE_HALF_TEXEL);
+        vec2 atlasCoord = vec2((tileU + textureIndex) / ATLAS_TILES, texCoord.y);
+        vec4 texColor = texture(particleTexture, atlasCoord);
         color *= texColor;
     } else {
         // Create a simple circular particle
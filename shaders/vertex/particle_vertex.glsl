@@ -9,17 +9,67 @@ layout (location = 2) in vec3 aInstancePos;    // Particle world position
 layout (location = 3) in vec4 aInstanceColor;  // Particle color
 layout (location = 4) in float aInstanceSize;  // Particle size
 layout (location = 5) in float aInstanceRotation; // Particle rotation
+layout (location = 6) in float aInstanceLife;  // Remaining life (1.0 to 0.0)
+layout (location = 7) in float aInstanceTextureIndex; // 0 sparkle, 1 fire, 2 smoke
+layout (location = 8) in float aInstanceEffectSlot; // GPU effect slot, -1 for none
 
-// Uniforms
-uniform mat4 viewMatrix;
-uniform mat4 projectionMatrix;
+// Camera matrices, written once per frame
+layout (std140) uniform Camera {
+    mat4 viewMatrix;
+    mat4 projectionMatrix;
+    mat4 viewProjectionMatrix;
+};
+
+// Per-frame color and size effects, one slot per distinct emitter
+// parameter set; particles without a slot use the instance color and
+// size as uploaded.
+// effectParams: phase offset, amplitude, alpha, base size
+// effectRates: heat dissipation (fire) or expansion rate (smoke)
+const int MAX_EFFECT_SLOTS = 16;
+uniform vec4 effectParams[MAX_EFFECT_SLOTS];
+uniform float effectRates[MAX_EFFECT_SLOTS];
 
 // Outputs to fragment shader
 out vec2 texCoord;
 out vec4 particleColor;
+flat out float textureIndex;
+
+void applyParticleEffect(int slot, inout vec4 color, inout float size)
+{
+    int type = int(aInstanceTextureIndex + 0.5);
+    vec4 params = effectParams[slot];
+    float rate = effectRates[slot];
+    float life = aInstanceLife;
+    
+    if (type == 0) {
+        // Sparkle: twinkle the alpha
+        float brightness = 1.0 + params.y * sin(aInstanceRotation + params.x);
+        color.a = brightness * params.z * life;
+    } else if (type == 1) {
+        // Fire: cool and flicker, shrinking as it cools
+        float heat = life * (1.0 - (1.0 - life) * rate);
+        float flicker = 1.0 + params.y * sin(aInstanceRotation * 2.0 + params.x);
+        color.rgb = min(vec3(flicker,
+                             (0.2 + 0.8 * heat) * flicker,
+                             max(0.0, heat - 0.5) * 2.0 * flicker), vec3(1.0));
+        color.a = life * params.z;
+        size = params.w * (0.5 + 0.5 * heat);
+    } else {
+        // Smoke: expand and fade with age
+        float age = 1.0 - life;
+        size = params.w * (1.0 + age * rate) * 0.5;
+        color.a = params.z * (life * (1.0 - age * 0.5));
+    }
+}
 
 void main()
 {
+    vec4 color = aInstanceColor;
+    float size = aInstanceSize;
+    if (aInstanceEffectSlot >= 0.0) {
+        applyParticleEffect(int(aInstanceEffectSlot + 0.5), color, size);
+    }
+    
     // Apply rotation to quad vertex
     float cosR = cos(aInstanceRotation);
     float sinR = sin(aInstanceRotation);
@@ -30,15 +80,16 @@ void main()
     );
     
     // Scale by particle size
-    rotatedPos *= aInstanceSize;
+    rotatedPos *= size;
     
     // Transform to world position
     vec3 worldPos = aInstancePos + vec3(rotatedPos, 0.0);
     
     // Transform to clip space
-    gl_Position = projectionMatrix * viewMatrix * vec4(worldPos, 1.0);
+    gl_Position = viewProjectionMatrix * vec4(worldPos, 1.0);
     
     // Pass through texture coordinates and color
     texCoord = aTexCoord;
-    particleColor = aInstanceColor;
+    particleColor = color;
+    textureIndex = aInstanceTextureIndex;
 }
\ No newline at end of file
@@ -2,8 +2,9 @@
 Data models and enumerations for the Karaoke Subtitle Creator.
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from enum import Enum
+from functools import cached_property
 from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 import json
@@ -36,6 +37,23 @@ class CapabilityReport:
     gpu_vendor: str
     gpu_model: str
 
+    @cached_property
+    def major_version(self) -> Optional[int]:
+        """Major OpenGL version number, or None if it cannot be parsed."""
+        return self._parse_version_component(0)
+
+    @cached_property
+    def minor_version(self) -> Optional[int]:
+        """Minor OpenGL version number, or None if it cannot be parsed."""
+        return self._parse_version_component(1)
+
+    def _parse_version_component(self, index: int) -> Optional[int]:
+        """Parse one dot-separated component of the OpenGL version string."""
+        try:
+            return int(self.opengl_version.split('.')[index])
+        except (IndexError, ValueError):
+            return None
+
 
 class AnimationType(Enum):
     """Animation effect types."""
@@ -437,6 +455,14 @@ class SubtitleTrack:
     keyframes: List[Keyframe]
     start_time: float
     end_time: float
+    # Numeric property names in array order, fixed at first keyframe insert
+    property_layout: Tuple[str, ...] = field(default=(), repr=False, compare=False)
+    # Bumped on every keyframe edit so cached keyframe lookups are rebuilt
+    keyframe_version: int = field(default=0, repr=False, compare=False)
+
+    def mark_keyframes_changed(self) -> None:
+        """Record a keyframe edit made in place, such as a moved time or changed value."""
+        self.keyframe_version += 1
 
     def validate(self) -> ValidationResult:
         """Validate subtitle track properties."""
@@ -2,7 +2,10 @@
 Timeline engine implementation for temporal state management and keyframe operations.
 """
 
+import bisect
+import logging
 import math
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 import numpy as np
 from .interfaces import ITimelineEngine
@@ -12,6 +15,91 @@ from .models import (
 )
 from ..audio.waveform_generator import WaveformGenerator, WaveformData
 
+logger = logging.getLogger(__name__)
+
+# Interpolation search is only worth trying on tracks with this many keyframes
+_INTERP_SEARCH_MIN_KEYFRAMES = 4
+# Maximum coefficient of variation of keyframe spacing for a "uniform" track
+_UNIFORM_SPACING_TOLERANCE = 0.25
+
+
+_NUMERIC_TYPES = frozenset((int, float))
+
+
+def _is_number(value: Any) -> bool:
+    """Check whether a property value is a numeric scalar (booleans excluded)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _lerp_step(val1: Any, val2: Any, t: float) -> Any:
+    """Step between two values at the interpolation midpoint."""
+    return val2 if t >= 0.5 else val1
+
+
+def _lerp_number(val1: Any, val2: Any, t: float) -> Any:
+    """Linearly interpolate two numbers, stepping if the second is not numeric."""
+    if type(val2) in _NUMERIC_TYPES:
+        return val1 + (val2 - val1) * t
+    return _lerp_fallback(val1, val2, t)
+
+
+def _lerp_sequence(val1: Any, val2: Any, t: float) -> Any:
+    """Interpolate tuples/lists (colors, positions, etc.) component-wise."""
+    if isinstance(val2, (tuple, list)) and len(val1) == len(val2):
+        result = []
+        for v1, v2 in zip(val1, val2):
+            if isinstance(v1, (int, float)) and isinstance(v2, (int, float)):
+                result.append(v1 + (v2 - v1) * t)
+            else:
+                result.append(v2 if t >= 0.5 else v1)
+        return type(val1)(result)
+    return _lerp_step(val1, val2, t)
+
+
+def _lerp_fallback(val1: Any, val2: Any, t: float) -> Any:
+    """Interpolate values whose exact type is not in the dispatch table."""
+    if isinstance(val1, (bool, str)) or isinstance(val2, (bool, str)):
+        return val2 if t >= 0.5 else val1
+    if isinstance(val1, (int, float)) and isinstance(val2, (int, float)):
+        return val1 + (val2 - val1) * t
+    if isinstance(val1, (tuple, list)):
+        return _lerp_sequence(val1, val2, t)
+    return val2 if t >= 0.5 else val1
+
+
+# Interpolator by exact type of the first value
+_INTERPOLATORS = {
+    float: _lerp_number,
+    int: _lerp_number,
+    tuple: _lerp_sequence,
+    list: _lerp_sequence,
+    bool: _lerp_step,
+    str: _lerp_step,
+}
+
+
+@dataclass
+class _KeyframeIndex:
+    """Cached keyframe lookup data for a single subtitle track."""
+    times: List[float]
+    times_array: np.ndarray
+    uniform: bool
+    # Union of property names per adjacent keyframe pair, keyed by later index
+    key_unions: List[Optional[Tuple[str, ...]]]
+    # Track keyframe_version the index was built from
+    version: int = 0
+    # Shared property names and (keyframes x properties) value matrix, only
+    # set when every keyframe animates the same numeric scalar properties
+    schema_names: Tuple[str, ...] = ()
+    schema_values: Optional[np.ndarray] = None
+    
+    def pair_keys(self, next_index: int, kf1: Keyframe, kf2: Keyframe) -> Tuple[str, ...]:
+        """Get the property names of a keyframe pair, computing them on first use."""
+        keys = self.key_unions[next_index]
+        if keys is None:
+            keys = tuple(dict.fromkeys((*kf1.properties, *kf2.properties)))
+            self.key_unions[next_index] = keys
+        return keys
 
 class TimelineEngine(ITimelineEngine):
     """
@@ -37,9 +125,17 @@ class TimelineEngine(ITimelineEngine):
         self._waveform_generator = WaveformGenerator()
         self._cached_waveform_data: Optional[WaveformData] = None
         
+        # Per-track keyframe lookup caches, rebuilt when the track's keyframe version changes
+        self._keyframe_indices: Dict[str, _KeyframeIndex] = {}
+        
         # Timeline bounds
         self._start_time = 0.0
         self._end_time = self._video_asset.duration if video_asset else 0.0
+        
+        # Frame rate and its reciprocal for frame/time conversion
+        self._fps = video_asset.fps if video_asset else 0.0
+        # Unprobed or invalid assets report fps 0; validate_timeline flags them
+        self._inv_fps = 1.0 / self._fps if self._fps > 0 else 0.0
     
     @property
     def current_time(self) -> float:
@@ -49,7 +145,14 @@ class TimelineEngine(ITimelineEngine):
     @current_time.setter
     def current_time(self, time: float) -> None:
         """Set current timeline position with bounds checking."""
-        self._current_time = max(self._start_time, min(time, self._end_time))
+        if time < self._start_time:
+            time = self._start_time
+        elif time > self._end_time:
+            time = self._end_time
+        
+        # Skip the write when the clamped position is unchanged
+        if time != self._current_time:
+            self._current_time = time
     
     @property
     def duration(self) -> float:
@@ -66,6 +169,8 @@ class TimelineEngine(ITimelineEngine):
         """Set video asset and update timeline bounds."""
         self._video_asset = asset
         self._end_time = asset.duration
+        self._fps = asset.fps
+        self._inv_fps = 1.0 / asset.fps if asset.fps > 0 else 0.0
         # Clamp current time to new bounds
         self.current_time = self._current_time
     
@@ -83,11 +188,13 @@ class TimelineEngine(ITimelineEngine):
     def add_subtitle_track(self, track: SubtitleTrack) -> None:
         """Add a subtitle track to the timeline."""
         self._subtitle_tracks[track.id] = track
+        self._keyframe_indices.pop(track.id, None)
     
     def remove_subtitle_track(self, track_id: str) -> bool:
         """Remove a subtitle track from the timeline."""
         if track_id in self._subtitle_tracks:
             del self._subtitle_tracks[track_id]
+            self._keyframe_indices.pop(track_id, None)
             return True
         return False
     
@@ -169,6 +276,10 @@ class TimelineEngine(ITimelineEngine):
         if not (track.start_time <= time <= track.end_time):
             return False
         
+        # Fix the array layout used by interpolate_properties_fast
+        if not track.property_layout:
+            track.property_layout = self._build_property_layout(properties)
+        
         # Create new keyframe
         keyframe = Keyframe(
             time=time,
@@ -185,12 +296,49 @@ class TimelineEngine(ITimelineEngine):
             elif existing_kf.time == time:
                 # Replace existing keyframe at same time
                 track.keyframes[i] = keyframe
+                track.mark_keyframes_changed()
                 return True
             insert_index = i + 1
         
         track.keyframes.insert(insert_index, keyframe)
+        track.mark_keyframes_changed()
         return True
     
+    def update_keyframe(self, track_id: str, time: float, new_time: Optional[float] = None,
+                        properties: Optional[Dict[str, Any]] = None,
+                        tolerance: float = 0.001) -> bool:
+        """
+        Move a keyframe and/or change its property values.
+        
+        Args:
+            track_id: ID of the subtitle track
+            time: Time position of the keyframe to edit
+            new_time: New time position, or None to keep the current one
+            properties: Property values to set, or None to keep the current ones
+            tolerance: Time tolerance for matching keyframes
+            
+        Returns:
+            True if the keyframe was updated, False otherwise
+        """
+        track = self._subtitle_tracks.get(track_id)
+        if not track:
+            return False
+        
+        if new_time is not None and not (track.start_time <= new_time <= track.end_time):
+            return False
+        
+        for keyframe in track.keyframes:
+            if abs(keyframe.time - time) <= tolerance:
+                if properties:
+                    keyframe.properties.update(properties)
+                if new_time is not None:
+                    keyframe.time = new_time
+                    track.keyframes.sort(key=lambda kf: kf.time)
+                track.mark_keyframes_changed()
+                return True
+        
+        return False
+    
     def remove_keyframe(self, track_id: str, time: float, tolerance: float = 0.001) -> bool:
         """
         Remove a keyframe at the specified time.
@@ -210,6 +358,7 @@ class TimelineEngine(ITimelineEngine):
         for i, keyframe in enumerate(track.keyframes):
             if abs(keyframe.time - time) <= tolerance:
                 track.keyframes.pop(i)
+                track.mark_keyframes_changed()
                 return True
         
         return False
@@ -237,34 +386,193 @@ class TimelineEngine(ITimelineEngine):
         if not track or not track.keyframes:
             return {}
         
-        # Find surrounding keyframes
-        prev_kf = None
-        next_kf = None
+        keyframes = track.keyframes
+        index = self._get_keyframe_index(track)
+        next_index = self._find_next_keyframe_index(index, time)
         
-        for keyframe in track.keyframes:
-            if keyframe.time <= time:
-                prev_kf = keyframe
-            elif keyframe.time > time and next_kf is None:
-                next_kf = keyframe
-                break
+        # Outside the keyframe range, return the nearest keyframe's properties
+        if next_index == 0:
+            return keyframes[0].properties.copy()
+        if next_index == len(keyframes):
+            return keyframes[-1].properties.copy()
         
-        # If no surrounding keyframes, return empty dict
-        if prev_kf is None and next_kf is None:
-            return {}
+        # Interpolate between keyframes
+        prev_kf = keyframes[next_index - 1]
+        next_kf = keyframes[next_index]
         
-        # If only one keyframe, return its properties
-        if prev_kf is not None and next_kf is None:
-            return prev_kf.properties.copy()
+        values = index.schema_values
+        if values is not None and prev_kf.time != next_kf.time:
+            t = self._interpolation_factor(prev_kf, next_kf, time)
+            row = values[next_index - 1] + (values[next_index] - values[next_index - 1]) * t
+            return dict(zip(index.schema_names, row.tolist()))
         
-        if prev_kf is None and next_kf is not None:
-            return next_kf.properties.copy()
+        keys = index.pair_keys(next_index, prev_kf, next_kf)
+        return self._interpolate_between_keyframes(prev_kf, next_kf, time, keys)
+    
+    def interpolate_properties_fast(self, track_id: str, time: float) -> np.ndarray:
+        """
+        Interpolate numeric properties into a fixed-layout array.
         
-        # Interpolate between keyframes
-        return self._interpolate_between_keyframes(prev_kf, next_kf, time)
+        Values are ordered by the track's ``property_layout``, so render code
+        can index by position instead of looking up property names. A value
+        that is not a number counts as missing; properties missing from both
+        surrounding keyframes are NaN.
+        
+        Args:
+            track_id: ID of the subtitle track
+            time: Time position to interpolate at
+            
+        Returns:
+            Float array of length ``len(track.property_layout)``
+        """
+        track = self._subtitle_tracks.get(track_id)
+        if not track or not track.keyframes:
+            return np.empty(0, dtype=np.float64)
+        
+        if not track.property_layout:
+            track.property_layout = self._build_property_layout(track.keyframes[0].properties)
+        layout = track.property_layout
+        
+        keyframes = track.keyframes
+        index = self._get_keyframe_index(track)
+        next_index = self._find_next_keyframe_index(index, time)
+        
+        # Outside the keyframe range, hold the nearest keyframe
+        if next_index == 0 or next_index == len(keyframes):
+            props = keyframes[min(next_index, len(keyframes) - 1)].properties
+            result = np.full(len(layout), np.nan, dtype=np.float64)
+            for i, name in enumerate(layout):
+                value = props.get(name)
+                if _is_number(value):
+                    result[i] = value
+            return result
+        
+        prev_kf = keyframes[next_index - 1]
+        next_kf = keyframes[next_index]
+        t = self._interpolation_factor(prev_kf, next_kf, time)
+        
+        # Schema-uniform tracks lerp a row of the cached value matrix
+        values = index.schema_values
+        if values is not None and index.schema_names == layout:
+            return values[next_index - 1] + (values[next_index] - values[next_index - 1]) * t
+        
+        result = np.full(len(layout), np.nan, dtype=np.float64)
+        props1 = prev_kf.properties
+        props2 = next_kf.properties
+        for i, name in enumerate(layout):
+            val1 = props1.get(name)
+            val2 = props2.get(name)
+            is_number1 = _is_number(val1)
+            is_number2 = _is_number(val2)
+            if is_number1 and is_number2:
+                result[i] = val1 + (val2 - val1) * t
+            elif is_number1:
+                result[i] = val1
+            elif is_number2:
+                result[i] = val2
+        
+        return result
     
-    def _interpolate_between_keyframes(self, kf1: Keyframe, kf2: Keyframe, time: float) -> Dict[str, Any]:
+    @staticmethod
+    def _build_property_layout(properties: Dict[str, Any]) -> Tuple[str, ...]:
+        """Get the numeric scalar property names that make up a track layout."""
+        return tuple(name for name, value in properties.items() if _is_number(value))
+    
+    @staticmethod
+    def _find_next_keyframe_index(index: _KeyframeIndex, time: float) -> int:
         """
-        Interpolate properties between two keyframes.
+        Find the index of the first keyframe strictly after a time position.
+        
+        Near-uniformly spaced tracks first try an interpolation search guess,
+        falling back to binary search when the guess misses.
+        
+        Args:
+            index: Keyframe lookup data of the track to search
+            time: Time position to bracket
+            
+        Returns:
+            Keyframe index, equal to the keyframe count if none follow
+        """
+        times = index.times
+        count = len(times)
+        
+        if time < times[0]:
+            return 0
+        if time >= times[-1]:
+            return count
+        
+        if index.uniform:
+            guess = int((time - times[0]) / (times[-1] - times[0]) * (count - 1))
+            if guess < count - 1 and times[guess] <= time < times[guess + 1]:
+                return guess + 1
+        
+        return bisect.bisect_right(times, time)
+    
+    def _get_keyframe_index(self, track: SubtitleTrack) -> _KeyframeIndex:
+        """
+        Get the cached keyframe lookup data for a track, rebuilding if stale.
+        
+        The index is stale once the track's keyframe version moves on, so
+        edits that keep the keyframe count, such as a moved time or changed
+        value, are picked up as well as inserts and removals.
+        """
+        index = self._keyframe_indices.get(track.id)
+        if (index is None or index.version != track.keyframe_version or
+                len(index.times) != len(track.keyframes)):
+            index = self._build_keyframe_index(track)
+            self._keyframe_indices[track.id] = index
+        return index
+    
+    @staticmethod
+    def _build_keyframe_index(track: SubtitleTrack) -> _KeyframeIndex:
+        """
+        Build keyframe lookup data for a track.
+        
+        A track is flagged uniform when the spread of its keyframe spacing is
+        small relative to the mean spacing, as with auto-timed syllables.
+        
+        Args:
+            track: Subtitle track to index
+            
+        Returns:
+            _KeyframeIndex for the track's current keyframes
+        """
+        times = [kf.time for kf in track.keyframes]
+        times_array = np.array(times, dtype=np.float64)
+        
+        uniform = False
+        if len(times) >= _INTERP_SEARCH_MIN_KEYFRAMES:
+            intervals = np.diff(times_array)
+            mean_interval = float(intervals.mean())
+            if mean_interval > 0.0:
+                uniform = float(intervals.std()) / mean_interval <= _UNIFORM_SPACING_TOLERANCE
+        
+        index = _KeyframeIndex(
+            times=times,
+            times_array=times_array,
+            uniform=uniform,
+            key_unions=[None] * len(times),
+            version=track.keyframe_version
+        )
+        
+        # Tracks whose keyframes share one numeric schema interpolate as matrix rows
+        names = TimelineEngine._build_property_layout(track.keyframes[0].properties) if times else ()
+        if names and all(
+            len(kf.properties) == len(names) and
+            all(type(kf.properties.get(name)) in _NUMERIC_TYPES for name in names)
+            for kf in track.keyframes
+        ):
+            index.schema_names = names
+            index.schema_values = np.array(
+                [[kf.properties[name] for name in names] for kf in track.keyframes],
+                dtype=np.float64
+            )
+        
+        return index
+    
+    def _interpolation_factor(self, kf1: Keyframe, kf2: Keyframe, time: float) -> float:
+        """
+        Calculate the eased interpolation factor between two keyframes.
         
         Args:
             kf1: First keyframe (earlier in time)
@@ -272,10 +580,10 @@ class TimelineEngine(ITimelineEngine):
             time: Time position to interpolate at
             
         Returns:
-            Dictionary of interpolated values
+            Interpolation factor (0.0 to 1.0)
         """
         if kf1.time == kf2.time:
-            return kf2.properties.copy()
+            return 1.0
         
         # Calculate interpolation factor (0.0 to 1.0)
         t = (time - kf1.time) / (kf2.time - kf1.time)
@@ -289,13 +597,35 @@ class TimelineEngine(ITimelineEngine):
             t = t * t * (3.0 - 2.0 * t)
         # LINEAR is default, no modification needed
         
+        return t
+    
+    def _interpolate_between_keyframes(self, kf1: Keyframe, kf2: Keyframe, time: float,
+                                       keys: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        """
+        Interpolate properties between two keyframes.
+        
+        Args:
+            kf1: First keyframe (earlier in time)
+            kf2: Second keyframe (later in time)
+            time: Time position to interpolate at
+            keys: Precomputed union of both keyframes' property names
+            
+        Returns:
+            Dictionary of interpolated values
+        """
+        if kf1.time == kf2.time:
+            return kf2.properties.copy()
+        
+        t = self._interpolation_factor(kf1, kf2, time)
+        
         # Interpolate each property
         result = {}
         
         # Get all unique property keys
-        all_keys = set(kf1.properties.keys()) | set(kf2.properties.keys())
+        if keys is None:
+            keys = set(kf1.properties.keys()) | set(kf2.properties.keys())
         
-        for key in all_keys:
+        for key in keys:
             val1 = kf1.properties.get(key)
             val2 = kf2.properties.get(key)
             
@@ -314,6 +644,9 @@ class TimelineEngine(ITimelineEngine):
         """
         Interpolate between two values based on their types.
         
+        Numbers are interpolated linearly, tuples/lists component-wise, and
+        booleans, strings and unknown types step at the midpoint.
+        
         Args:
             val1: First value
             val2: Second value
@@ -322,27 +655,10 @@ class TimelineEngine(ITimelineEngine):
         Returns:
             Interpolated value
         """
-        # Handle numeric types
-        if isinstance(val1, (int, float)) and isinstance(val2, (int, float)):
-            return val1 + (val2 - val1) * t
-        
-        # Handle tuples/lists (colors, positions, etc.)
-        if isinstance(val1, (tuple, list)) and isinstance(val2, (tuple, list)):
-            if len(val1) == len(val2):
-                result = []
-                for v1, v2 in zip(val1, val2):
-                    if isinstance(v1, (int, float)) and isinstance(v2, (int, float)):
-                        result.append(v1 + (v2 - v1) * t)
-                    else:
-                        result.append(v2 if t >= 0.5 else v1)
-                return type(val1)(result)
-        
-        # Handle boolean and string types (step interpolation)
-        if isinstance(val1, (bool, str)) or isinstance(val2, (bool, str)):
-            return val2 if t >= 0.5 else val1
-        
-        # Default: return second value if t >= 0.5, otherwise first
-        return val2 if t >= 0.5 else val1
+        interpolator = _INTERPOLATORS.get(type(val1))
+        if interpolator is None:
+            return _lerp_fallback(val1, val2, t)
+        return interpolator(val1, val2, t)
     
     def copy_keyframes(self, track_id: str, keyframes: List[Keyframe]) -> List[Keyframe]:
         """
@@ -427,8 +743,7 @@ class TimelineEngine(ITimelineEngine):
             
         except (ValueError, RuntimeError) as e:
             # Log error and return None
-            import logging
-            logging.warning(f"Failed to generate waveform data: {e}")
+            logger.warning("Failed to generate waveform data: %s", e)
             return None
     
     def get_waveform_segment(self, start_time: float, end_time: float, 
@@ -481,7 +796,7 @@ class TimelineEngine(ITimelineEngine):
         if not self._video_asset:
             return 0.0
         
-        return frame_number / self._video_asset.fps
+        return frame_number * self._inv_fps
     
     def get_frame_from_time(self, time: float) -> int:
         """
@@ -496,7 +811,7 @@ class TimelineEngine(ITimelineEngine):
         if not self._video_asset:
             return 0
         
-        return int(time * self._video_asset.fps)
+        return int(time * self._fps)
     
     def set_playback_speed(self, speed: float) -> None:
         """Set playback speed multiplier."""
@@ -530,15 +845,17 @@ class TimelineEngine(ITimelineEngine):
         Args:
             delta_time: Time elapsed since last update in seconds
         """
-        if self._is_playing:
-            new_time = self._current_time + (delta_time * self._playback_speed)
-            
-            # Handle end of timeline
-            if new_time >= self._end_time:
-                self.current_time = self._end_time
-                self.pause()  # Auto-pause at end
-            else:
-                self.current_time = new_time
+        if not self._is_playing or delta_time == 0.0:
+            return
+        
+        new_time = self._current_time + (delta_time * self._playback_speed)
+        
+        # Handle end of timeline
+        if new_time >= self._end_time:
+            self.current_time = self._end_time
+            self.pause()  # Auto-pause at end
+        else:
+            self.current_time = new_time
     
     def seek(self, time: float) -> None:
         """
@@ -563,18 +880,10 @@ class TimelineEngine(ITimelineEngine):
         
         for track_id, track in self._subtitle_tracks.items():
             if track.start_time <= time <= track.end_time:
-                # Get interpolated properties for this time
-                properties = self.interpolate_properties(track_id, time)
-                
-                # Apply properties to track elements
-                elements_with_properties = []
-                for element in track.elements:
-                    # Create a copy of the element with interpolated properties applied
-                    modified_element = element  # In a real implementation, apply properties here
-                    elements_with_properties.append(modified_element)
-                
-                if elements_with_properties:
-                    active_elements.append((track_id, elements_with_properties))
+                # Elements are returned as stored; no consumer applies
+                # interpolated keyframe properties to them yet
+                if track.elements:
+                    active_elements.append((track_id, list(track.elements)))
         
         return active_elements
     
@@ -591,6 +900,8 @@ class TimelineEngine(ITimelineEngine):
         # Check video asset
         if not self._video_asset:
             warnings.append("No video asset associated with timeline")
+        elif not self._video_asset.fps > 0:
+            errors.append(f"Invalid video frame rate: {self._video_asset.fps}")
         
         # Check timeline bounds
         if self._start_time >= self._end_time:
@@ -603,8 +914,8 @@ class TimelineEngine(ITimelineEngine):
                 errors.append(f"Track {track_id}: {track_validation.error_message}")
             
             # Check for overlapping keyframes
-            keyframe_times = [kf.time for kf in track.keyframes]
-            if len(keyframe_times) != len(set(keyframe_times)):
+            keyframe_times = self._get_keyframe_index(track).times_array
+            if np.unique(keyframe_times).size != keyframe_times.size:
                 warnings.append(f"Track {track_id} has overlapping keyframes")
         
         return ValidationResult(
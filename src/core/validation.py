@@ -3,14 +3,110 @@ Validation system for file formats and OpenGL capabilities.
 """
 
 import os
+import codecs
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import logging
 import mimetypes
-from typing import Dict, Any, List, Optional, Set
+from dataclasses import asdict
+from typing import Callable, Dict, Any, List, Optional, Set, Tuple
 from pathlib import Path
+import shutil
 import subprocess
 import platform
 
 from .models import ValidationResult, CapabilityReport, ExportSettings
 
+try:
+    from charset_normalizer import from_bytes as detect_charset
+except ImportError:
+    # Encoding detection falls back to latin-1 without charset-normalizer
+    detect_charset = None
+
+try:
+    from ..video.asset_handler import VideoAssetHandler
+    from ..audio.asset_handler import AudioAssetHandler
+except ImportError:
+    # Fall back to basic validation when the asset handlers are unavailable
+    VideoAssetHandler = None
+    AudioAssetHandler = None
+
+logger = logging.getLogger(__name__)
+
+# Host operating system, fixed for the lifetime of the process
+_SYSTEM = platform.system().lower()
+_IS_WINDOWS = _SYSTEM == 'windows'
+_IS_DARWIN = _SYSTEM == 'darwin'
+_IS_LINUX = _SYSTEM == 'linux'
+
+# External tools resolved once at import; probes are skipped when absent
+_FFMPEG_PATH = shutil.which('ffmpeg')
+_WMIC_PATH = shutil.which('wmic') if _IS_WINDOWS else None
+_SYSPROFILER_PATH = shutil.which('system_profiler') if _IS_DARWIN else None
+_LSPCI_PATH = shutil.which('lspci') if _IS_LINUX else None
+
+# Persistent OpenGL capability cache, keyed by GPU and driver identity and
+# holding only reports read from a real context. Bump the version to
+# invalidate entries written by older detection code.
+_CAPABILITY_CACHE_PATH = Path.home() / '.cache' / 'karaoke' / 'opengl_caps.json'
+_CAPABILITY_CACHE_VERSION = 4
+
+# Version file the NVIDIA kernel driver exposes on Linux
+_NVIDIA_DRIVER_VERSION_PATH = Path('/proc/driver/nvidia/version')
+
+# DRM device class in sysfs, read on Linux to identify GPUs without spawning lspci
+_DRM_CLASS_PATH = Path('/sys/class/drm')
+
+# Byte order marks and their encodings; UTF-32 must be checked before UTF-16
+_BYTE_ORDER_MARKS = (
+    (codecs.BOM_UTF32_BE, 'utf-32-be'),
+    (codecs.BOM_UTF32_LE, 'utf-32-le'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+)
+
+# Bytes read from the start of a subtitle file to detect its encoding
+_SUBTITLE_SNIFF_SIZE = 4096
+
+# Worker threads used for I/O-bound batch file validation
+_BATCH_MAX_WORKERS = 8
+
+# Names of common export resolutions
+_COMMON_RESOLUTIONS = {
+    (1920, 1080): "1080p",
+    (1280, 720): "720p",
+    (3840, 2160): "4K",
+    (7680, 4320): "8K"
+}
+
+# Valid export quality presets
+_VALID_QUALITY_PRESETS = frozenset({'draft', 'normal', 'high', 'custom'})
+
+# Relative quality of container formats, used to warn about lossy conversions
+_QUALITY_RANKINGS = {
+    'mov': 5,  # Highest quality (ProRes, etc.)
+    'mkv': 4,  # High quality, flexible container
+    'mp4': 3,  # Good quality, widely compatible
+    'avi': 2   # Lower quality, older format
+}
+
+# Output formats that drop MKV subtitle tracks
+_MKV_LOSSY_OUTPUTS = frozenset({'mp4', 'avi'})
+
+# Subtitle MIME types that platform tables lack or map elsewhere
+# (e.g. .ass is commonly registered as AAC audio)
+for _extension, _mime_type in (('.srt', 'text/srt'), ('.ass', 'text/ass'), ('.vtt', 'text/vtt')):
+    mimetypes.add_type(_mime_type, _extension)
+
+
+@functools.lru_cache(maxsize=None)
+def _guess_mime_type(extension: str) -> Optional[str]:
+    """Look up the MIME type registered for a file extension."""
+    return mimetypes.guess_type(f"file{extension}", strict=False)[0]
+
 
 class ValidationSystem:
     """System for validating file formats, OpenGL capabilities, and export settings."""
@@ -37,6 +133,14 @@ class ValidationSystem:
         '.vtt': 'text/vtt'
     }
     
+    # Extension sets for membership checks and ordered tuples for listings
+    _VIDEO_EXTS = frozenset(SUPPORTED_VIDEO_FORMATS)
+    _AUDIO_EXTS = frozenset(SUPPORTED_AUDIO_FORMATS)
+    _SUBTITLE_EXTS = frozenset(SUPPORTED_SUBTITLE_FORMATS)
+    _VIDEO_EXT_LIST = tuple(SUPPORTED_VIDEO_FORMATS)
+    _AUDIO_EXT_LIST = tuple(SUPPORTED_AUDIO_FORMATS)
+    _SUBTITLE_EXT_LIST = tuple(SUPPORTED_SUBTITLE_FORMATS)
+    
     # Export format compatibility
     EXPORT_CODECS = {
         'mp4': ['h264', 'h265', 'av1'],
@@ -44,52 +148,66 @@ class ValidationSystem:
         'avi': ['h264', 'xvid', 'mjpeg']
     }
     
+    # Codec membership sets per export format
+    _EXPORT_CODEC_SETS = {fmt: frozenset(codecs) for fmt, codecs in EXPORT_CODECS.items()}
+    
     def __init__(self):
         """Initialize validation system."""
         self._opengl_capabilities: Optional[CapabilityReport] = None
+        self._opengl_requirements: Optional[ValidationResult] = None
+        
+        # Shared asset handlers so their per-instance state is reused
+        self._video_handler = VideoAssetHandler() if VideoAssetHandler is not None else None
+        self._audio_handler = AudioAssetHandler() if AudioAssetHandler is not None else None
         
-    def validate_video_file(self, path: str) -> ValidationResult:
+    def validate_video_file(self, path: str,
+                            file_stat: Optional[os.stat_result] = None) -> ValidationResult:
         """
         Validate if video file is supported and accessible.
         
         Args:
             path: Path to video file
+            file_stat: Stat result of the file if the caller already has one
             
         Returns:
             ValidationResult with validation status and metadata
         """
-        try:
-            from ..video.asset_handler import VideoAssetHandler
-            handler = VideoAssetHandler()
-            return handler.validate_video_file(path)
-        except ImportError:
-            # Fallback to basic validation if handler not available
-            return self._basic_video_validation(path)
+        if self._video_handler is not None:
+            return self._video_handler.validate_video_file(path, file_stat)
+        
+        # Fallback to basic validation if handler not available
+        return self._basic_video_validation(path, file_stat)
     
-    def validate_audio_file(self, path: str) -> ValidationResult:
+    def validate_audio_file(self, path: str,
+                            file_stat: Optional[os.stat_result] = None) -> ValidationResult:
         """
         Validate if audio file is supported and accessible.
         
         Args:
             path: Path to audio file
+            file_stat: Stat result of the file if the caller already has one
             
         Returns:
             ValidationResult with validation status and metadata
         """
-        try:
-            from ..audio.asset_handler import AudioAssetHandler
-            handler = AudioAssetHandler()
-            return handler.validate_audio_file(path)
-        except ImportError:
-            # Fallback to basic validation if handler not available
-            return self._basic_audio_validation(path)
+        if self._audio_handler is not None:
+            return self._audio_handler.validate_audio_file(path, file_stat)
+        
+        # Fallback to basic validation if handler not available
+        return self._basic_audio_validation(path, file_stat)
     
-    def validate_subtitle_file(self, path: str) -> ValidationResult:
+    def validate_subtitle_file(self, path: str, deep: bool = True,
+                               file_stat: Optional[os.stat_result] = None) -> ValidationResult:
         """
         Validate if subtitle file is supported and accessible.
         
         Args:
             path: Path to subtitle file
+            deep: Whether to read the file to detect its encoding and check
+                for content; when False only the extension and permissions
+                are checked
+            file_stat: Stat result of the file if the caller already has one,
+                which then stands in for the existence check
             
         Returns:
             ValidationResult with validation status and metadata
@@ -99,7 +217,7 @@ class ValidationSystem:
         metadata = {}
         
         # Check if file exists
-        if not os.path.exists(path):
+        if file_stat is None and not os.path.exists(path):
             return ValidationResult(
                 is_valid=False,
                 error_message=f"Subtitle file does not exist: {path}",
@@ -110,32 +228,46 @@ class ValidationSystem:
         file_path = Path(path)
         extension = file_path.suffix.lower()
         
-        if extension not in self.SUPPORTED_SUBTITLE_FORMATS:
+        if extension not in self._SUBTITLE_EXTS:
             errors.append(f"Unsupported subtitle format: {extension}")
         else:
             metadata['format'] = extension
-            metadata['mime_type'] = self.SUPPORTED_SUBTITLE_FORMATS[extension]
+            metadata['mime_type'] = _guess_mime_type(extension) or self.SUPPORTED_SUBTITLE_FORMATS[extension]
         
         # Check file permissions and basic content
         if not os.access(path, os.R_OK):
             errors.append("File is not readable")
-        else:
+        elif deep:
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    content = f.read(1024)  # Read first 1KB
-                    if not content.strip():
-                        warnings.append("Subtitle file appears to be empty")
-                    metadata['encoding'] = 'utf-8'
-            except UnicodeDecodeError:
-                try:
-                    with open(path, 'r', encoding='latin-1') as f:
-                        content = f.read(1024)
-                        metadata['encoding'] = 'latin-1'
-                        warnings.append("File encoding detected as latin-1, may have character issues")
-                except Exception as e:
-                    errors.append(f"Cannot read subtitle file: {e}")
+                with open(path, 'rb') as f:
+                    raw = f.read(_SUBTITLE_SNIFF_SIZE)
             except Exception as e:
                 errors.append(f"Cannot access subtitle file: {e}")
+            else:
+                encoding, bom_length = self._detect_subtitle_encoding(raw)
+                
+                # Whitespace-only files are detected on the bytes without decoding;
+                # wide encodings interleave NULs and are settled after decoding
+                text_bytes = raw[len(codecs.BOM_UTF8):] if encoding == 'utf-8-sig' else raw[bom_length:]
+                is_empty = not text_bytes or text_bytes.isspace()
+                is_readable = True
+                if not is_empty:
+                    try:
+                        # Incremental decode tolerates a character split at the read boundary
+                        decoder = codecs.getincrementaldecoder(encoding)()
+                        content = decoder.decode(raw[bom_length:], final=False)
+                    except (UnicodeDecodeError, LookupError) as e:
+                        errors.append(f"Cannot read subtitle file: {e}")
+                        is_readable = False
+                    else:
+                        is_empty = not content or content.isspace()
+                
+                if is_readable:
+                    if is_empty:
+                        warnings.append("Subtitle file appears to be empty")
+                    metadata['encoding'] = encoding
+                    if not encoding.startswith('utf'):
+                        warnings.append(f"File encoding detected as {encoding}, may have character issues")
         
         return ValidationResult(
             is_valid=len(errors) == 0,
@@ -144,6 +276,113 @@ class ValidationSystem:
             metadata=metadata
         )
     
+    @staticmethod
+    def _sniff_bom(raw: bytes) -> Optional[Tuple[str, int]]:
+        """
+        Detect a text encoding from a leading byte order mark.
+        
+        Args:
+            raw: First bytes of the file
+            
+        Returns:
+            Tuple of (encoding, BOM length) or None if there is no BOM
+        """
+        for bom, encoding in _BYTE_ORDER_MARKS:
+            if raw.startswith(bom):
+                return encoding, len(bom)
+        return None
+    
+    def _detect_subtitle_encoding(self, raw: bytes) -> Tuple[str, int]:
+        """
+        Detect the text encoding of a subtitle file's leading bytes.
+        
+        Checks for a byte order mark first, then plain UTF-8, and only then
+        falls back to statistical detection with charset-normalizer.
+        
+        Args:
+            raw: First bytes of the file
+            
+        Returns:
+            Tuple of (encoding, number of leading BOM bytes to skip)
+        """
+        bom = self._sniff_bom(raw)
+        if bom is not None:
+            # utf-8-sig consumes its own BOM when decoding
+            encoding, bom_length = bom
+            return encoding, 0 if encoding == 'utf-8-sig' else bom_length
+        
+        try:
+            codecs.getincrementaldecoder('utf-8')().decode(raw, final=False)
+            return 'utf-8', 0
+        except UnicodeDecodeError:
+            pass
+        
+        if detect_charset is not None:
+            best = detect_charset(raw).best()
+            if best is not None:
+                return best.encoding, 0
+        
+        return 'latin-1', 0
+    
+    def validate_files_batch(self, paths: List[str]) -> Dict[str, ValidationResult]:
+        """
+        Validate many media and subtitle files in one pass.
+        
+        Each file is stat'ed once to settle its existence, and the result is
+        handed to its validator so the size check does not stat it again.
+        Per-file validation runs on a thread pool since it is I/O bound. Subtitle contents are not read;
+        call validate_subtitle_file for a deep check of a selected file.
+        
+        Args:
+            paths: Paths to video, audio or subtitle files
+            
+        Returns:
+            Dictionary mapping each path to its ValidationResult
+        """
+        validators = {}
+        for extension in self._VIDEO_EXT_LIST:
+            validators[extension] = ('Video', self.validate_video_file)
+        for extension in self._AUDIO_EXT_LIST:
+            validators[extension] = ('Audio', self.validate_audio_file)
+        for extension in self._SUBTITLE_EXT_LIST:
+            validators[extension] = ('Subtitle', functools.partial(self.validate_subtitle_file, deep=False))
+        
+        results: Dict[str, ValidationResult] = {}
+        pending = []
+        for path in paths:
+            extension = Path(path).suffix.lower()
+            if extension not in validators:
+                results[path] = ValidationResult(
+                    is_valid=False,
+                    error_message=f"Unsupported file format: {extension}"
+                )
+                continue
+            
+            label, validator = validators[extension]
+            try:
+                file_stat = os.stat(path)
+            except (FileNotFoundError, NotADirectoryError):
+                results[path] = ValidationResult(
+                    is_valid=False,
+                    error_message=f"{label} file does not exist: {path}"
+                )
+                continue
+            except OSError:
+                # Leave inaccessible files to the validator to report
+                file_stat = None
+            
+            results[path] = None
+            pending.append((path, validator, file_stat))
+        
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(_BATCH_MAX_WORKERS, len(pending))) as executor:
+                futures = [(path, executor.submit(validator, path, file_stat=file_stat))
+                           for path, validator, file_stat in pending]
+                for path, future in futures:
+                    results[path] = future.result()
+        
+        return results
+    
     def validate_opengl_capabilities(self) -> CapabilityReport:
         """
         Check OpenGL capabilities and version support.
@@ -154,12 +393,20 @@ class ValidationSystem:
         if self._opengl_capabilities is not None:
             return self._opengl_capabilities
         
+        # Reuse a report probed by an earlier run on the same GPU and driver
+        gpu_key = self._get_gpu_identity()
+        if gpu_key:
+            cached_report = self._load_cached_capabilities(gpu_key)
+            if cached_report is not None:
+                self._opengl_capabilities = cached_report
+                return cached_report
+        
+        # A real context is authoritative whenever one can be created
+        probed_info = self._probe_via_qt_context()
+        
         try:
-            # Try to detect OpenGL capabilities using system information
-            # This is a more comprehensive approach than the previous simulation
-            
-            # Check for OpenGL support through various methods
-            opengl_info = self._detect_opengl_info()
+            # Fall back to estimating capabilities from system information
+            opengl_info = probed_info or self._detect_opengl_info()
             
             if opengl_info:
                 report = CapabilityReport(
@@ -184,6 +431,9 @@ class ValidationSystem:
                 )
             
             self._opengl_capabilities = report
+            # Estimates are never persisted, so a later probe can replace them
+            if probed_info is not None and gpu_key:
+                self._store_cached_capabilities(gpu_key, report)
             return report
             
         except Exception:
@@ -198,80 +448,258 @@ class ValidationSystem:
                 gpu_model="Unknown"
             )
     
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_gpu_identity() -> Optional[str]:
+        """
+        Get a stable identifier for the installed GPU(s) and their driver.
+        
+        The renderer and GL version strings are only known once a context
+        exists, so the driver is identified from what the platform reports
+        without one: the driver version on Windows, the OS version on macOS
+        (drivers ship with it) and the kernel driver, kernel release and
+        NVIDIA driver version on Linux. Linux reads sysfs and only falls
+        back to lspci when it is unavailable. The identity is memoized for
+        the lifetime of the process.
+        
+        Returns:
+            SHA1 hex digest of the GPU device IDs and driver versions, or None if unavailable
+        """
+        try:
+            if _WMIC_PATH is not None:
+                output = ValidationSystem._run_probe([_WMIC_PATH, 'path', 'win32_VideoController', 'get',
+                                                      'PNPDeviceID,DriverVersion']) or ''
+                lines = [line.strip() for line in output.splitlines()[1:]]
+                driver_lines = []
+            
+            elif _SYSPROFILER_PATH is not None:
+                output = ValidationSystem._run_probe([_SYSPROFILER_PATH, 'SPDisplaysDataType']) or ''
+                lines = [line.strip() for line in output.splitlines()
+                         if 'Vendor' in line or 'Device ID' in line]
+                driver_lines = [platform.mac_ver()[0]]
+            
+            elif _IS_LINUX:
+                lines = ValidationSystem._read_drm_devices()
+                if not lines and _LSPCI_PATH is not None:
+                    output = ValidationSystem._run_probe([_LSPCI_PATH, '-nnk']) or ''
+                    lines = [line.strip() for line in output.splitlines()
+                             if 'VGA' in line or 'Display' in line or '3D controller' in line
+                             or 'Kernel driver in use' in line]
+                driver_lines = [platform.release()]
+                try:
+                    driver_lines.append(_NVIDIA_DRIVER_VERSION_PATH.read_text().splitlines()[0])
+                except (OSError, IndexError):
+                    pass
+            
+            else:
+                return None
+            
+            if not any(lines):
+                return None
+            
+            identity = '\n'.join(line for line in lines + driver_lines if line)
+            return hashlib.sha1(identity.encode('utf-8')).hexdigest()
+            
+        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError, OSError):
+            return None
+    
+    @staticmethod
+    def _read_drm_devices() -> List[str]:
+        """
+        Read the PCI IDs and kernel driver of each GPU from sysfs.
+        
+        Returns:
+            One "vendor:device driver" line per DRM card, empty if sysfs is unavailable
+        """
+        lines = []
+        try:
+            cards = sorted(_DRM_CLASS_PATH.glob('card*'))
+        except OSError:
+            return lines
+        
+        for card in cards:
+            # Connector entries such as card0-HDMI-A-1 share the card's device
+            if '-' in card.name:
+                continue
+            
+            device = card / 'device'
+            try:
+                vendor_id = (device / 'vendor').read_text().strip()
+                device_id = (device / 'device').read_text().strip()
+            except OSError:
+                continue
+            
+            try:
+                driver = os.path.basename(os.readlink(device / 'driver'))
+            except OSError:
+                driver = ''
+            
+            lines.append(f"{vendor_id}:{device_id} {driver}".strip())
+        
+        return lines
+    
+    def _load_cached_capabilities(self, gpu_key: str) -> Optional[CapabilityReport]:
+        """
+        Load a persisted capability report for the given GPU.
+        
+        Args:
+            gpu_key: GPU identity from _get_gpu_identity
+            
+        Returns:
+            Cached CapabilityReport or None on a miss or unreadable cache
+        """
+        try:
+            with open(_CAPABILITY_CACHE_PATH, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            if data.get('version') != _CAPABILITY_CACHE_VERSION:
+                return None
+            
+            entry = data.get('entries', {}).get(gpu_key)
+            return CapabilityReport(**entry) if entry else None
+            
+        except (OSError, ValueError, TypeError, AttributeError):
+            return None
+    
+    def _store_cached_capabilities(self, gpu_key: str, report: CapabilityReport) -> None:
+        """
+        Persist a capability report for the given GPU.
+        
+        Args:
+            gpu_key: GPU identity from _get_gpu_identity
+            report: Detected capability report
+        """
+        try:
+            data = {'version': _CAPABILITY_CACHE_VERSION, 'entries': {}}
+            try:
+                with open(_CAPABILITY_CACHE_PATH, 'r', encoding='utf-8') as f:
+                    existing = json.load(f)
+                if existing.get('version') == _CAPABILITY_CACHE_VERSION:
+                    data['entries'] = existing.get('entries', {})
+            except (OSError, ValueError, AttributeError):
+                pass
+            
+            data['entries'][gpu_key] = asdict(report)
+            
+            # Write to a temporary file first so readers never see a partial cache
+            _CAPABILITY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = _CAPABILITY_CACHE_PATH.with_suffix('.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            os.replace(temp_path, _CAPABILITY_CACHE_PATH)
+            
+        except (OSError, TypeError, ValueError):
+            pass
+    
     def validate_export_settings(self, settings: ExportSettings) -> ValidationResult:
         """
         Validate export settings for format compatibility.
         
+        Results are memoized on the validated fields, so repeated validation
+        of unchanged settings (e.g. live UI updates) is a cache lookup.
+        
         Args:
             settings: Export settings to validate
             
         Returns:
             ValidationResult with validation status
         """
-        errors = []
-        warnings = []
-        metadata = {}
+        return self.compile_export_validator(settings.format)(settings)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def compile_export_validator(format: str) -> Callable[[ExportSettings], ValidationResult]:
+        """
+        Build a validator specialized to a single export format.
         
-        # Validate format and codec compatibility
-        format_lower = settings.format.lower()
-        if format_lower not in self.EXPORT_CODECS:
-            errors.append(f"Unsupported export format: {settings.format}")
-        else:
-            supported_codecs = self.EXPORT_CODECS[format_lower]
-            if settings.codec.lower() not in supported_codecs:
-                errors.append(f"Codec {settings.codec} not supported for format {settings.format}")
+        The format's codec set is resolved once, so the returned validator only
+        checks the codec, resolution, frame rate, quality preset and bitrate
+        of the settings it is given.
+        
+        Args:
+            format: Export format the validated settings use
+            
+        Returns:
+            Callable validating ExportSettings of the given format
+        """
+        supported_codecs = ValidationSystem._EXPORT_CODEC_SETS.get(format.lower())
+        format_error = f"Unsupported export format: {format}" if supported_codecs is None else None
+        
+        @functools.lru_cache(maxsize=128)
+        def validate_fields(codec: str, width: int, height: int, fps: float,
+                            quality_preset: str, bitrate: Optional[int]
+                            ) -> Tuple[bool, Optional[str], Tuple[str, ...], Tuple[Tuple[str, Any], ...]]:
+            errors = []
+            warnings = []
+            metadata = {}
+            
+            # Validate codec compatibility with the format
+            if format_error is not None:
+                errors.append(format_error)
+            elif codec.lower() not in supported_codecs:
+                errors.append(f"Codec {codec} not supported for format {format}")
             else:
                 metadata['codec_supported'] = True
+            
+            # Validate resolution
+            if width <= 0 or height <= 0:
+                errors.append("Invalid resolution dimensions")
+            elif width % 2 != 0 or height % 2 != 0:
+                warnings.append("Resolution dimensions should be even numbers for better codec compatibility")
+            
+            # Check for common resolutions
+            resolution_name = _COMMON_RESOLUTIONS.get((width, height))
+            if resolution_name is not None:
+                metadata['resolution_name'] = resolution_name
+            
+            # Validate frame rate
+            if fps <= 0:
+                errors.append("Frame rate must be positive")
+            elif fps > 120:
+                warnings.append("Very high frame rate (>120fps) may not be supported by all players")
+            
+            # Validate quality preset
+            if quality_preset.lower() not in _VALID_QUALITY_PRESETS:
+                errors.append(f"Invalid quality preset: {quality_preset}")
+            
+            # Validate bitrate if specified
+            if bitrate is not None:
+                if bitrate <= 0:
+                    errors.append("Bitrate must be positive")
+                elif bitrate < 1000:  # Less than 1 Mbps
+                    warnings.append("Very low bitrate may result in poor quality")
+                elif bitrate > 100000:  # More than 100 Mbps
+                    warnings.append("Very high bitrate may result in large file sizes")
+            
+            # Check hardware encoding availability
+            if ValidationSystem._check_hardware_encoding_support(codec):
+                metadata['hardware_encoding_available'] = True
+            else:
+                warnings.append("Hardware encoding not available, export may be slower")
+            
+            return (
+                len(errors) == 0,
+                "; ".join(errors) if errors else None,
+                tuple(warnings),
+                tuple(metadata.items())
+            )
         
-        # Validate resolution
-        width, height = settings.resolution
-        if width <= 0 or height <= 0:
-            errors.append("Invalid resolution dimensions")
-        elif width % 2 != 0 or height % 2 != 0:
-            warnings.append("Resolution dimensions should be even numbers for better codec compatibility")
-        
-        # Check for common resolutions
-        common_resolutions = {
-            (1920, 1080): "1080p",
-            (1280, 720): "720p", 
-            (3840, 2160): "4K",
-            (7680, 4320): "8K"
-        }
-        if (width, height) in common_resolutions:
-            metadata['resolution_name'] = common_resolutions[(width, height)]
-        
-        # Validate frame rate
-        if settings.fps <= 0:
-            errors.append("Frame rate must be positive")
-        elif settings.fps > 120:
-            warnings.append("Very high frame rate (>120fps) may not be supported by all players")
-        
-        # Validate quality preset
-        valid_presets = {'draft', 'normal', 'high', 'custom'}
-        if settings.quality_preset.lower() not in valid_presets:
-            errors.append(f"Invalid quality preset: {settings.quality_preset}")
-        
-        # Validate bitrate if specified
-        if settings.bitrate is not None:
-            if settings.bitrate <= 0:
-                errors.append("Bitrate must be positive")
-            elif settings.bitrate < 1000:  # Less than 1 Mbps
-                warnings.append("Very low bitrate may result in poor quality")
-            elif settings.bitrate > 100000:  # More than 100 Mbps
-                warnings.append("Very high bitrate may result in large file sizes")
-        
-        # Check hardware encoding availability
-        if self._check_hardware_encoding_support(settings.codec):
-            metadata['hardware_encoding_available'] = True
-        else:
-            warnings.append("Hardware encoding not available, export may be slower")
+        def validate(settings: ExportSettings) -> ValidationResult:
+            width, height = settings.resolution
+            is_valid, error_message, warnings, metadata = validate_fields(
+                settings.codec, width, height,
+                settings.fps, settings.quality_preset, settings.bitrate
+            )
+            
+            # Fresh containers so callers cannot corrupt the memoized result
+            return ValidationResult(
+                is_valid=is_valid,
+                error_message=error_message,
+                warnings=list(warnings),
+                metadata=dict(metadata)
+            )
         
-        return ValidationResult(
-            is_valid=len(errors) == 0,
-            error_message="; ".join(errors) if errors else None,
-            warnings=warnings,
-            metadata=metadata
-        )
+        return validate
     
     def _get_video_info(self, path: str) -> Optional[Dict[str, Any]]:
         """
@@ -283,22 +711,23 @@ class ValidationSystem:
         Returns:
             Dictionary with video information or None if unavailable
         """
+        if self._video_handler is None:
+            return None
+        
         try:
-            from ..video.asset_handler import VideoAssetHandler
-            handler = VideoAssetHandler()
-            return handler._extract_video_metadata(path)
+            return self._video_handler._extract_video_metadata(path)
         except Exception:
             return None
     
     def _detect_opengl_info(self) -> Optional[Dict[str, Any]]:
         """
-        Attempt to detect OpenGL information from the system.
+        Attempt to estimate OpenGL information from the system without a context.
         
         Returns:
             Dictionary with OpenGL information or None if detection fails
         """
         try:
-            # Try multiple methods to detect OpenGL capabilities
+            # Try multiple methods to estimate OpenGL capabilities
             
             # Method 1: Try using OpenGL directly (requires PyOpenGL)
             try:
@@ -325,13 +754,27 @@ class ValidationSystem:
             gpu_info = self._get_gpu_info()
             if gpu_info:
                 # Estimate OpenGL capabilities based on GPU info
+                gpu_lower = gpu_info.lower()
+                is_nvidia = 'nvidia' in gpu_lower
+                is_amd = 'amd' in gpu_lower or 'radeon' in gpu_lower
+                is_modern = is_nvidia or is_amd
+                
+                if is_nvidia:
+                    vendor = 'NVIDIA'
+                elif is_amd:
+                    vendor = 'AMD'
+                elif 'intel' in gpu_lower:
+                    vendor = 'Intel'
+                else:
+                    vendor = 'Unknown'
+                
                 return {
-                    'version': '4.6.0' if 'nvidia' in gpu_info.lower() or 'amd' in gpu_info.lower() else '3.3.0',
-                    'glsl_version': '4.60' if 'nvidia' in gpu_info.lower() or 'amd' in gpu_info.lower() else '3.30',
-                    'max_texture_size': 16384 if 'nvidia' in gpu_info.lower() or 'amd' in gpu_info.lower() else 8192,
+                    'version': '4.6.0' if is_modern else '3.3.0',
+                    'glsl_version': '4.60' if is_modern else '3.30',
+                    'max_texture_size': 16384 if is_modern else 8192,
                     'vertex_arrays': True,
                     'framebuffers': True,
-                    'vendor': 'NVIDIA' if 'nvidia' in gpu_info.lower() else 'AMD' if 'amd' in gpu_info.lower() else 'Intel',
+                    'vendor': vendor,
                     'renderer': gpu_info
                 }
             
@@ -349,6 +792,90 @@ class ValidationSystem:
         except Exception:
             return None
     
+    def _probe_via_qt_context(self) -> Optional[Dict[str, Any]]:
+        """
+        Read OpenGL capabilities from a temporary Qt offscreen context.
+        
+        Only attempted when a Qt GUI application is running, since creating
+        the offscreen surface needs the platform integration.
+        
+        Returns:
+            Dictionary with OpenGL information or None if no context is available
+        """
+        try:
+            from PyQt6.QtGui import QGuiApplication, QOffscreenSurface, QOpenGLContext
+            import OpenGL.GL as gl
+        except ImportError:
+            return None
+        
+        if QGuiApplication.instance() is None:
+            return None
+        
+        context = QOpenGLContext()
+        if not context.create():
+            return None
+        
+        surface = QOffscreenSurface()
+        surface.create()
+        current = False
+        try:
+            if not surface.isValid():
+                return None
+            current = context.makeCurrent(surface)
+            if not current:
+                return None
+            
+            version = gl.glGetString(gl.GL_VERSION).decode('utf-8')
+            glsl_version = gl.glGetString(gl.GL_SHADING_LANGUAGE_VERSION).decode('utf-8')
+            vendor = gl.glGetString(gl.GL_VENDOR).decode('utf-8')
+            renderer = gl.glGetString(gl.GL_RENDERER).decode('utf-8')
+            max_texture_size = int(gl.glGetIntegerv(gl.GL_MAX_TEXTURE_SIZE))
+        except Exception as e:
+            logger.debug("OpenGL context probe failed: %s", e)
+            return None
+        finally:
+            # Release the context before its surface on every path
+            if current:
+                context.doneCurrent()
+            surface.destroy()
+        
+        # VAOs and FBOs are core from OpenGL 3.0
+        try:
+            major = int(version.split('.')[0])
+        except ValueError:
+            major = 0
+        
+        return {
+            'version': version,
+            'glsl_version': glsl_version,
+            'max_texture_size': max_texture_size,
+            'vertex_arrays': major >= 3,
+            'framebuffers': major >= 3,
+            'vendor': vendor,
+            'renderer': renderer
+        }
+    
+    @staticmethod
+    def _run_probe(command: List[str]) -> Optional[str]:
+        """
+        Run a system probe command and return its output.
+        
+        Only stdout is captured, and it is decoded only once the command has
+        succeeded; stderr is discarded.
+        
+        Args:
+            command: Command line to run
+            
+        Returns:
+            Decoded stdout, or None if the command failed
+        """
+        result = subprocess.run(
+            command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=5
+        )
+        if result.returncode != 0:
+            return None
+        return result.stdout.decode('utf-8', errors='replace')
+    
     def _get_gpu_info(self) -> Optional[str]:
         """
         Get GPU information from system.
@@ -357,40 +884,30 @@ class ValidationSystem:
             GPU information string or None if unavailable
         """
         try:
-            system = platform.system().lower()
-            
-            if system == 'windows':
+            if _WMIC_PATH is not None:
                 # Try using wmic on Windows
-                result = subprocess.run(
-                    ['wmic', 'path', 'win32_VideoController', 'get', 'name'],
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0:
-                    lines = result.stdout.strip().split('\n')
+                output = self._run_probe([_WMIC_PATH, 'path', 'win32_VideoController', 'get', 'name'])
+                if output is not None:
+                    lines = output.strip().splitlines()
                     for line in lines[1:]:  # Skip header
                         line = line.strip()
                         if line and 'Name' not in line:
                             return line
             
-            elif system == 'darwin':
+            elif _SYSPROFILER_PATH is not None:
                 # Try using system_profiler on macOS
-                result = subprocess.run(
-                    ['system_profiler', 'SPDisplaysDataType'],
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0:
+                output = self._run_probe([_SYSPROFILER_PATH, 'SPDisplaysDataType'])
+                if output is not None:
                     # Parse the output for GPU information
-                    for line in result.stdout.split('\n'):
+                    for line in output.splitlines():
                         if 'Chipset Model:' in line:
                             return line.split(':', 1)[1].strip()
             
-            elif system == 'linux':
+            elif _LSPCI_PATH is not None:
                 # Try using lspci on Linux
-                result = subprocess.run(
-                    ['lspci', '-nn'], capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
+                output = self._run_probe([_LSPCI_PATH, '-nn'])
+                if output is not None:
+                    for line in output.splitlines():
                         if 'VGA' in line or 'Display' in line:
                             return line.split(':', 1)[1].strip() if ':' in line else line.strip()
             
@@ -403,37 +920,55 @@ class ValidationSystem:
         """
         Check if system meets minimum OpenGL requirements (3.3+).
         
+        The result depends only on the cached capabilities, so it is computed
+        once per validation system.
+        
+        Returns:
+            ValidationResult indicating if requirements are met
+        """
+        if self._opengl_requirements is None:
+            self._opengl_requirements = self._evaluate_opengl_requirements(
+                self.validate_opengl_capabilities()
+            )
+        
+        cached = self._opengl_requirements
+        return ValidationResult(
+            is_valid=cached.is_valid,
+            error_message=cached.error_message,
+            warnings=list(cached.warnings),
+            metadata=dict(cached.metadata)
+        )
+    
+    def _evaluate_opengl_requirements(self, capabilities: CapabilityReport) -> ValidationResult:
+        """
+        Evaluate OpenGL capabilities against the minimum requirements.
+        
+        Args:
+            capabilities: Detected OpenGL capabilities
+            
         Returns:
             ValidationResult indicating if requirements are met
         """
-        capabilities = self.validate_opengl_capabilities()
         errors = []
         warnings = []
         metadata = {'capabilities': capabilities}
         
-        # Parse OpenGL version
-        try:
-            version_str = capabilities.opengl_version
-            if version_str == "Unknown":
-                errors.append("Cannot determine OpenGL version")
-            else:
-                # Extract major.minor version
-                version_parts = version_str.split('.')
-                if len(version_parts) >= 2:
-                    major = int(version_parts[0])
-                    minor = int(version_parts[1])
-                    
-                    # Check minimum requirement (OpenGL 3.3+)
-                    if major < 3 or (major == 3 and minor < 3):
-                        errors.append(f"OpenGL {major}.{minor} detected, but 3.3+ is required")
-                    elif major == 3 and minor == 3:
-                        warnings.append("OpenGL 3.3 detected - minimum requirement met")
-                    else:
-                        metadata['opengl_modern'] = True
-                else:
-                    warnings.append("Cannot parse OpenGL version format")
-        except (ValueError, IndexError):
+        # Check OpenGL version
+        major = capabilities.major_version
+        minor = capabilities.minor_version
+        if capabilities.opengl_version == "Unknown":
+            errors.append("Cannot determine OpenGL version")
+        elif major is None:
             errors.append("Invalid OpenGL version format")
+        elif minor is None:
+            warnings.append("Cannot parse OpenGL version format")
+        # Check minimum requirement (OpenGL 3.3+)
+        elif major < 3 or (major == 3 and minor < 3):
+            errors.append(f"OpenGL {major}.{minor} detected, but 3.3+ is required")
+        elif major == 3 and minor == 3:
+            warnings.append("OpenGL 3.3 detected - minimum requirement met")
+        else:
+            metadata['opengl_modern'] = True
         
         # Check essential features
         if not capabilities.supports_vertex_arrays:
@@ -455,7 +990,9 @@ class ValidationSystem:
             metadata=metadata
         )
     
-    def _check_hardware_encoding_support(self, codec: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _check_hardware_encoding_support(codec: str) -> bool:
         """
         Check if hardware encoding is available for the specified codec.
         
@@ -468,7 +1005,6 @@ class ValidationSystem:
         # This is a simplified check - in a real implementation,
         # this would query the actual hardware capabilities
         
-        system = platform.system().lower()
         codec_lower = codec.lower()
         
         # Common hardware encoding support patterns
@@ -477,24 +1013,24 @@ class ValidationSystem:
             return True
         elif codec_lower in ['h265', 'h.265', 'hevc']:
             # H.265 support varies by hardware generation
-            return system in ['windows', 'darwin']  # More likely on Windows/macOS
+            return _IS_WINDOWS or _IS_DARWIN  # More likely on Windows/macOS
         elif codec_lower == 'av1':
             # AV1 hardware encoding is newer and less common
             return False
         
         return False
     
-    def get_supported_formats(self) -> Dict[str, List[str]]:
+    def get_supported_formats(self) -> Dict[str, Tuple[str, ...]]:
         """
         Get all supported file formats.
         
         Returns:
-            Dictionary mapping format types to lists of extensions
+            Dictionary mapping format types to tuples of extensions
         """
         return {
-            'video': list(self.SUPPORTED_VIDEO_FORMATS.keys()),
-            'audio': list(self.SUPPORTED_AUDIO_FORMATS.keys()),
-            'subtitle': list(self.SUPPORTED_SUBTITLE_FORMATS.keys())
+            'video': self._VIDEO_EXT_LIST,
+            'audio': self._AUDIO_EXT_LIST,
+            'subtitle': self._SUBTITLE_EXT_LIST
         }
     
     def get_export_codec_compatibility(self) -> Dict[str, List[str]]:
@@ -526,7 +1062,7 @@ class ValidationSystem:
         
         # Check if input format is supported
         input_ext = f'.{input_lower}'
-        if input_ext not in self.SUPPORTED_VIDEO_FORMATS:
+        if input_ext not in self._VIDEO_EXTS:
             errors.append(f"Input format {input_format} is not supported")
         
         # Check if output format is supported
@@ -536,15 +1072,8 @@ class ValidationSystem:
             metadata['supported_codecs'] = self.EXPORT_CODECS[output_lower]
         
         # Check for potential quality loss
-        quality_rankings = {
-            'mov': 5,  # Highest quality (ProRes, etc.)
-            'mkv': 4,  # High quality, flexible container
-            'mp4': 3,  # Good quality, widely compatible
-            'avi': 2   # Lower quality, older format
-        }
-        
-        input_quality = quality_rankings.get(input_lower, 3)
-        output_quality = quality_rankings.get(output_lower, 3)
+        input_quality = _QUALITY_RANKINGS.get(input_lower, 3)
+        output_quality = _QUALITY_RANKINGS.get(output_lower, 3)
         
         if output_quality < input_quality:
             warnings.append(f"Converting from {input_format} to {output_format} may result in quality loss")
@@ -553,7 +1082,7 @@ class ValidationSystem:
         if input_lower == 'mov' and output_lower == 'avi':
             warnings.append("Converting from MOV to AVI may not preserve all metadata")
         
-        if input_lower == 'mkv' and output_lower in ['mp4', 'avi']:
+        if input_lower == 'mkv' and output_lower in _MKV_LOSSY_OUTPUTS:
             warnings.append("Converting from MKV may not preserve all subtitle tracks")
         
         metadata['quality_comparison'] = {
@@ -588,8 +1117,8 @@ class ValidationSystem:
         
         metadata['opengl'] = opengl_result.metadata
         
-        # Check FFmpeg availability for video processing
-        ffmpeg_available = self._check_ffmpeg_availability()
+        # Check FFmpeg availability; the executable is resolved on PATH at import
+        ffmpeg_available = _FFMPEG_PATH is not None
         metadata['ffmpeg_available'] = ffmpeg_available
         
         if not ffmpeg_available:
@@ -597,7 +1126,6 @@ class ValidationSystem:
         
         # Check available disk space (basic check)
         try:
-            import shutil
             free_space = shutil.disk_usage('.').free
             metadata['free_disk_space_gb'] = free_space // (1024**3)
             
@@ -631,94 +1159,72 @@ class ValidationSystem:
             metadata=metadata
         )
     
-    def _check_ffmpeg_availability(self) -> bool:
+    def _basic_video_validation(self, path: str,
+                                file_stat: Optional[os.stat_result] = None) -> ValidationResult:
+        """Basic video file validation fallback."""
+        return self._basic_media_validation(
+            path, file_stat, "Video", self.SUPPORTED_VIDEO_FORMATS,
+            2 * 1024 * 1024 * 1024, "Large video file detected (>2GB), may impact performance"
+        )
+    
+    def _basic_audio_validation(self, path: str,
+                                file_stat: Optional[os.stat_result] = None) -> ValidationResult:
+        """Basic audio file validation fallback."""
+        return self._basic_media_validation(
+            path, file_stat, "Audio", self.SUPPORTED_AUDIO_FORMATS,
+            500 * 1024 * 1024, "Large audio file detected (>500MB)"
+        )
+    
+    def _basic_media_validation(self, path: str, file_stat: Optional[os.stat_result],
+                                kind: str, formats: Dict[str, str],
+                                size_warning_threshold: int, size_warning: str) -> ValidationResult:
         """
-        Check if FFmpeg is available on the system.
+        Validate a media file's existence, format, size and readability.
         
+        Args:
+            path: Path to media file
+            file_stat: Stat result of the file, or None to stat it here
+            kind: Media kind used in messages (e.g. "Video")
+            formats: Supported extensions mapped to their MIME types
+            size_warning_threshold: File size in bytes above which to warn
+            size_warning: Warning message for large files
+            
         Returns:
-            True if FFmpeg is available
+            ValidationResult with validation status and metadata
         """
-        try:
-            result = subprocess.run(
-                ['ffmpeg', '-version'], 
-                capture_output=True, 
-                text=True, 
-                timeout=5
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-            return False 
-   
-    def _basic_video_validation(self, path: str) -> ValidationResult:
-        """Basic video file validation fallback."""
         errors = []
         warnings = []
         metadata = {}
         
-        if not os.path.exists(path):
+        # A single stat covers the existence and size checks
+        try:
+            if file_stat is None:
+                file_stat = os.stat(path)
+        except FileNotFoundError:
             return ValidationResult(
                 is_valid=False,
-                error_message=f"Video file does not exist: {path}",
+                error_message=f"{kind} file does not exist: {path}",
                 warnings=warnings
             )
-        
-        file_path = Path(path)
-        extension = file_path.suffix.lower()
-        
-        if extension not in self.SUPPORTED_VIDEO_FORMATS:
-            errors.append(f"Unsupported video format: {extension}")
-        else:
-            metadata['format'] = extension
-            metadata['mime_type'] = self.SUPPORTED_VIDEO_FORMATS[extension]
-        
-        try:
-            file_size = os.path.getsize(path)
-            metadata['file_size'] = file_size
-            if file_size > 2 * 1024 * 1024 * 1024:
-                warnings.append("Large video file detected (>2GB), may impact performance")
         except OSError as e:
-            errors.append(f"Cannot access file: {e}")
-        
-        if not os.access(path, os.R_OK):
-            errors.append("File is not readable")
-        
-        return ValidationResult(
-            is_valid=len(errors) == 0,
-            error_message="; ".join(errors) if errors else None,
-            warnings=warnings,
-            metadata=metadata
-        )
-    
-    def _basic_audio_validation(self, path: str) -> ValidationResult:
-        """Basic audio file validation fallback."""
-        errors = []
-        warnings = []
-        metadata = {}
-        
-        if not os.path.exists(path):
             return ValidationResult(
                 is_valid=False,
-                error_message=f"Audio file does not exist: {path}",
+                error_message=f"Cannot access file: {e}",
                 warnings=warnings
             )
         
-        file_path = Path(path)
-        extension = file_path.suffix.lower()
-        
-        if extension not in self.SUPPORTED_AUDIO_FORMATS:
-            errors.append(f"Unsupported audio format: {extension}")
+        extension = Path(path).suffix.lower()
+        if extension not in formats:
+            errors.append(f"Unsupported {kind.lower()} format: {extension}")
         else:
             metadata['format'] = extension
-            metadata['mime_type'] = self.SUPPORTED_AUDIO_FORMATS[extension]
+            metadata['mime_type'] = _guess_mime_type(extension) or formats[extension]
         
-        try:
-            file_size = os.path.getsize(path)
-            metadata['file_size'] = file_size
-            if file_size > 500 * 1024 * 1024:
-                warnings.append("Large audio file detected (>500MB)")
-        except OSError as e:
-            errors.append(f"Cannot access file: {e}")
+        metadata['file_size'] = file_stat.st_size
+        if file_stat.st_size > size_warning_threshold:
+            warnings.append(size_warning)
         
+        # os.access honours ACLs that the stat mode bits do not reflect
         if not os.access(path, os.R_OK):
             errors.append("File is not readable")
         
@@ -11,21 +11,249 @@ All effects support keyframe-based animation interpolation with easing curves
 and real-time parameter adjustment.
 """
 
+import bisect
+import functools
+import logging
 import math
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Batch kernels run as plain NumPy without numba
+    njit = None
+
 from ..core.models import (
     AnimationEffect, AnimationType, EasingType, TextElement, Keyframe,
     InterpolationType
 )
 from ..core.keyframe_system import KeyframeSystem
 
+logger = logging.getLogger(__name__)
+
+
+def _ease_in_out(t: float) -> float:
+    """Quadratic ease-in-out."""
+    if t < 0.5:
+        return 2.0 * t * t
+    return 1.0 - 2.0 * (1.0 - t) * (1.0 - t)
+
+
+def _ease_bounce(t: float) -> float:
+    """Bounce easing curve."""
+    if t < 1.0 / 2.75:
+        return 7.5625 * t * t
+    elif t < 2.0 / 2.75:
+        t -= 1.5 / 2.75
+        return 7.5625 * t * t + 0.75
+    elif t < 2.5 / 2.75:
+        t -= 2.25 / 2.75
+        return 7.5625 * t * t + 0.9375
+    t -= 2.625 / 2.75
+    return 7.5625 * t * t + 0.984375
+
+
+def _ease_elastic(t: float) -> float:
+    """Elastic easing curve."""
+    if t == 0.0 or t == 1.0:
+        return t
+    p = 0.3
+    s = p / 4.0
+    return -(math.pow(2, 10 * (t - 1)) * math.sin((t - 1 - s) * (2 * math.pi) / p))
+
+
+# Easing curves as plain functions, matching KeyframeSystem._apply_easing
+_EASING_FUNCS: Dict[EasingType, Callable[[float], float]] = {
+    EasingType.LINEAR: lambda t: t,
+    EasingType.EASE_IN: lambda t: t * t,
+    EasingType.EASE_OUT: lambda t: 1.0 - (1.0 - t) * (1.0 - t),
+    EasingType.EASE_IN_OUT: _ease_in_out,
+    EasingType.BOUNCE: _ease_bounce,
+    EasingType.ELASTIC: _ease_elastic,
+}
+
+# Samples in the easing lookup tables; interpolation error at this size is
+# far below what a 60 Hz timeline can show
+_EASING_LUT_SIZE = 1024
+_EASING_LUT_GRID = np.linspace(0.0, 1.0, _EASING_LUT_SIZE)
+
+# Sampled tables for the easings that are expensive to evaluate exactly
+_EASING_LUT: Dict[EasingType, np.ndarray] = {
+    easing: np.array([_EASING_FUNCS[easing](t) for t in _EASING_LUT_GRID.tolist()])
+    for easing in (EasingType.BOUNCE, EasingType.ELASTIC)
+}
+
+
+def _make_lut_easing(table: np.ndarray) -> Callable[[float], float]:
+    """Build a scalar easing function interpolating a lookup table."""
+    # Python floats index faster than NumPy scalars; the repeated last entry
+    # lets t == 1.0 interpolate without a bounds check
+    samples = table.tolist() + [table[-1].item()]
+    scale = _EASING_LUT_SIZE - 1
+    
+    def ease(t: float) -> float:
+        position = t * scale
+        index = int(position)
+        low = samples[index]
+        return low + (samples[index + 1] - low) * (position - index)
+    
+    return ease
+
+
+_EASING_LUT_FUNCS: Dict[EasingType, Callable[[float], float]] = {
+    easing: _make_lut_easing(table) for easing, table in _EASING_LUT.items()
+}
+
+# Array versions of the easing curves for batch evaluation; curves missing
+# here are vectorized from their scalar functions
+_EASING_ARRAY_FUNCS: Dict[EasingType, Callable[[np.ndarray], np.ndarray]] = {
+    EasingType.LINEAR: lambda t: t,
+    EasingType.EASE_IN: lambda t: t * t,
+    EasingType.EASE_OUT: lambda t: 1.0 - (1.0 - t) * (1.0 - t),
+    EasingType.EASE_IN_OUT: lambda t: np.where(t < 0.5, 2.0 * t * t, 1.0 - 2.0 * (1.0 - t) * (1.0 - t)),
+}
+
+# Lookup-table versions of the array easing curves
+_EASING_LUT_ARRAY_FUNCS: Dict[EasingType, Callable[[np.ndarray], np.ndarray]] = {
+    easing: (lambda t, table=table: np.interp(t, _EASING_LUT_GRID, table))
+    for easing, table in _EASING_LUT.items()
+}
+
+# Unit vectors for slide directions
+_SLIDE_DIRECTIONS: Dict[str, Tuple[float, float]] = {
+    'left': (-1.0, 0.0),
+    'right': (1.0, 0.0),
+    'up': (0.0, -1.0),
+    'down': (0.0, 1.0)
+}
+
+# Fraction of the slide distance to offset by, per slide type, as
+# (base, rate) of the linear function base + rate * progress
+_SLIDE_OFFSET_COEFFS: Dict[str, Tuple[float, float]] = {
+    'in': (1.0, -1.0),       # Start offset, end at original position
+    'out': (0.0, 1.0),       # Start at original position, end offset
+    'through': (-1.0, 2.0),  # Slide through from one side to the other
+}
+
+@functools.lru_cache(maxsize=64)
+def _bounce_segments(height: float, gravity: float, damping: float,
+                     bounce_count: int) -> Tuple[Tuple[float, ...], Tuple[float, ...], Tuple[float, ...]]:
+    """
+    Precompute the timing of each bounce for a bounce configuration.
+    
+    Args:
+        height: Initial bounce height
+        gravity: Gravity acceleration
+        damping: Bounce damping factor
+        bounce_count: Number of bounces
+        
+    Returns:
+        Tuple of (segment end times, segment heights, segment durations)
+    """
+    ends = []
+    heights = []
+    durations = []
+    if height <= 0 or gravity <= 0:
+        return (), (), ()
+    
+    total_time = 0.0
+    current_height = height
+    bounce_time = math.sqrt(2 * height / gravity) * 2  # Time for up and down
+    
+    for _ in range(bounce_count + 1):
+        ends.append(total_time + bounce_time)
+        heights.append(current_height)
+        durations.append(bounce_time)
+        
+        # Move to next bounce
+        total_time += bounce_time
+        current_height *= damping
+        bounce_time = math.sqrt(2 * current_height / gravity) * 2
+        
+        if current_height < 0.1:  # Stop bouncing when too small
+            break
+    
+    return tuple(ends), tuple(heights), tuple(durations)
+
+
+def _bounce_heights(times: np.ndarray, ends: np.ndarray, heights: np.ndarray,
+                    durations: np.ndarray, gravity: float) -> np.ndarray:
+    """
+    Evaluate bounce heights for many animation times at once.
+    
+    Args:
+        times: Animation times
+        ends: Bounce segment end times (at least one segment)
+        heights: Bounce segment heights
+        durations: Bounce segment durations
+        gravity: Gravity acceleration
+        
+    Returns:
+        Bounce height at each time
+    """
+    segment = np.searchsorted(ends, times)
+    in_range = (segment < ends.shape[0]) & (times > 0.0)
+    segment = np.minimum(segment, ends.shape[0] - 1)
+    
+    height = heights[segment]
+    half_time = durations[segment] * 0.5
+    local_time = times - (ends[segment] - durations[segment])
+    
+    rising = height * local_time / half_time - 0.5 * gravity * local_time * local_time
+    fall_time = local_time - half_time
+    falling = height - 0.5 * gravity * fall_time * fall_time
+    position = np.where(local_time <= half_time, rising, falling)
+    return np.where(in_range, np.maximum(position, 0.0), 0.0)
+
+
+if njit is not None:
+    _bounce_heights = njit(cache=True, fastmath=True)(_bounce_heights)
+
+
+# Character reveal curves per typing speed
+_TYPING_SPEED_FUNCS: Dict[str, Callable[[float], float]] = {
+    'linear': lambda p: p,
+    'accelerate': lambda p: p * p,
+    'decelerate': lambda p: 1.0 - (1.0 - p) * (1.0 - p),
+}
+
+# Effect types combined by the fused fade + slide path
+_FADE_TYPES = frozenset({AnimationType.FADE_IN, AnimationType.FADE_OUT})
+_SLIDE_TYPES = frozenset({
+    AnimationType.SLIDE_LEFT, AnimationType.SLIDE_RIGHT,
+    AnimationType.SLIDE_UP, AnimationType.SLIDE_DOWN
+})
+
+# KeyframeSystem holds no state, so effects and processors share one instance
+_SHARED_KEYFRAME_SYSTEM = KeyframeSystem()
+
+# Upper bound on cached effect instances per processor; the cache holds its
+# configurations alive, so it is reset rather than allowed to grow unbounded
+_EFFECT_CACHE_LIMIT = 512
+
+# Upper bound on memoized final-state results per effect instance
+_FINAL_CACHE_LIMIT = 64
+
+
+def _effect_config_key(config: AnimationEffect) -> Tuple:
+    """Build a hashable key identifying equal effect configurations."""
+    # Parameter values may be unhashable (lists, dicts), so compare their reprs
+    parameters = tuple(sorted((key, repr(value)) for key, value in config.parameters.items()))
+    return (config.type, config.duration, config.easing_curve, parameters)
+
 
 @dataclass
 class AnimationState:
     """Current state of an animation effect."""
+    # Effect instances are cached across frames, but each get_animation_state
+    # call still builds a fresh state; slots avoid a per-instance dict
+    # (dataclass(slots=True) needs Python 3.10)
+    __slots__ = ('progress', 'is_active', 'start_time', 'end_time', 'properties')
+    
     progress: float  # 0.0 to 1.0
     is_active: bool
     start_time: float
@@ -41,6 +269,9 @@ class BaseAnimationEffect(ABC):
     and property interpolation.
     """
     
+    __slots__ = ('config', 'keyframe_system', '_initial_properties', '_target_properties',
+                 '_ease', '_ease_array', '_final_cache')
+    
     def __init__(self, effect_config: AnimationEffect):
         """
         Initialize base animation effect.
@@ -49,9 +280,21 @@ class BaseAnimationEffect(ABC):
             effect_config: Animation effect configuration
         """
         self.config = effect_config
-        self.keyframe_system = KeyframeSystem()
+        self.keyframe_system = _SHARED_KEYFRAME_SYSTEM
         self._initial_properties: Dict[str, Any] = {}
         self._target_properties: Dict[str, Any] = {}
+        # Easing function resolved once for the configured curve; expensive
+        # curves use lookup tables unless the 'exact_easing' parameter is set
+        curve = effect_config.easing_curve
+        self._ease = _EASING_FUNCS.get(curve, _EASING_FUNCS[EasingType.LINEAR])
+        self._ease_array = _EASING_ARRAY_FUNCS.get(curve)
+        if curve in _EASING_LUT and not effect_config.parameters.get('exact_easing', False):
+            self._ease = _EASING_LUT_FUNCS[curve]
+            self._ease_array = _EASING_LUT_ARRAY_FUNCS[curve]
+        if self._ease_array is None:
+            self._ease_array = np.vectorize(self._ease, otypes=[np.float64])
+        # Final-state properties keyed by the element inputs they depend on
+        self._final_cache: Dict[Tuple, Dict[str, Any]] = {}
     
     @abstractmethod
     def calculate_properties(self, progress: float, text_element: TextElement) -> Dict[str, Any]:
@@ -67,6 +310,53 @@ class BaseAnimationEffect(ABC):
         """
         pass
     
+    def shader_uniforms(self, progress: float) -> Optional[Dict[str, Any]]:
+        """
+        Get text shader uniforms that apply this effect on the GPU.
+        
+        Effects that move or fade a whole text element map onto the text
+        shader's slideOffset and animationAlpha uniforms, so the renderer
+        never computes per-element positions on the CPU.
+        
+        Args:
+            progress: Eased animation progress (0.0 to 1.0)
+            
+        Returns:
+            Dictionary of uniform values, or None if the effect cannot be
+            expressed as shader uniforms and needs calculate_properties
+        """
+        return None
+    
+    def final_properties(self, text_element: TextElement) -> Dict[str, Any]:
+        """
+        Get animated properties once the animation has finished.
+        
+        Finished effects hold their end state for the rest of the element's
+        display time, so the result is memoized per element content,
+        position and color. Position and color may be lists or arrays and
+        are keyed by their values; elements whose fields still cannot be
+        hashed are computed without the memo. Effects whose properties
+        depend on other element fields must override this method.
+        
+        Args:
+            text_element: Text element being animated
+            
+        Returns:
+            Dictionary of animated property values; shared, must not be modified
+        """
+        try:
+            key = (text_element.content, tuple(text_element.position), tuple(text_element.color))
+            properties = self._final_cache.get(key)
+        except TypeError:
+            return self.calculate_properties(1.0, text_element)
+        
+        if properties is None:
+            if len(self._final_cache) >= _FINAL_CACHE_LIMIT:
+                self._final_cache.clear()
+            properties = self.calculate_properties(1.0, text_element)
+            self._final_cache[key] = properties
+        return properties
+    
     def get_animation_state(self, current_time: float, start_time: float) -> AnimationState:
         """
         Get current animation state based on timing.
@@ -79,19 +369,8 @@ class BaseAnimationEffect(ABC):
             Current animation state
         """
         end_time = start_time + self.config.duration
-        
-        if current_time < start_time:
-            progress = 0.0
-            is_active = False
-        elif current_time >= end_time:
-            progress = 1.0
-            is_active = False
-        else:
-            # Calculate raw progress
-            raw_progress = (current_time - start_time) / self.config.duration
-            # Apply easing curve
-            progress = self._apply_easing(raw_progress, self.config.easing_curve)
-            is_active = True
+        progress = self.get_progress(current_time, start_time)
+        is_active = start_time <= current_time < end_time
         
         return AnimationState(
             progress=progress,
@@ -101,9 +380,50 @@ class BaseAnimationEffect(ABC):
             properties={}
         )
     
+    def get_progress(self, current_time: float, start_time: float) -> float:
+        """
+        Get eased animation progress without building an AnimationState.
+        
+        Args:
+            current_time: Current timeline time
+            start_time: Animation start time
+            
+        Returns:
+            Eased progress, 0.0 before the start and 1.0 after the end
+        """
+        if current_time < start_time:
+            return 0.0
+        if current_time >= start_time + self.config.duration:
+            return 1.0
+        
+        # Apply easing curve to the raw progress
+        return self._ease((current_time - start_time) / self.config.duration)
+    
+    def get_progress_batch(self, current_time: float,
+                           start_times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get eased progress for many animations of this effect at once.
+        
+        Args:
+            current_time: Current timeline time
+            start_times: Animation start time of each element
+            
+        Returns:
+            Tuple of (indices of started animations, their eased progress)
+        """
+        started = np.flatnonzero(current_time >= start_times)
+        if self.config.duration <= 0:
+            return started, np.ones(len(started), dtype=np.float64)
+        
+        raw_progress = (current_time - start_times[started]) / self.config.duration
+        # Finished animations report exactly 1.0, as in get_animation_state
+        progress = np.where(raw_progress >= 1.0, 1.0, self._ease_array(np.minimum(raw_progress, 1.0)))
+        return started, progress
+    
     def _apply_easing(self, t: float, easing: EasingType) -> float:
         """Apply easing curve to progress value."""
-        return self.keyframe_system._apply_easing(t, easing)
+        ease = _EASING_LUT_FUNCS.get(easing) or _EASING_FUNCS.get(easing, _EASING_FUNCS[EasingType.LINEAR])
+        return ease(t)
     
     def set_initial_properties(self, properties: Dict[str, Any]) -> None:
         """Set initial properties for the animation."""
@@ -126,6 +446,9 @@ class FadeEffect(BaseAnimationEffect):
     Supports both fade in and fade out animations.
     """
     
+    __slots__ = ('fade_type', 'start_alpha', 'end_alpha', '_delta', '_in_out',
+                 '_alpha_base', '_alpha_rate')
+    
     def __init__(self, effect_config: AnimationEffect):
         """Initialize fade effect."""
         super().__init__(effect_config)
@@ -140,34 +463,71 @@ class FadeEffect(BaseAnimationEffect):
         for key, value in default_params.items():
             if key not in self.config.parameters:
                 self.config.parameters[key] = value
+        
+        # Parameters are fixed after construction
+        parameters = self.config.parameters
+        self.fade_type = parameters['fade_type']
+        self.start_alpha = float(parameters['start_alpha'])
+        self.end_alpha = float(parameters['end_alpha'])
+        
+        # Fold the fade type into constants: in_out ramps over the alpha delta
+        # twice, the other types are linear in progress
+        self._delta = self.end_alpha - self.start_alpha
+        self._in_out = self.fade_type == 'in_out'
+        if self.fade_type == 'in':
+            self._alpha_base, self._alpha_rate = self.start_alpha, self._delta
+        elif self.fade_type == 'out':
+            self._alpha_base, self._alpha_rate = self.end_alpha, -self._delta
+        else:
+            self._alpha_base, self._alpha_rate = self.end_alpha, 0.0
     
     def calculate_properties(self, progress: float, text_element: TextElement) -> Dict[str, Any]:
         """Calculate fade animation properties."""
-        fade_type = self.config.parameters.get('fade_type', 'in')
-        start_alpha = self.config.parameters.get('start_alpha', 0.0)
-        end_alpha = self.config.parameters.get('end_alpha', 1.0)
-        
-        if fade_type == 'in':
-            alpha = self.interpolate_property(start_alpha, end_alpha, progress)
-        elif fade_type == 'out':
-            alpha = self.interpolate_property(end_alpha, start_alpha, progress)
-        elif fade_type == 'in_out':
-            # Fade in for first half, fade out for second half
-            if progress <= 0.5:
-                alpha = self.interpolate_property(start_alpha, end_alpha, progress * 2.0)
-            else:
-                alpha = self.interpolate_property(end_alpha, start_alpha, (progress - 0.5) * 2.0)
-        else:
-            alpha = end_alpha
+        alpha = self.calculate_alpha(progress)
         
-        # Apply alpha to text color
-        current_color = list(text_element.color)
-        current_color[3] = alpha  # Set alpha channel
+        # Apply alpha to text color, building the tuple directly
+        red, green, blue, _ = text_element.color
         
         return {
-            'color': tuple(current_color),
+            'color': (red, green, blue, alpha),
             'alpha': alpha
         }
+    
+    def calculate_alpha(self, progress: float) -> float:
+        """Calculate the faded alpha value at given progress."""
+        if self._in_out:
+            # Fade in for first half, fade out for second half
+            t = progress * 2.0 if progress <= 0.5 else (1.0 - progress) * 2.0
+            return self.start_alpha + self._delta * t
+        
+        return self._alpha_base + self._alpha_rate * progress
+    
+    def shader_uniforms(self, progress: float) -> Optional[Dict[str, Any]]:
+        """Get the text shader alpha uniform for given progress."""
+        return {'animationAlpha': self.calculate_alpha(progress)}
+    
+    def calculate_properties_batch(self, progress: np.ndarray, positions: np.ndarray,
+                                   colors: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Calculate fade animation properties for many elements.
+        
+        Args:
+            progress: Animation progress per element
+            positions: Element positions, shape (N, 2)
+            colors: Element RGBA colors, shape (N, 4)
+            
+        Returns:
+            Dictionary of per-element property arrays
+        """
+        if self._in_out:
+            t = np.where(progress <= 0.5, progress * 2.0, (1.0 - progress) * 2.0)
+            alpha = self.start_alpha + self._delta * t
+        else:
+            alpha = self._alpha_base + self._alpha_rate * progress
+        
+        new_colors = colors.copy()
+        new_colors[:, 3] = alpha
+        return {'color': new_colors, 'alpha': alpha}
 
 
 class SlideEffect(BaseAnimationEffect):
@@ -178,6 +538,9 @@ class SlideEffect(BaseAnimationEffect):
     Supports customizable slide distance and direction.
     """
     
+    __slots__ = ('direction', 'distance', 'slide_type', '_base_x', '_rate_x',
+                 '_base_y', '_rate_y')
+    
     def __init__(self, effect_config: AnimationEffect):
         """Initialize slide effect."""
         super().__init__(effect_config)
@@ -192,50 +555,61 @@ class SlideEffect(BaseAnimationEffect):
         for key, value in default_params.items():
             if key not in self.config.parameters:
                 self.config.parameters[key] = value
+        
+        # Parameters are fixed after construction, so the slide geometry is
+        # resolved once
+        parameters = self.config.parameters
+        self.direction = parameters['direction']
+        self.distance = float(parameters['distance'])
+        self.slide_type = parameters['slide_type']
+        # Direction, distance and slide type fold into a linear offset per
+        # axis; unknown slide types leave the element in place
+        dx, dy = _SLIDE_DIRECTIONS.get(self.direction, (-1.0, 0.0))
+        base, rate = _SLIDE_OFFSET_COEFFS.get(self.slide_type, (0.0, 0.0))
+        self._base_x = dx * self.distance * base
+        self._rate_x = dx * self.distance * rate
+        self._base_y = dy * self.distance * base
+        self._rate_y = dy * self.distance * rate
     
     def calculate_properties(self, progress: float, text_element: TextElement) -> Dict[str, Any]:
         """Calculate slide animation properties."""
-        direction = self.config.parameters.get('direction', 'left')
-        distance = self.config.parameters.get('distance', 100.0)
-        slide_type = self.config.parameters.get('slide_type', 'in')
-        
-        # Calculate direction vector
-        direction_vectors = {
-            'left': (-1.0, 0.0),
-            'right': (1.0, 0.0),
-            'up': (0.0, -1.0),
-            'down': (0.0, 1.0)
-        }
-        
-        dx, dy = direction_vectors.get(direction, (-1.0, 0.0))
-        
-        # Calculate offset based on slide type
-        if slide_type == 'in':
-            # Start offset, end at original position
-            offset_x = dx * distance * (1.0 - progress)
-            offset_y = dy * distance * (1.0 - progress)
-        elif slide_type == 'out':
-            # Start at original position, end offset
-            offset_x = dx * distance * progress
-            offset_y = dy * distance * progress
-        elif slide_type == 'through':
-            # Slide through from one side to the other
-            offset_x = dx * distance * (progress - 0.5) * 2.0
-            offset_y = dy * distance * (progress - 0.5) * 2.0
-        else:
-            offset_x = offset_y = 0.0
+        offset_x = self._base_x + self._rate_x * progress
+        offset_y = self._base_y + self._rate_y * progress
         
         # Apply offset to current position
-        new_position = (
-            text_element.position[0] + offset_x,
-            text_element.position[1] + offset_y
-        )
+        x, y = text_element.position
+        new_position = (x + offset_x, y + offset_y)
         
         return {
             'position': new_position,
             'offset_x': offset_x,
             'offset_y': offset_y
         }
+    
+    def shader_uniforms(self, progress: float) -> Optional[Dict[str, Any]]:
+        """Get the text shader offset uniform for given progress."""
+        return {'slideOffset': (self._base_x + self._rate_x * progress,
+                                self._base_y + self._rate_y * progress)}
+    
+    def calculate_properties_batch(self, progress: np.ndarray, positions: np.ndarray,
+                                   colors: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Calculate slide animation properties for many elements.
+        
+        Args:
+            progress: Animation progress per element
+            positions: Element positions, shape (N, 2)
+            colors: Element RGBA colors, shape (N, 4)
+            
+        Returns:
+            Dictionary of per-element property arrays
+        """
+        offset_x = self._base_x + self._rate_x * progress
+        offset_y = self._base_y + self._rate_y * progress
+        new_positions = positions.copy()
+        new_positions[:, 0] += offset_x
+        new_positions[:, 1] += offset_y
+        return {'position': new_positions, 'offset_x': offset_x, 'offset_y': offset_y}
 
 
 class TypewriterEffect(BaseAnimationEffect):
@@ -246,6 +620,10 @@ class TypewriterEffect(BaseAnimationEffect):
     and optional cursor display.
     """
     
+    __slots__ = ('show_cursor', 'cursor_char', 'cursor_blink_rate', 'typing_speed',
+                 'character_delay', '_speed_fn', '_blink_scale', '_last_content',
+                 '_last_chars', '_last_slice')
+    
     def __init__(self, effect_config: AnimationEffect):
         """Initialize typewriter effect."""
         super().__init__(effect_config)
@@ -262,39 +640,48 @@ class TypewriterEffect(BaseAnimationEffect):
         for key, value in default_params.items():
             if key not in self.config.parameters:
                 self.config.parameters[key] = value
+        
+        # Parameters are fixed after construction
+        parameters = self.config.parameters
+        self.show_cursor = bool(parameters['show_cursor'])
+        self.cursor_char = str(parameters['cursor_char'])
+        self.cursor_blink_rate = float(parameters['cursor_blink_rate'])
+        self.typing_speed = parameters['typing_speed']
+        self.character_delay = float(parameters['character_delay'])
+        self._speed_fn = _TYPING_SPEED_FUNCS.get(self.typing_speed, _TYPING_SPEED_FUNCS['linear'])
+        # Cursor blink cycles per unit of progress
+        self._blink_scale = self.config.duration * self.cursor_blink_rate
+        
+        # Last revealed slice, reused while no new character appears
+        self._last_content: Optional[str] = None
+        self._last_chars = -1
+        self._last_slice = ''
     
     def calculate_properties(self, progress: float, text_element: TextElement) -> Dict[str, Any]:
         """Calculate typewriter animation properties."""
         text_content = text_element.content
-        show_cursor = self.config.parameters.get('show_cursor', True)
-        cursor_char = self.config.parameters.get('cursor_char', '|')
-        cursor_blink_rate = self.config.parameters.get('cursor_blink_rate', 2.0)
-        typing_speed = self.config.parameters.get('typing_speed', 'linear')
         
         # Apply typing speed curve
-        if typing_speed == 'accelerate':
-            char_progress = progress * progress
-        elif typing_speed == 'decelerate':
-            char_progress = 1.0 - (1.0 - progress) * (1.0 - progress)
-        else:  # linear
-            char_progress = progress
+        char_progress = self._speed_fn(progress)
         
         # Calculate number of characters to show
         total_chars = len(text_content)
         chars_to_show = int(char_progress * total_chars)
         chars_to_show = min(chars_to_show, total_chars)
         
-        # Build visible text
-        visible_text = text_content[:chars_to_show]
+        # Build visible text, slicing only when the reveal has advanced
+        if chars_to_show != self._last_chars or text_content != self._last_content:
+            self._last_content = text_content
+            self._last_chars = chars_to_show
+            self._last_slice = text_content[:chars_to_show]
+        visible_text = self._last_slice
         
         # Add cursor if enabled and animation is active
-        if show_cursor and progress < 1.0:
-            # Calculate cursor blink
-            blink_cycle = (progress * self.config.duration * cursor_blink_rate) % 1.0
-            show_cursor_now = blink_cycle < 0.5
-            
-            if show_cursor_now:
-                visible_text += cursor_char
+        if self.show_cursor and progress < 1.0:
+            # Cursor is visible in the first half of each blink cycle
+            blink_position = progress * self._blink_scale
+            if blink_position - int(blink_position) < 0.5:
+                visible_text += self.cursor_char
         
         return {
             'content': visible_text,
@@ -312,6 +699,10 @@ class BounceEffect(BaseAnimationEffect):
     gravity, and damping parameters.
     """
     
+    __slots__ = ('bounce_height', 'gravity', 'damping', 'bounce_count', 'direction',
+                 '_vertical', '_horizontal', '_horizontal_amplitude', '_horizontal_omega',
+                 '_bounce_key', '_bounce_segments', '_last_segment')
+    
     def __init__(self, effect_config: AnimationEffect):
         """Initialize bounce effect."""
         super().__init__(effect_config)
@@ -328,44 +719,110 @@ class BounceEffect(BaseAnimationEffect):
         for key, value in default_params.items():
             if key not in self.config.parameters:
                 self.config.parameters[key] = value
+        
+        # Parameters are fixed after construction
+        parameters = self.config.parameters
+        self.bounce_height = float(parameters['bounce_height'])
+        self.gravity = float(parameters['gravity'])
+        self.damping = float(parameters['damping'])
+        self.bounce_count = int(parameters['bounce_count'])
+        self.direction = parameters['direction']
+        self._vertical = self.direction in ('vertical', 'both')
+        self._horizontal = self.direction in ('horizontal', 'both')
+        # Horizontal oscillation amplitude and angular frequency per unit of
+        # progress (bounce_count * 2 oscillations per animation)
+        self._horizontal_amplitude = self.bounce_height * 0.3
+        self._horizontal_omega = self.bounce_count * 2.0 * 2 * math.pi
+        
+        # Bounce segment table for the configured physics, and the segment
+        # found by the previous lookup since playback time mostly advances
+        self._bounce_key = (self.bounce_height, self.gravity, self.damping, self.bounce_count)
+        self._bounce_segments = _bounce_segments(*self._bounce_key)
+        self._last_segment = 0
     
     def calculate_properties(self, progress: float, text_element: TextElement) -> Dict[str, Any]:
         """Calculate bounce animation properties."""
-        bounce_height = self.config.parameters.get('bounce_height', 50.0)
-        gravity = self.config.parameters.get('gravity', 980.0)
-        damping = self.config.parameters.get('damping', 0.8)
-        bounce_count = self.config.parameters.get('bounce_count', 3)
-        direction = self.config.parameters.get('direction', 'vertical')
+        offset_x, offset_y, bounce_y = self._calculate_offsets(progress)
         
+        # Apply offset to current position
+        new_position = (
+            text_element.position[0] + offset_x,
+            text_element.position[1] + offset_y
+        )
+        
+        return {
+            'position': new_position,
+            'offset_x': offset_x,
+            'offset_y': offset_y,
+            'bounce_height': bounce_y
+        }
+    
+    def shader_uniforms(self, progress: float) -> Optional[Dict[str, Any]]:
+        """Get the text shader offset uniform for given progress."""
+        offset_x, offset_y, _ = self._calculate_offsets(progress)
+        return {'slideOffset': (offset_x, offset_y)}
+    
+    def _calculate_offsets(self, progress: float) -> Tuple[float, float, float]:
+        """Calculate the (offset_x, offset_y, bounce height) at given progress."""
         # Calculate bounce physics
         time = progress * self.config.duration
         
         # Calculate bounce position using physics simulation
         bounce_y = self._calculate_bounce_position(
-            time, bounce_height, gravity, damping, bounce_count
+            time, self.bounce_height, self.gravity, self.damping, self.bounce_count
         )
         
         # Apply direction
         offset_x = 0.0
         offset_y = 0.0
         
-        if direction in ['vertical', 'both']:
+        if self._vertical:
             offset_y = -bounce_y  # Negative for upward bounce
         
-        if direction in ['horizontal', 'both']:
-            # Add horizontal oscillation
-            horizontal_freq = bounce_count * 2.0  # Oscillations per animation
-            offset_x = bounce_height * 0.3 * math.sin(progress * horizontal_freq * 2 * math.pi)
-            offset_x *= (1.0 - progress)  # Dampen over time
+        if self._horizontal:
+            # Add horizontal oscillation, dampened over time
+            offset_x = (self._horizontal_amplitude * math.sin(progress * self._horizontal_omega)
+                        * (1.0 - progress))
         
-        # Apply offset to current position
-        new_position = (
-            text_element.position[0] + offset_x,
-            text_element.position[1] + offset_y
-        )
+        return offset_x, offset_y, bounce_y
+    
+    def calculate_properties_batch(self, progress: np.ndarray, positions: np.ndarray,
+                                   colors: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Calculate bounce animation properties for many elements.
+        
+        Args:
+            progress: Animation progress per element
+            positions: Element positions, shape (N, 2)
+            colors: Element RGBA colors, shape (N, 4)
+            
+        Returns:
+            Dictionary of per-element property arrays
+        """
+        ends, heights, durations = self._bounce_segments
+        if ends:
+            bounce_y = _bounce_heights(
+                progress * self.config.duration, np.array(ends), np.array(heights),
+                np.array(durations), self.gravity
+            )
+        else:
+            bounce_y = np.zeros(len(progress), dtype=np.float64)
+        
+        offset_x = np.zeros(len(progress), dtype=np.float64)
+        offset_y = np.zeros(len(progress), dtype=np.float64)
         
+        if self._vertical:
+            offset_y = -bounce_y  # Negative for upward bounce
+        
+        if self._horizontal:
+            offset_x = self._horizontal_amplitude * np.sin(progress * self._horizontal_omega)
+            offset_x *= (1.0 - progress)  # Dampen over time
+        
+        new_positions = positions.copy()
+        new_positions[:, 0] += offset_x
+        new_positions[:, 1] += offset_y
         return {
-            'position': new_position,
+            'position': new_positions,
             'offset_x': offset_x,
             'offset_y': offset_y,
             'bounce_height': bounce_y
@@ -389,40 +846,35 @@ class BounceEffect(BaseAnimationEffect):
         if time <= 0:
             return 0.0
         
-        # Calculate time for one complete bounce cycle
-        bounce_time = math.sqrt(2 * height / gravity) * 2  # Time for up and down
-        
-        # Determine which bounce we're in
-        total_time = 0.0
-        current_height = height
-        
-        for bounce in range(bounce_count + 1):
-            if time <= total_time + bounce_time:
-                # We're in this bounce
-                local_time = time - total_time
-                
-                # Calculate position within this bounce
-                if local_time <= bounce_time / 2:
-                    # Going up
-                    t = local_time
-                    pos = current_height * t / (bounce_time / 2) - 0.5 * gravity * t * t
-                else:
-                    # Coming down
-                    t = local_time - bounce_time / 2
-                    max_pos = current_height
-                    pos = max_pos - 0.5 * gravity * t * t
-                
-                return max(0.0, pos)
-            
-            # Move to next bounce
-            total_time += bounce_time
-            current_height *= damping
-            bounce_time = math.sqrt(2 * current_height / gravity) * 2
-            
-            if current_height < 0.1:  # Stop bouncing when too small
-                break
+        if (height, gravity, damping, bounce_count) == self._bounce_key:
+            ends, heights, durations = self._bounce_segments
+        else:
+            ends, heights, durations = _bounce_segments(height, gravity, damping, bounce_count)
+        
+        # Find the first bounce ending at or after time, trying the last hit first
+        segment = self._last_segment
+        if not (segment < len(ends) and time <= ends[segment]
+                and (segment == 0 or time > ends[segment - 1])):
+            segment = bisect.bisect_left(ends, time)
+            if segment == len(ends):
+                return 0.0
+            self._last_segment = segment
         
-        return 0.0
+        current_height = heights[segment]
+        half_time = durations[segment] / 2
+        local_time = time - (ends[segment] - durations[segment])
+        
+        # Calculate position within this bounce
+        if local_time <= half_time:
+            # Going up
+            t = local_time
+            pos = current_height * t / half_time - 0.5 * gravity * t * t
+        else:
+            # Coming down
+            t = local_time - half_time
+            pos = current_height - 0.5 * gravity * t * t
+        
+        return max(0.0, pos)
 
 
 class AnimationEffectProcessor:
@@ -435,7 +887,7 @@ class AnimationEffectProcessor:
     
     def __init__(self):
         """Initialize animation effect processor."""
-        self.keyframe_system = KeyframeSystem()
+        self.keyframe_system = _SHARED_KEYFRAME_SYSTEM
         self._effect_factories = {
             AnimationType.FADE_IN: lambda config: FadeEffect(config),
             AnimationType.FADE_OUT: lambda config: FadeEffect(config),
@@ -446,6 +898,14 @@ class AnimationEffectProcessor:
             AnimationType.TYPEWRITER: lambda config: TypewriterEffect(config),
             AnimationType.BOUNCE: lambda config: BounceEffect(config)
         }
+        # Effect instances keyed by id() of their configuration
+        self._effect_cache: Dict[int, BaseAnimationEffect] = {}
+        # Rejected configurations already reported, so the render loop logs
+        # each problem once
+        self._reported_errors: set = set()
+        # Sorted keyframes, their times and the last segment index, keyed by
+        # id() of the source keyframe list
+        self._sorted_cache: Dict[int, Tuple[List[Keyframe], List[Keyframe], List[float], int]] = {}
     
     def create_effect(self, effect_config: AnimationEffect) -> BaseAnimationEffect:
         """
@@ -458,13 +918,68 @@ class AnimationEffectProcessor:
             Animation effect instance
             
         Raises:
-            ValueError: If effect type is not supported
+            ValueError: If effect type is not supported or the configuration
+                is invalid
         """
         factory = self._effect_factories.get(effect_config.type)
         if not factory:
             raise ValueError(f"Unsupported animation type: {effect_config.type}")
         
-        return factory(effect_config)
+        duration = effect_config.duration
+        if not isinstance(duration, (int, float)) or not math.isfinite(duration) or duration < 0:
+            raise ValueError(f"Invalid duration for {effect_config.type}: {duration!r}")
+        if not isinstance(effect_config.parameters, dict):
+            raise ValueError(f"Invalid parameters for {effect_config.type}: expected a dictionary")
+        
+        # Effects resolve their parameters on construction, so malformed
+        # values fail here rather than on every frame
+        try:
+            return factory(effect_config)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid parameters for {effect_config.type}: {e}") from e
+    
+    def get_effect(self, effect_config: AnimationEffect) -> BaseAnimationEffect:
+        """
+        Get the cached effect instance for a configuration, creating it on first use.
+        
+        Configurations are treated as immutable once applied; use
+        update_effect_parameters to derive a changed configuration.
+        
+        Args:
+            effect_config: Animation effect configuration
+            
+        Returns:
+            Animation effect instance
+            
+        Raises:
+            ValueError: If effect type is not supported
+        """
+        effect = self._effect_cache.get(id(effect_config))
+        if effect is None:
+            effect = self.create_effect(effect_config)
+            if len(self._effect_cache) >= _EFFECT_CACHE_LIMIT:
+                self._effect_cache.clear()
+            # The effect keeps its configuration alive, so the id stays unique
+            self._effect_cache[id(effect_config)] = effect
+        return effect
+    
+    def _resolve_effects(self, effects: List[AnimationEffect]) -> List[BaseAnimationEffect]:
+        """Get effect instances for configurations, skipping invalid ones."""
+        resolved = []
+        for effect_config in effects:
+            try:
+                resolved.append(self.get_effect(effect_config))
+            except ValueError as e:
+                message = str(e)
+                if message not in self._reported_errors:
+                    self._reported_errors.add(message)
+                    logger.warning("Skipping animation effect %s: %s", effect_config.type, message)
+        return resolved
+    
+    def clear_effect_cache(self) -> None:
+        """Drop all cached effect instances and sorted keyframe lists."""
+        self._effect_cache.clear()
+        self._sorted_cache.clear()
     
     def apply_animation_effects(self, text_element: TextElement, effects: List[AnimationEffect],
                               current_time: float, start_time: float) -> Dict[str, Any]:
@@ -480,29 +995,234 @@ class AnimationEffectProcessor:
         Returns:
             Dictionary of combined animated properties
         """
-        if not effects:
+        # Effects share the start time, and none applies before it
+        if not effects or current_time < start_time:
             return {}
         
+        resolved = self._resolve_effects(effects)
+        
+        # Fade + slide is the common karaoke line animation
+        if len(resolved) == 2:
+            first, second = resolved
+            if first.config.type in _FADE_TYPES and second.config.type in _SLIDE_TYPES:
+                return self._apply_fade_slide(text_element, first, second, current_time, start_time)
+            if first.config.type in _SLIDE_TYPES and second.config.type in _FADE_TYPES:
+                return self._apply_fade_slide(text_element, second, first, current_time, start_time)
+        
         combined_properties = {}
         
-        for effect_config in effects:
-            try:
-                effect = self.create_effect(effect_config)
-                state = effect.get_animation_state(current_time, start_time)
-                
-                if state.is_active or state.progress > 0:
-                    properties = effect.calculate_properties(state.progress, text_element)
-                    
-                    # Combine properties (later effects override earlier ones)
-                    combined_properties.update(properties)
-                    
-            except Exception as e:
-                # Log error but continue with other effects
-                print(f"Error applying animation effect {effect_config.type}: {e}")
-                continue
+        for effect in resolved:
+            # Combine properties (later effects override earlier ones); the
+            # timing window is checked directly, without an AnimationState
+            if current_time >= start_time + effect.config.duration:
+                combined_properties.update(effect.final_properties(text_element))
+            else:
+                progress = effect.get_progress(current_time, start_time)
+                combined_properties.update(effect.calculate_properties(progress, text_element))
         
         return combined_properties
     
+    def to_shader_uniforms(self, effect_config: AnimationEffect,
+                           progress: float) -> Optional[Dict[str, Any]]:
+        """
+        Get text shader uniforms applying an effect at given progress.
+        
+        Args:
+            effect_config: Animation effect configuration
+            progress: Eased animation progress (0.0 to 1.0)
+            
+        Returns:
+            Dictionary of uniform values for TextRenderer.render_text, or None
+            if the effect has to be evaluated on the CPU
+            
+        Raises:
+            ValueError: If the configuration is invalid
+        """
+        return self.get_effect(effect_config).shader_uniforms(progress)
+    
+    def apply_fused(self, text_element: TextElement, fade_config: AnimationEffect,
+                    slide_config: AnimationEffect, current_time: float,
+                    start_time: float) -> Dict[str, Any]:
+        """
+        Apply a fade and a slide effect in one pass.
+        
+        Produces the same properties as apply_animation_effects with both
+        effects, building a single result dictionary.
+        
+        Args:
+            text_element: Text element to animate
+            fade_config: Fade effect configuration
+            slide_config: Slide effect configuration
+            current_time: Current timeline time
+            start_time: Animation start time
+            
+        Returns:
+            Dictionary of combined animated properties
+            
+        Raises:
+            ValueError: If either configuration is invalid
+        """
+        return self._apply_fade_slide(text_element, self.get_effect(fade_config),
+                                      self.get_effect(slide_config), current_time, start_time)
+    
+    def _apply_fade_slide(self, text_element: TextElement, fade: FadeEffect,
+                          slide: SlideEffect, current_time: float,
+                          start_time: float) -> Dict[str, Any]:
+        """Combine fade and slide effect instances in one pass."""
+        # Both effects apply once their shared start time is reached
+        if current_time < start_time:
+            return {}
+        
+        alpha = fade.calculate_alpha(fade.get_progress(current_time, start_time))
+        slide_progress = slide.get_progress(current_time, start_time)
+        offset_x = slide._base_x + slide._rate_x * slide_progress
+        offset_y = slide._base_y + slide._rate_y * slide_progress
+        
+        red, green, blue, _ = text_element.color
+        x, y = text_element.position
+        return {
+            'color': (red, green, blue, alpha),
+            'alpha': alpha,
+            'position': (x + offset_x, y + offset_y),
+            'offset_x': offset_x,
+            'offset_y': offset_y
+        }
+    
+    def group_for_batching(self, text_elements: List[TextElement],
+                           effects: List[List[AnimationEffect]]) -> Dict[Optional[Tuple], List[int]]:
+        """
+        Group text elements that share the same animation effects.
+        
+        Each group can be drawn in one call, with the per-element animation
+        data from batch_instance_data. Elements with an effect that cannot
+        be evaluated on the GPU (such as the typewriter reveal) are
+        collected under the None key and need per-element rendering.
+        
+        Args:
+            text_elements: Text elements to group
+            effects: Animation effects of each element
+            
+        Returns:
+            Element indices keyed by effect group
+        """
+        groups: Dict[Optional[Tuple], List[int]] = {}
+        config_keys: Dict[int, Optional[Tuple]] = {}
+        
+        for index, element_effects in enumerate(effects[:len(text_elements)]):
+            key_parts = []
+            for effect in self._resolve_effects(element_effects):
+                config_key = config_keys.get(id(effect.config))
+                if config_key is None:
+                    if getattr(effect, 'calculate_properties_batch', None) is None:
+                        key_parts = None
+                        break
+                    config_key = _effect_config_key(effect.config)
+                    config_keys[id(effect.config)] = config_key
+                key_parts.append(config_key)
+            
+            key = tuple(key_parts) if key_parts is not None else None
+            groups.setdefault(key, []).append(index)
+        
+        return groups
+    
+    def batch_instance_data(self, effects: List[AnimationEffect], current_time: float,
+                            start_times: Union[List[float], np.ndarray]) -> np.ndarray:
+        """
+        Evaluate a group's effects as per-element animation data.
+        
+        Rows are (offset_x, offset_y, progress, alpha) for the text shader's
+        animation attribute, where progress is that of the last started
+        effect. Alpha is last so the attribute default (0, 0, 0, 1) means
+        no animation.
+        
+        Args:
+            effects: Animation effects shared by the group
+            current_time: Current timeline time
+            start_times: Animation start time of each element
+            
+        Returns:
+            Float32 array of shape (N, 4)
+            
+        Raises:
+            ValueError: If an effect cannot be evaluated on the GPU
+        """
+        starts = np.asarray(start_times, dtype=np.float64).reshape(-1)
+        data = np.zeros((len(starts), 4), dtype=np.float32)
+        data[:, 3] = 1.0
+        
+        for effect in self._resolve_effects(effects):
+            calculate_batch = getattr(effect, 'calculate_properties_batch', None)
+            if calculate_batch is None:
+                raise ValueError(f"Animation effect {effect.config.type} cannot be evaluated on the GPU")
+            
+            started, progress = effect.get_progress_batch(current_time, starts)
+            if len(started) == 0:
+                continue
+            
+            # Offsets and alpha do not depend on element position or color
+            properties = calculate_batch(progress, np.zeros((len(started), 2)),
+                                         np.ones((len(started), 4)))
+            if 'offset_x' in properties:
+                data[started, 0] = properties['offset_x']
+                data[started, 1] = properties['offset_y']
+            if 'alpha' in properties:
+                data[started, 3] = properties['alpha']
+            data[started, 2] = progress
+        
+        return data
+    
+    def apply_animation_effects_batch(self, text_elements: List[TextElement],
+                                      effects: List[AnimationEffect], current_time: float,
+                                      start_times: Union[float, List[float], np.ndarray]
+                                      ) -> List[Dict[str, Any]]:
+        """
+        Apply the same animation effects to many text elements at once.
+        
+        Element positions and colors are gathered into arrays, and effects
+        that provide calculate_properties_batch are evaluated for all
+        elements in one vectorized pass; other effects fall back to
+        per-element evaluation. Results match apply_animation_effects.
+        
+        Args:
+            text_elements: Text elements to animate
+            effects: Animation effects applied to every element
+            current_time: Current timeline time
+            start_times: Animation start time, shared or one per element
+            
+        Returns:
+            Combined animated properties for each element
+        """
+        count = len(text_elements)
+        results: List[Dict[str, Any]] = [{} for _ in range(count)]
+        if not effects or count == 0:
+            return results
+        
+        starts = np.broadcast_to(np.asarray(start_times, dtype=np.float64), (count,))
+        positions = np.array([element.position for element in text_elements], dtype=np.float64)
+        colors = np.array([element.color for element in text_elements], dtype=np.float64)
+        
+        for effect in self._resolve_effects(effects):
+            started, progress = effect.get_progress_batch(current_time, starts)
+            if len(started) == 0:
+                continue
+            
+            calculate_batch = getattr(effect, 'calculate_properties_batch', None)
+            if calculate_batch is None:
+                for row, element_progress in zip(started.tolist(), progress.tolist()):
+                    results[row].update(effect.calculate_properties(element_progress, text_elements[row]))
+                continue
+            
+            properties = calculate_batch(progress, positions[started], colors[started])
+            rows = started.tolist()
+            for key, values in properties.items():
+                values = values.tolist()
+                if isinstance(values[0], list):
+                    values = [tuple(value) for value in values]
+                for row, value in zip(rows, values):
+                    results[row][key] = value
+        
+        return results
+    
     def interpolate_keyframe_animations(self, keyframes: List[Keyframe], current_time: float,
                                      text_element: TextElement) -> Dict[str, Any]:
         """
@@ -519,19 +1239,30 @@ class AnimationEffectProcessor:
         if not keyframes:
             return {}
         
-        # Sort keyframes by time
-        sorted_keyframes = self.keyframe_system.sort_keyframes(keyframes)
+        # Sort keyframes once per list; the entry holds the source list so
+        # its id stays unique, and a length change marks it stale
+        key = id(keyframes)
+        cached = self._sorted_cache.get(key)
+        stale = cached is None or cached[0] is not keyframes or len(cached[1]) != len(keyframes)
+        if stale:
+            if len(self._sorted_cache) >= _EFFECT_CACHE_LIMIT:
+                self._sorted_cache.clear()
+            sorted_keyframes = self.keyframe_system.sort_keyframes(keyframes)
+            cached = (keyframes, sorted_keyframes, [kf.time for kf in sorted_keyframes], 0)
+        _, sorted_keyframes, times, last_index = cached
+        index = last_index
         
-        # Find surrounding keyframes
-        before_kf = None
-        after_kf = None
+        # Find surrounding keyframes; monotonic playback usually stays in the
+        # segment found by the previous call
+        count = len(times)
+        if not ((index == 0 or times[index - 1] <= current_time) and
+                (index == count or current_time < times[index])):
+            index = bisect.bisect_right(times, current_time)
+        if stale or index != last_index:
+            self._sorted_cache[key] = (keyframes, sorted_keyframes, times, index)
         
-        for kf in sorted_keyframes:
-            if kf.time <= current_time:
-                before_kf = kf
-            elif kf.time > current_time and after_kf is None:
-                after_kf = kf
-                break
+        before_kf = sorted_keyframes[index - 1] if index > 0 else None
+        after_kf = sorted_keyframes[index] if index < count else None
         
         # Handle edge cases
         if before_kf is None and after_kf is None:
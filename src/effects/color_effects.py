@@ -11,18 +11,285 @@ All effects support real-time parameter adjustment and can be synchronized
 to audio BPM for music-responsive animations.
 """
 
+import logging
 import math
 import colorsys
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 from dataclasses import dataclass
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Scalar kernels run as plain Python without numba
+    njit = None
+
 from ..core.models import ColorEffect, TextElement
 
+logger = logging.getLogger(__name__)
+
+# Number of samples in the blackbody temperature lookup table
+_TEMPERATURE_LUT_SIZE = 512
+
+# Upper bound on cached effect instances before the cache is reset
+_EFFECT_CACHE_LIMIT = 512
+
+# Effect kinds understood by the text shader's colorEffectType uniform
+COLOR_SHADER_NONE = 0
+COLOR_SHADER_RAINBOW = 1
+COLOR_SHADER_BLEND = 2
+COLOR_SHADER_TEMPERATURE = 3
+
+# RGBA color as a tuple, or an array of shape (4,) or (N, 4)
+ColorValue = Union[Tuple[float, float, float, float], np.ndarray]
+
+# Signature of a compiled effect stack: (current_time, base_color) -> color
+ColorStackFn = Callable[[float, Tuple[float, float, float, float]], Tuple[float, float, float, float]]
+
+_TWO_PI = 2.0 * math.pi
+_HALF_PI = 0.5 * math.pi
+
+
+def _linear_curve(t: float) -> float:
+    """Linear curve, also the fallback for unknown curve names."""
+    return t
+
+
+def _transition_sine(t: float) -> float:
+    return (math.sin(t * _TWO_PI - _HALF_PI) + 1.0) * 0.5
+
+
+def _transition_ease_in_out(t: float) -> float:
+    return 0.5 * (1.0 + math.sin((t - 0.5) * math.pi))
+
+
+def _srgb_to_linear(c: float) -> float:
+    """Decode one sRGB channel value to linear light."""
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def _linear_to_srgb(c: float) -> float:
+    """Encode one linear-light channel value as sRGB."""
+    return c * 12.92 if c <= 0.0031308 else 1.055 * c ** (1.0 / 2.4) - 0.055
+
+
+# sRGB transfer curves sampled on a uniform grid over [0, 1]; arrays are
+# converted by linear interpolation between samples
+_SRGB_LUT_SIZE = 1024
+_SRGB_LUT_GRID = np.linspace(0.0, 1.0, _SRGB_LUT_SIZE)
+_SRGB_TO_LINEAR_LUT = np.array([_srgb_to_linear(c) for c in _SRGB_LUT_GRID.tolist()],
+                               dtype=np.float32)
+_LINEAR_TO_SRGB_LUT = np.array([_linear_to_srgb(c) for c in _SRGB_LUT_GRID.tolist()],
+                               dtype=np.float32)
+
+
+def _hash_unit(value: int) -> float:
+    """
+    Hash an integer to a uniformly distributed float in [0.0, 1.0].
+    
+    Stateless replacement for seeding a random generator per call.
+    """
+    x = value & 0xFFFFFFFF
+    x ^= x >> 16
+    x = (x * 0x7FEB352D) & 0xFFFFFFFF
+    x ^= x >> 15
+    x = (x * 0x846CA68B) & 0xFFFFFFFF
+    x ^= x >> 16
+    return x / 0xFFFFFFFF
+
+
+def _rainbow_target(hue_cycle: float, intensity: float, r: float, g: float,
+                    b: float) -> Tuple[float, float, float]:
+    """Hue-rotated RGB for one color, with colorsys HSV conversions inlined."""
+    # RGB to HSV; at full intensity the base hue is discarded, so only
+    # saturation and value are derived
+    maxc = max(r, g, b)
+    minc = min(r, g, b)
+    if minc == maxc:
+        base_h = 0.0
+        base_s = 0.0
+    elif intensity >= 1.0:
+        base_h = 0.0
+        base_s = (maxc - minc) / maxc
+    else:
+        rangec = maxc - minc
+        base_s = rangec / maxc
+        rc = (maxc - r) / rangec
+        gc = (maxc - g) / rangec
+        bc = (maxc - b) / rangec
+        if r == maxc:
+            base_h = bc - gc
+        elif g == maxc:
+            base_h = 2.0 + rc - bc
+        else:
+            base_h = 4.0 + gc - rc
+        base_h = (base_h / 6.0) % 1.0
+    
+    # For rainbow effect, ensure minimum saturation and brightness
+    s = max(base_s, 0.8)
+    v = max(maxc, 0.5)
+    if intensity < 1.0:
+        h = base_h + (hue_cycle - base_h) * intensity
+    else:
+        h = hue_cycle
+    
+    # HSV to RGB
+    sector = int(h * 6.0)
+    f = (h * 6.0) - sector
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    sector = sector % 6
+    if sector == 0:
+        new_r, new_g, new_b = v, t, p
+    elif sector == 1:
+        new_r, new_g, new_b = q, v, p
+    elif sector == 2:
+        new_r, new_g, new_b = p, v, t
+    elif sector == 3:
+        new_r, new_g, new_b = p, q, v
+    elif sector == 4:
+        new_r, new_g, new_b = t, p, v
+    else:
+        new_r, new_g, new_b = v, p, q
+    return (new_r, new_g, new_b)
+
+
+def _rainbow_kernel(hue_cycle: float, intensity: float, r: float, g: float,
+                    b: float, a: float) -> Tuple[float, float, float, float]:
+    """Rainbow color for one RGBA color, blended with it by intensity."""
+    new_r, new_g, new_b = _rainbow_target(hue_cycle, intensity, r, g, b)
+    if intensity < 1.0:
+        return (r + (new_r - r) * intensity, g + (new_g - g) * intensity,
+                b + (new_b - b) * intensity, a)
+    return (new_r, new_g, new_b, a)
+
+
+def _pulse_curve(pulse_time: float, curve_id: int) -> float:
+    """Pulse curve value for a cycle position; curve_id comes from _PULSE_CURVE_IDS."""
+    if curve_id == 0:
+        return (math.sin(pulse_time * _TWO_PI) + 1.0) * 0.5
+    elif curve_id == 1:
+        return 1.0 - abs(pulse_time * 2.0 - 1.0)
+    elif curve_id == 2:
+        return 1.0 if pulse_time < 0.5 else 0.0
+    return pulse_time  # Linear fallback
+
+
+def _pulse_kernel(pulse_time: float, curve_id: int, intensity: float,
+                  r: float, g: float, b: float, a: float,
+                  pulse_r: float, pulse_g: float, pulse_b: float, pulse_a: float
+                  ) -> Tuple[float, float, float, float]:
+    """Pulse color for one RGBA color."""
+    factor = _pulse_curve(pulse_time, curve_id) * intensity
+    return (r + (pulse_r - r) * factor, g + (pulse_g - g) * factor,
+            b + (pulse_b - b) * factor, a + (pulse_a - a) * factor)
+
+
+def _temperature_kernel(intensity: float, r: float, g: float, b: float, a: float,
+                        red: float, green: float, blue: float
+                        ) -> Tuple[float, float, float, float]:
+    """Temperature shifted color for one RGBA color and RGB multiplier."""
+    return (r + (r * red - r) * intensity, g + (g * green - g) * intensity,
+            b + (b * blue - b) * intensity, a)
+
+
+if njit is not None:
+    _rainbow_target = njit(cache=True, fastmath=True)(_rainbow_target)
+    _rainbow_kernel = njit(cache=True, fastmath=True)(_rainbow_kernel)
+    _pulse_curve = njit(cache=True, fastmath=True)(_pulse_curve)
+    _pulse_kernel = njit(cache=True, fastmath=True)(_pulse_kernel)
+    _temperature_kernel = njit(cache=True, fastmath=True)(_temperature_kernel)
+
+
+# Pulse curve names to _pulse_kernel curve ids; unknown names are linear
+_PULSE_CURVE_IDS = {'sine': 0, 'triangle': 1, 'square': 2}
+
+# Curve shapes by name, mapping cycle position (0.0 to 1.0) to a blend factor
+_TRANSITION_CURVES = {
+    'sine': _transition_sine,
+    'ease_in_out': _transition_ease_in_out,
+}
+
+
+def _hsv_to_rgb_np(h: np.ndarray, s: np.ndarray, v: np.ndarray
+                   ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert HSV arrays to RGB arrays, matching colorsys.hsv_to_rgb.
+    
+    The hue sector selects one of six candidate values per channel by
+    indexing rather than branching.
+    """
+    dtype = np.result_type(h, s, v, np.float32)
+    h, s, v = np.broadcast_arrays(np.asarray(h, dtype=dtype),
+                                  np.asarray(s, dtype=dtype),
+                                  np.asarray(v, dtype=dtype))
+    sector = np.trunc(h * 6.0)
+    f = h * 6.0 - sector
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    index = (sector.astype(np.int64) % 6)[..., None]
+    
+    def pick(*candidates):
+        return np.take_along_axis(np.stack(candidates, axis=-1), index, axis=-1)[..., 0]
+    
+    return pick(v, q, p, p, t, v), pick(t, v, v, q, p, p), pick(p, p, t, v, v, q)
+
+
+def _rgb_to_hsv_np(r: np.ndarray, g: np.ndarray, b: np.ndarray
+                   ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert RGB arrays to HSV arrays, matching colorsys.rgb_to_hsv.
+    
+    The hue formula is chosen per element by the index of the largest
+    channel (red, then green, then blue on ties).
+    """
+    dtype = np.result_type(r, g, b, np.float32)
+    rgb = np.stack(np.broadcast_arrays(np.asarray(r, dtype=dtype),
+                                       np.asarray(g, dtype=dtype),
+                                       np.asarray(b, dtype=dtype)), axis=-1)
+    maxc = rgb.max(axis=-1)
+    minc = rgb.min(axis=-1)
+    delta = maxc - minc
+    chromatic = delta > 0.0
+    
+    s = np.divide(delta, maxc, out=np.zeros_like(maxc), where=chromatic)
+    scaled = np.divide(maxc[..., None] - rgb, delta[..., None],
+                       out=np.zeros_like(rgb), where=chromatic[..., None])
+    rc, gc, bc = scaled[..., 0], scaled[..., 1], scaled[..., 2]
+    candidates = np.stack((bc - gc, 2.0 + rc - bc, 4.0 + gc - rc), axis=-1)
+    h = np.take_along_axis(candidates, rgb.argmax(axis=-1)[..., None], axis=-1)[..., 0]
+    h = np.where(chromatic, (h / 6.0) % 1.0, 0.0)
+    return h, s, maxc
+
+
+def _blackbody_multipliers_np(temperatures: np.ndarray) -> np.ndarray:
+    """Vectorized ColorTemperatureEffect._blackbody_multiplier, one RGB row per temperature."""
+    temp = np.asarray(temperatures, dtype=np.float64) / 100.0
+    # Clamp the power and log arguments; np.where evaluates both branches
+    warm = np.maximum(temp - 60.0, 1e-9)
+    red = np.where(temp <= 66, 1.0,
+                   np.clip(329.698727446 * np.power(warm, -0.1332047592) / 255.0, 0.0, 1.0))
+    green = np.where(temp <= 66,
+                     99.4708025861 * np.log(np.maximum(temp, 1e-9)) - 161.1195681661,
+                     288.1221695283 * np.power(warm, -0.0755148492))
+    green = np.clip(green / 255.0, 0.0, 1.0)
+    blue = np.where(temp >= 66, 1.0, np.where(
+        temp <= 19, 0.0,
+        np.clip((138.5177312231 * np.log(np.maximum(temp - 10.0, 1e-9)) - 305.0447927307) / 255.0,
+                0.0, 1.0)))
+    return np.stack([red, green, blue], axis=-1)
+
 
 @dataclass
 class ColorState:
     """Current state of a color effect."""
+    # Declared by hand since dataclass(slots=True) needs Python 3.10
+    __slots__ = ('current_color', 'is_active', 'progress', 'cycle_count', 'parameters')
+    
     current_color: Tuple[float, float, float, float]  # RGBA
     is_active: bool
     progress: float  # 0.0 to 1.0
@@ -38,6 +305,10 @@ class BaseColorEffect(ABC):
     and BPM synchronization.
     """
     
+    __slots__ = ('config', '_start_time', '_last_bpm_beat', '_beat_count', 'linear_light',
+                 '_inv_cycle_duration', '_cycle_duration', '_bpm_synced',
+                 '_beats_per_second', '_phase_scale', '_timing_key')
+    
     def __init__(self, effect_config: ColorEffect):
         """
         Initialize base color effect.
@@ -49,6 +320,31 @@ class BaseColorEffect(ABC):
         self._start_time: Optional[float] = None
         self._last_bpm_beat: float = 0.0
         self._beat_count: int = 0
+        # Blend colors in linear light instead of sRGB; off by default to
+        # keep the established look of existing projects
+        self.linear_light = False
+        self._refresh_timing()
+    
+    def _refresh_timing(self) -> None:
+        """
+        Recompute timing constants derived from the configuration.
+        
+        Called on construction and by update_parameters; the processor calls
+        sync_timing for configurations edited directly.
+        """
+        self._timing_key = (self.config.speed, self.config.bpm_sync, self.config.bpm)
+        # Speed is floored to avoid division by zero
+        self._inv_cycle_duration = max(0.001, self.config.speed)
+        self._cycle_duration = 1.0 / self._inv_cycle_duration
+        self._bpm_synced = bool(self.config.bpm_sync and self.config.bpm)
+        self._beats_per_second = self.config.bpm / 60.0 if self.config.bpm else 0.0
+        self._phase_scale = self.config.speed * (self._beats_per_second if self._bpm_synced else 1.0)
+    
+    def sync_timing(self) -> None:
+        """Recompute timing constants if the configuration's timing fields were edited."""
+        config = self.config
+        if self._timing_key != (config.speed, config.bpm_sync, config.bpm):
+            self._refresh_timing()
     
     @abstractmethod
     def calculate_color(self, current_time: float, base_color: Tuple[float, float, float, float]) -> Tuple[float, float, float, float]:
@@ -64,27 +360,74 @@ class BaseColorEffect(ABC):
         """
         pass
     
-    def get_color_state(self, current_time: float, base_color: Tuple[float, float, float, float]) -> ColorState:
+    def calculate_color_batch(self, current_time: float, base_colors: np.ndarray) -> np.ndarray:
+        """
+        Calculate the current color for many base colors at once.
+        
+        The default implementation evaluates calculate_color per row;
+        concrete effects override it with a vectorized version.
+        
+        Args:
+            current_time: Current timeline time in seconds
+            base_colors: Base text colors, shape (N, 4)
+            
+        Returns:
+            Modified colors, shape (N, 4), with the dtype of base_colors
         """
-        Get current color effect state.
+        return np.array([self.calculate_color(current_time, tuple(color))
+                         for color in base_colors.tolist()],
+                        dtype=base_colors.dtype).reshape(-1, 4)
+    
+    def shader_uniforms(self, current_time: float) -> Optional[Dict[str, Any]]:
+        """
+        Get text shader uniforms that apply this effect on the GPU.
+        
+        The time-dependent part of the effect is evaluated once here; the
+        per-color part runs in the text shader, so text colors need not
+        be recomputed on the CPU.
+        
+        Args:
+            current_time: Current timeline time in seconds
+            
+        Returns:
+            Dictionary of uniform values, or None if the effect cannot be
+            expressed as shader uniforms and needs calculate_color
+        """
+        return None
+    
+    def get_color(self, current_time: float, base_color: Tuple[float, float, float, float]) -> Tuple[float, float, float, float]:
+        """
+        Get the current effect color without building a full state.
         
         Args:
             current_time: Current timeline time
             base_color: Base text color
             
         Returns:
-            Current color state
+            Modified color (RGBA)
         """
         if self._start_time is None:
             self._start_time = current_time
+        return self.calculate_color(current_time, base_color)
+    
+    def get_color_state(self, current_time: float, base_color: Tuple[float, float, float, float]) -> ColorState:
+        """
+        Get current color effect state, including cycle progress for the editor.
         
+        Args:
+            current_time: Current timeline time
+            base_color: Base text color
+            
+        Returns:
+            Current color state
+        """
+        current_color = self.get_color(current_time, base_color)
         elapsed_time = current_time - self._start_time
-        current_color = self.calculate_color(current_time, base_color)
         
         # Calculate progress based on effect speed
-        cycle_duration = 1.0 / max(0.001, self.config.speed)  # Avoid division by zero
-        progress = (elapsed_time % cycle_duration) / cycle_duration
-        cycle_count = int(elapsed_time / cycle_duration)
+        cycles = elapsed_time * self._inv_cycle_duration
+        progress = cycles % 1.0
+        cycle_count = int(cycles)
         
         return ColorState(
             current_color=current_color,
@@ -94,6 +437,11 @@ class BaseColorEffect(ABC):
             parameters={}
         )
     
+    def _phase(self, current_time: float) -> float:
+        """Get the position within the current effect cycle (0.0 to 1.0)."""
+        # Speed and BPM synchronization are folded into one scale
+        return (current_time * self._phase_scale) % 1.0
+    
     def _get_bpm_time(self, current_time: float) -> float:
         """
         Get BPM-synchronized time if BPM sync is enabled.
@@ -104,14 +452,11 @@ class BaseColorEffect(ABC):
         Returns:
             BPM-synchronized time or regular time
         """
-        if not self.config.bpm_sync or not self.config.bpm:
+        if not self._bpm_synced:
             return current_time
         
-        # Calculate beats per second
-        beats_per_second = self.config.bpm / 60.0
-        
         # Calculate current beat
-        current_beat = current_time * beats_per_second
+        current_beat = current_time * self._beats_per_second
         
         # Synchronize to beat boundaries
         beat_progress = current_beat % 1.0
@@ -146,12 +491,16 @@ class BaseColorEffect(ABC):
         """
         return colorsys.rgb_to_hsv(r, g, b)
     
-    def _interpolate_color(self, color1: Tuple[float, float, float, float], 
-                          color2: Tuple[float, float, float, float], 
-                          t: float) -> Tuple[float, float, float, float]:
+    def _interpolate_color(self, color1: ColorValue, color2: ColorValue,
+                          t: float) -> ColorValue:
         """
         Interpolate between two RGBA colors.
         
+        Colors are tuples or arrays of shape (4,) or (N, 4). If either
+        color is an array the result is an array, broadcast across rows.
+        With linear_light enabled the RGB channels are blended in linear
+        light and re-encoded as sRGB; alpha is always blended directly.
+        
         Args:
             color1: First color (RGBA)
             color2: Second color (RGBA)
@@ -160,6 +509,11 @@ class BaseColorEffect(ABC):
         Returns:
             Interpolated color (RGBA)
         """
+        if self.linear_light:
+            return self._interpolate_linear(color1, color2, t)
+        if isinstance(color1, np.ndarray) or isinstance(color2, np.ndarray):
+            color1 = np.asarray(color1)
+            return color1 + (np.asarray(color2) - color1) * t
         return (
             color1[0] + (color2[0] - color1[0]) * t,
             color1[1] + (color2[1] - color1[1]) * t,
@@ -167,6 +521,25 @@ class BaseColorEffect(ABC):
             color1[3] + (color2[3] - color1[3]) * t
         )
     
+    def _interpolate_linear(self, color1: ColorValue, color2: ColorValue,
+                            t: float) -> ColorValue:
+        """Interpolate RGB in linear light; arrays may have 3 or 4 channels."""
+        if isinstance(color1, np.ndarray) or isinstance(color2, np.ndarray):
+            color1 = np.asarray(color1)
+            color2 = np.asarray(color2)
+            dtype = np.result_type(color1, color2, np.float32)
+            start = np.interp(color1[..., :3], _SRGB_LUT_GRID, _SRGB_TO_LINEAR_LUT)
+            end = np.interp(color2[..., :3], _SRGB_LUT_GRID, _SRGB_TO_LINEAR_LUT)
+            rgb = np.interp(start + (end - start) * t, _SRGB_LUT_GRID, _LINEAR_TO_SRGB_LUT)
+            alpha = color1[..., 3:] + (color2[..., 3:] - color1[..., 3:]) * t
+            alpha = np.broadcast_to(alpha, rgb.shape[:-1] + alpha.shape[-1:])
+            return np.concatenate([rgb, alpha], axis=-1).astype(dtype, copy=False)
+        rgb = []
+        for c1, c2 in zip(color1[:3], color2[:3]):
+            start = _srgb_to_linear(c1)
+            rgb.append(_linear_to_srgb(start + (_srgb_to_linear(c2) - start) * t))
+        return (rgb[0], rgb[1], rgb[2], color1[3] + (color2[3] - color1[3]) * t)
+    
     def update_parameters(self, parameter_updates: Dict[str, Any]) -> None:
         """
         Update effect parameters in real-time.
@@ -186,6 +559,10 @@ class BaseColorEffect(ABC):
                     self.config.bpm = max(1.0, float(value))  # Minimum BPM
                 else:
                     self.config.bpm = None
+            elif key == 'linear_light':
+                self.linear_light = bool(value)
+        
+        self._refresh_timing()
 
 
 class RainbowEffect(BaseColorEffect):
@@ -196,44 +573,59 @@ class RainbowEffect(BaseColorEffect):
     saturation and brightness of the base color.
     """
     
+    __slots__ = ()
+    
     def __init__(self, effect_config: ColorEffect):
         """Initialize rainbow effect."""
         super().__init__(effect_config)
     
     def calculate_color(self, current_time: float, base_color: Tuple[float, float, float, float]) -> Tuple[float, float, float, float]:
         """Calculate rainbow color at current time."""
-        # Get BPM-synchronized time if enabled
-        sync_time = self._get_bpm_time(current_time) if self.config.bpm_sync else current_time
-        
-        # Convert base color to HSV to preserve saturation and brightness
-        base_hsv = self._rgb_to_hsv(base_color[0], base_color[1], base_color[2])
-        
-        # Calculate hue based on time and speed
-        hue_cycle = (sync_time * self.config.speed) % 1.0
-        
-        # For rainbow effect, ensure minimum saturation for visible color changes
-        saturation = max(base_hsv[1], 0.8)  # Use at least 80% saturation
-        brightness = max(base_hsv[2], 0.5)  # Use at least 50% brightness
-        
-        # Apply intensity to control how much the hue changes
-        if self.config.intensity < 1.0:
-            # Blend between original hue and rainbow hue
-            original_hue = base_hsv[0]
-            rainbow_hue = hue_cycle
-            final_hue = original_hue + (rainbow_hue - original_hue) * self.config.intensity
+        # Calculate hue based on time, speed and BPM
+        hue_cycle = self._phase(current_time)
+        
+        # Rotate the hue while keeping at least 80% saturation and 50%
+        # brightness, blending with the original color by intensity
+        r, g, b, a = base_color
+        intensity = self.config.intensity
+        if self.linear_light and intensity < 1.0:
+            new_r, new_g, new_b = _rainbow_target(hue_cycle, intensity, r, g, b)
+            return self._interpolate_color(base_color, (new_r, new_g, new_b, a), intensity)
+        return _rainbow_kernel(hue_cycle, intensity, r, g, b, a)
+    
+    def calculate_color_batch(self, current_time: float, base_colors: np.ndarray) -> np.ndarray:
+        """Calculate rainbow colors for many base colors at once."""
+        hue_cycle = self._phase(current_time)
+        intensity = self.config.intensity
+        
+        if intensity < 1.0:
+            base_hue, base_saturation, base_value = _rgb_to_hsv_np(
+                base_colors[:, 0], base_colors[:, 1], base_colors[:, 2])
+            final_hue = base_hue + (hue_cycle - base_hue) * intensity
         else:
+            # The base hue is discarded, so skip computing it
+            rgb = base_colors[:, :3]
+            base_value = rgb.max(axis=1)
+            delta = base_value - rgb.min(axis=1)
+            base_saturation = np.divide(delta, base_value, out=np.zeros_like(delta),
+                                        where=delta > 0.0)
             final_hue = hue_cycle
-        
-        # Convert back to RGB with enhanced saturation
-        rainbow_rgb = self._hsv_to_rgb(final_hue, saturation, brightness)
-        
-        # Blend with original color based on intensity
-        if self.config.intensity < 1.0:
-            return self._interpolate_color(base_color, 
-                                         (rainbow_rgb[0], rainbow_rgb[1], rainbow_rgb[2], base_color[3]), 
-                                         self.config.intensity)
-        else:
-            return (rainbow_rgb[0], rainbow_rgb[1], rainbow_rgb[2], base_color[3])
+        saturation = np.maximum(base_saturation, 0.8)
+        brightness = np.maximum(base_value, 0.5)
+        
+        result = base_colors.copy()
+        result[:, 0], result[:, 1], result[:, 2] = _hsv_to_rgb_np(final_hue, saturation, brightness)
+        if intensity < 1.0:
+            result[:, :3] = self._interpolate_color(base_colors[:, :3], result[:, :3], intensity)
+        return result
+    
+    def shader_uniforms(self, current_time: float) -> Optional[Dict[str, Any]]:
+        """Get text shader uniforms rotating the hue."""
+        return {
+            'colorEffectType': COLOR_SHADER_RAINBOW,
+            'colorEffectHue': float(self._phase(current_time)),
+            'colorEffectAmount': float(self.config.intensity),
+        }
 
 
 class PulseEffect(BaseColorEffect):
@@ -244,6 +636,8 @@ class PulseEffect(BaseColorEffect):
     pulse rate and BPM synchronization.
     """
     
+    __slots__ = ('pulse_color', 'pulse_curve')
+    
     def __init__(self, effect_config: ColorEffect):
         """Initialize pulse effect."""
         super().__init__(effect_config)
@@ -272,29 +666,34 @@ class PulseEffect(BaseColorEffect):
     
     def calculate_color(self, current_time: float, base_color: Tuple[float, float, float, float]) -> Tuple[float, float, float, float]:
         """Calculate pulse color at current time."""
-        # Get BPM-synchronized time if enabled
-        if self.config.bpm_sync and self.config.bpm:
-            # Synchronize to BPM beats
-            beats_per_second = self.config.bpm / 60.0
-            pulse_time = (current_time * beats_per_second * self.config.speed) % 1.0
-        else:
-            pulse_time = (current_time * self.config.speed) % 1.0
-        
-        # Calculate pulse factor based on curve type
-        if self.pulse_curve == 'sine':
-            pulse_factor = (math.sin(pulse_time * 2 * math.pi) + 1.0) / 2.0
-        elif self.pulse_curve == 'triangle':
-            pulse_factor = 1.0 - abs(pulse_time * 2.0 - 1.0)
-        elif self.pulse_curve == 'square':
-            pulse_factor = 1.0 if pulse_time < 0.5 else 0.0
-        else:
-            pulse_factor = pulse_time  # Linear fallback
-        
-        # Apply intensity
-        pulse_factor *= self.config.intensity
-        
         # Interpolate between base color and pulse color
-        return self._interpolate_color(base_color, self.pulse_color, pulse_factor)
+        if self.linear_light:
+            pulse_factor = _pulse_curve(self._phase(current_time),
+                                        _PULSE_CURVE_IDS.get(self.pulse_curve, 3))
+            return self._interpolate_color(base_color, self.pulse_color,
+                                           pulse_factor * self.config.intensity)
+        r, g, b, a = base_color
+        pulse_r, pulse_g, pulse_b, pulse_a = self.pulse_color
+        return _pulse_kernel(self._phase(current_time),
+                             _PULSE_CURVE_IDS.get(self.pulse_curve, 3), self.config.intensity,
+                             r, g, b, a, pulse_r, pulse_g, pulse_b, pulse_a)
+    
+    def calculate_color_batch(self, current_time: float, base_colors: np.ndarray) -> np.ndarray:
+        """Calculate pulse colors for many base colors at once."""
+        pulse_factor = _pulse_curve(self._phase(current_time),
+                                    _PULSE_CURVE_IDS.get(self.pulse_curve, 3))
+        pulse_color = np.asarray(self.pulse_color, dtype=base_colors.dtype)
+        return self._interpolate_color(base_colors, pulse_color, pulse_factor * self.config.intensity)
+    
+    def shader_uniforms(self, current_time: float) -> Optional[Dict[str, Any]]:
+        """Get text shader uniforms blending toward the pulse color."""
+        pulse_factor = _pulse_curve(self._phase(current_time),
+                                    _PULSE_CURVE_IDS.get(self.pulse_curve, 3))
+        return {
+            'colorEffectType': COLOR_SHADER_BLEND,
+            'colorEffectTarget': tuple(self.pulse_color),
+            'colorEffectAmount': float(pulse_factor * self.config.intensity),
+        }
 
 
 class StrobeEffect(BaseColorEffect):
@@ -305,6 +704,8 @@ class StrobeEffect(BaseColorEffect):
     with configurable flash patterns and BPM synchronization.
     """
     
+    __slots__ = ('strobe_color', 'flash_duration', 'pattern', '_flash_fn', '_flash_ratio')
+    
     def __init__(self, effect_config: ColorEffect):
         """Initialize strobe effect."""
         super().__init__(effect_config)
@@ -313,6 +714,11 @@ class StrobeEffect(BaseColorEffect):
         self.strobe_color = (1.0, 1.0, 1.0, 1.0)  # White by default
         self.flash_duration = 0.1  # Duration of each flash in seconds
         self.pattern = 'single'  # 'single', 'double', 'triple', 'random'
+        
+        # Flash test for the current pattern and the flash length as a
+        # fraction of the cycle, kept in step with the setters
+        self._flash_fn = self._flash_single
+        self._flash_ratio = self.flash_duration * self.config.speed
     
     def set_strobe_color(self, color: Tuple[float, float, float, float]) -> None:
         """
@@ -331,6 +737,7 @@ class StrobeEffect(BaseColorEffect):
             duration: Flash duration in seconds
         """
         self.flash_duration = max(0.01, duration)
+        self._flash_ratio = self.flash_duration * self.config.speed
     
     def set_pattern(self, pattern: str) -> None:
         """
@@ -340,19 +747,32 @@ class StrobeEffect(BaseColorEffect):
             pattern: Strobe pattern ('single', 'double', 'triple', 'random')
         """
         self.pattern = pattern
+        self._flash_fn = {
+            'single': self._flash_single,
+            'double': self._flash_double,
+            'triple': self._flash_triple,
+            'random': self._flash_random,
+        }.get(pattern, self._flash_single)  # Default to single
+    
+    def update_parameters(self, parameter_updates: Dict[str, Any]) -> None:
+        """
+        Update effect parameters in real-time.
+        
+        Args:
+            parameter_updates: Dictionary of parameter updates
+        """
+        super().update_parameters(parameter_updates)
+        self._flash_ratio = self.flash_duration * self.config.speed
+    
+    def sync_timing(self) -> None:
+        """Recompute timing constants and the flash ratio after direct configuration edits."""
+        super().sync_timing()
+        self._flash_ratio = self.flash_duration * self.config.speed
     
     def calculate_color(self, current_time: float, base_color: Tuple[float, float, float, float]) -> Tuple[float, float, float, float]:
         """Calculate strobe color at current time."""
-        # Get BPM-synchronized time if enabled
-        if self.config.bpm_sync and self.config.bpm:
-            beats_per_second = self.config.bpm / 60.0
-            cycle_time = (current_time * beats_per_second * self.config.speed) % 1.0
-        else:
-            cycle_duration = 1.0 / max(0.001, self.config.speed)
-            cycle_time = (current_time % cycle_duration) / cycle_duration
-        
         # Determine if we should flash based on pattern
-        should_flash = self._should_flash(cycle_time)
+        should_flash = self._should_flash(self._cycle_time(current_time))
         
         if should_flash:
             # Apply intensity to strobe color
@@ -361,6 +781,29 @@ class StrobeEffect(BaseColorEffect):
         else:
             return base_color
     
+    def calculate_color_batch(self, current_time: float, base_colors: np.ndarray) -> np.ndarray:
+        """Calculate strobe colors for many base colors at once."""
+        if not self._should_flash(self._cycle_time(current_time)):
+            return base_colors.copy()
+        strobe_color = np.asarray(self.strobe_color, dtype=base_colors.dtype)
+        return self._interpolate_color(base_colors, strobe_color, self.config.intensity)
+    
+    def shader_uniforms(self, current_time: float) -> Optional[Dict[str, Any]]:
+        """Get text shader uniforms blending toward the strobe color while flashing."""
+        flashing = self._should_flash(self._cycle_time(current_time))
+        return {
+            'colorEffectType': COLOR_SHADER_BLEND,
+            'colorEffectTarget': tuple(self.strobe_color),
+            'colorEffectAmount': float(self.config.intensity) if flashing else 0.0,
+        }
+    
+    def _cycle_time(self, current_time: float) -> float:
+        """Get the position within the current strobe cycle (0.0 to 1.0)."""
+        # Get BPM-synchronized time if enabled
+        if self._bpm_synced:
+            return (current_time * self._beats_per_second * self.config.speed) % 1.0
+        return (current_time * self._inv_cycle_duration) % 1.0
+    
     def _should_flash(self, cycle_time: float) -> bool:
         """
         Determine if strobe should flash at given cycle time.
@@ -371,24 +814,29 @@ class StrobeEffect(BaseColorEffect):
         Returns:
             True if should flash, False otherwise
         """
-        flash_ratio = self.flash_duration * self.config.speed
-        
-        if self.pattern == 'single':
-            return cycle_time < flash_ratio
-        elif self.pattern == 'double':
-            return (cycle_time < flash_ratio or 
-                   (0.5 <= cycle_time < 0.5 + flash_ratio))
-        elif self.pattern == 'triple':
-            return (cycle_time < flash_ratio or 
-                   (0.33 <= cycle_time < 0.33 + flash_ratio) or
-                   (0.66 <= cycle_time < 0.66 + flash_ratio))
-        elif self.pattern == 'random':
-            # Use cycle_time as seed for pseudo-random flashing
-            import random
-            random.seed(int(cycle_time * 1000))
-            return random.random() < flash_ratio * 2  # Adjust probability
-        else:
-            return cycle_time < flash_ratio  # Default to single
+        return self._flash_fn(cycle_time)
+    
+    def _flash_single(self, cycle_time: float) -> bool:
+        """One flash at the start of each cycle."""
+        return cycle_time < self._flash_ratio
+    
+    def _flash_double(self, cycle_time: float) -> bool:
+        """Flashes at the start and middle of each cycle."""
+        flash_ratio = self._flash_ratio
+        return (cycle_time < flash_ratio or 
+               (0.5 <= cycle_time < 0.5 + flash_ratio))
+    
+    def _flash_triple(self, cycle_time: float) -> bool:
+        """Three evenly spaced flashes per cycle."""
+        flash_ratio = self._flash_ratio
+        return (cycle_time < flash_ratio or 
+               (0.33 <= cycle_time < 0.33 + flash_ratio) or
+               (0.66 <= cycle_time < 0.66 + flash_ratio))
+    
+    def _flash_random(self, cycle_time: float) -> bool:
+        """Pseudo-random flashes, deterministic in cycle position."""
+        # Hash the cycle position for deterministic pseudo-random flashing
+        return _hash_unit(int(cycle_time * 1000)) < self._flash_ratio * 2  # Adjust probability
 
 
 class ColorTemperatureEffect(BaseColorEffect):
@@ -399,6 +847,9 @@ class ColorTemperatureEffect(BaseColorEffect):
     with smooth transitions and configurable temperature range.
     """
     
+    __slots__ = ('min_temperature', 'max_temperature', 'transition_curve',
+                 '_temp_lut', '_temp_lut_rows', '_temp_lut_range')
+    
     def __init__(self, effect_config: ColorEffect):
         """Initialize color temperature effect."""
         super().__init__(effect_config)
@@ -407,6 +858,12 @@ class ColorTemperatureEffect(BaseColorEffect):
         self.min_temperature = 2000  # Kelvin (warm)
         self.max_temperature = 8000  # Kelvin (cool)
         self.transition_curve = 'sine'  # 'sine', 'linear', 'ease_in_out'
+        
+        # Blackbody RGB multipliers sampled across the temperature range,
+        # rebuilt whenever the range changes
+        self._temp_lut: Optional[np.ndarray] = None
+        self._temp_lut_rows: List[Tuple[float, float, float]] = []
+        self._temp_lut_range: Optional[Tuple[float, float]] = None
     
     def set_temperature_range(self, min_temp: float, max_temp: float) -> None:
         """
@@ -421,6 +878,8 @@ class ColorTemperatureEffect(BaseColorEffect):
         
         if self.min_temperature >= self.max_temperature:
             self.max_temperature = self.min_temperature + 1000
+        
+        self._temp_lut_range = None
     
     def set_transition_curve(self, curve: str) -> None:
         """
@@ -433,28 +892,66 @@ class ColorTemperatureEffect(BaseColorEffect):
     
     def calculate_color(self, current_time: float, base_color: Tuple[float, float, float, float]) -> Tuple[float, float, float, float]:
         """Calculate color temperature shifted color at current time."""
-        # Get BPM-synchronized time if enabled
-        sync_time = self._get_bpm_time(current_time) if self.config.bpm_sync else current_time
-        
-        # Calculate temperature cycle
-        cycle_time = (sync_time * self.config.speed) % 1.0
-        
-        # Apply transition curve
-        if self.transition_curve == 'sine':
-            temp_factor = (math.sin(cycle_time * 2 * math.pi - math.pi/2) + 1.0) / 2.0
-        elif self.transition_curve == 'ease_in_out':
-            temp_factor = 0.5 * (1.0 + math.sin((cycle_time - 0.5) * math.pi))
-        else:  # linear
-            temp_factor = cycle_time
-        
-        # Calculate current temperature
-        current_temp = self.min_temperature + (self.max_temperature - self.min_temperature) * temp_factor
+        index = self._temp_lut_index(current_time)
+        red, green, blue = self._temp_lut_rows[index]
+        
+        # Shift the base color toward its temperature-tinted version by intensity
+        r, g, b, a = base_color
+        if self.linear_light:
+            return self._interpolate_color(base_color, (r * red, g * green, b * blue, a),
+                                           self.config.intensity)
+        return _temperature_kernel(self.config.intensity, r, g, b, a, red, green, blue)
+    
+    def calculate_color_batch(self, current_time: float, base_colors: np.ndarray) -> np.ndarray:
+        """Calculate temperature shifted colors for many base colors at once."""
+        # The RGB multiplier depends only on time, so it is shared by all rows
+        index = self._temp_lut_index(current_time)
+        multiplier = self._temp_lut[index]
+        result = base_colors.copy()
+        if self.linear_light:
+            rgb = base_colors[:, :3]
+            result[:, :3] = self._interpolate_color(rgb, rgb * multiplier, self.config.intensity)
+        else:
+            # rgb + (rgb * m - rgb) * k == rgb * (1 + (m - 1) * k), so the
+            # blend folds into one per-channel scale applied to all rows
+            result[:, :3] *= 1.0 + (multiplier - 1.0) * self.config.intensity
+        return result
+    
+    def shader_uniforms(self, current_time: float) -> Optional[Dict[str, Any]]:
+        """Get text shader uniforms tinting by the current temperature."""
+        index = self._temp_lut_index(current_time)
+        return {
+            'colorEffectType': COLOR_SHADER_TEMPERATURE,
+            'colorEffectMultiplier': self._temp_lut_rows[index],
+            'colorEffectAmount': float(self.config.intensity),
+        }
+    
+    def _temp_lut_index(self, current_time: float) -> int:
+        """
+        Get the temperature table entry for current time.
         
-        # Convert base color to temperature-shifted color
-        temp_color = self._apply_color_temperature(base_color, current_temp)
+        Rebuilds the table first if the temperature range has changed.
+        """
+        temperature_range = (self.min_temperature, self.max_temperature)
+        if self._temp_lut_range != temperature_range:
+            self._build_temp_lut()
+            self._temp_lut_range = temperature_range
         
-        # Apply intensity
-        return self._interpolate_color(base_color, temp_color, self.config.intensity)
+        index = int(self._temperature_factor(current_time) * (_TEMPERATURE_LUT_SIZE - 1) + 0.5)
+        return min(max(index, 0), _TEMPERATURE_LUT_SIZE - 1)
+    
+    def _build_temp_lut(self) -> None:
+        """Sample blackbody RGB multipliers across the temperature range."""
+        temperatures = np.linspace(self.min_temperature, self.max_temperature,
+                                   _TEMPERATURE_LUT_SIZE)
+        multipliers = _blackbody_multipliers_np(temperatures)
+        self._temp_lut_rows = [tuple(row) for row in multipliers.tolist()]
+        self._temp_lut = multipliers.astype(np.float32)
+    
+    def _temperature_factor(self, current_time: float) -> float:
+        """Get the position within the temperature range (0.0 to 1.0) at current time."""
+        # Apply transition curve to the temperature cycle
+        return _TRANSITION_CURVES.get(self.transition_curve, _linear_curve)(self._phase(current_time))
     
     def _apply_color_temperature(self, color: Tuple[float, float, float, float], 
                                temperature: float) -> Tuple[float, float, float, float]:
@@ -468,6 +965,25 @@ class ColorTemperatureEffect(BaseColorEffect):
         Returns:
             Temperature-shifted color (RGBA)
         """
+        red, green, blue = self._blackbody_multiplier(temperature)
+        return (
+            color[0] * red,
+            color[1] * green,
+            color[2] * blue,
+            color[3]  # Keep original alpha
+        )
+    
+    @staticmethod
+    def _blackbody_multiplier(temperature: float) -> Tuple[float, float, float]:
+        """
+        Get the RGB multiplier for a color temperature.
+        
+        Args:
+            temperature: Color temperature in Kelvin
+            
+        Returns:
+            Red, green and blue multipliers (0.0 to 1.0 each)
+        """
         # Simplified color temperature calculation
         # Based on approximation of blackbody radiation
         
@@ -500,17 +1016,14 @@ class ColorTemperatureEffect(BaseColorEffect):
             blue = 138.5177312231 * math.log(blue) - 305.0447927307
             blue = max(0.0, min(1.0, blue / 255.0))
         
-        # Apply temperature shift to original color
-        temp_multiplier = (red, green, blue)
-        
-        shifted_color = (
-            color[0] * temp_multiplier[0],
-            color[1] * temp_multiplier[1],
-            color[2] * temp_multiplier[2],
-            color[3]  # Keep original alpha
-        )
-        
-        return shifted_color
+        return (red, green, blue)
+
+
+def _chain_color_fns(inner: ColorStackFn, outer: ColorStackFn) -> ColorStackFn:
+    """Compose two color functions, applying inner first."""
+    def chained(current_time, base_color):
+        return outer(current_time, inner(current_time, base_color))
+    return chained
 
 
 class ColorEffectProcessor:
@@ -523,13 +1036,20 @@ class ColorEffectProcessor:
     
     def __init__(self):
         """Initialize color effect processor."""
-        self._effect_factories = {
-            'rainbow': lambda config: RainbowEffect(config),
-            'pulse': lambda config: PulseEffect(config),
-            'strobe': lambda config: StrobeEffect(config),
-            'temperature': lambda config: ColorTemperatureEffect(config)
+        self._effect_factories: Dict[str, Type[BaseColorEffect]] = {
+            'rainbow': RainbowEffect,
+            'pulse': PulseEffect,
+            'strobe': StrobeEffect,
+            'temperature': ColorTemperatureEffect
         }
+        # Effect instances keyed by type and id() of their configuration,
+        # reused across frames
         self._active_effects: Dict[str, BaseColorEffect] = {}
+        # Rejected configurations already reported, so the render loop logs
+        # each problem once
+        self._reported_errors: set = set()
+        # Compiled effect stacks keyed by the configurations they apply
+        self._effect_stacks: Dict[tuple, ColorStackFn] = {}
     
     def create_effect(self, effect_config: ColorEffect) -> BaseColorEffect:
         """
@@ -544,11 +1064,105 @@ class ColorEffectProcessor:
         Raises:
             ValueError: If effect type is not supported
         """
-        factory = self._effect_factories.get(effect_config.type)
-        if not factory:
+        effect_class = self._effect_factories.get(effect_config.type)
+        if effect_class is None:
             raise ValueError(f"Unsupported color effect type: {effect_config.type}")
         
-        return factory(effect_config)
+        return effect_class(effect_config)
+    
+    def get_effect(self, effect_config: ColorEffect) -> BaseColorEffect:
+        """
+        Get the cached effect instance for a configuration, creating it on first use.
+        
+        A cached instance picks up speed and BPM edits made directly on the
+        configuration.
+        
+        Args:
+            effect_config: Color effect configuration
+            
+        Returns:
+            Color effect instance
+            
+        Raises:
+            ValueError: If effect type is not supported
+        """
+        effect_id = f"{effect_config.type}_{id(effect_config)}"
+        effect = self._active_effects.get(effect_id)
+        if effect is None:
+            effect = self.create_effect(effect_config)
+            if len(self._active_effects) >= _EFFECT_CACHE_LIMIT:
+                self._active_effects.clear()
+                self._effect_stacks.clear()
+            # The effect keeps its configuration alive, so the id stays unique
+            self._active_effects[effect_id] = effect
+        else:
+            effect.sync_timing()
+        return effect
+    
+    def invalidate(self, effect_config: ColorEffect) -> None:
+        """
+        Drop the cached effect instance for a configuration.
+        
+        The next frame creates a fresh instance from the configuration.
+        
+        Args:
+            effect_config: Color effect configuration
+        """
+        self._active_effects.pop(f"{effect_config.type}_{id(effect_config)}", None)
+        # Stacks hold on to the dropped instance
+        self._effect_stacks.clear()
+    
+    def _resolve_effects(self, effects: List[ColorEffect]) -> List[BaseColorEffect]:
+        """Get effect instances for configurations, skipping unsupported ones."""
+        resolved = []
+        for effect_config in effects:
+            try:
+                resolved.append(self.get_effect(effect_config))
+            except ValueError as e:
+                message = str(e)
+                if message not in self._reported_errors:
+                    self._reported_errors.add(message)
+                    logger.warning("Skipping color effect %s: %s", effect_config.type, message)
+        return resolved
+    
+    @staticmethod
+    def _compile_effect_stack(resolved: List[BaseColorEffect]) -> ColorStackFn:
+        """Compose effect instances into one function applying them in order."""
+        if not resolved:
+            return lambda current_time, base_color: base_color
+        
+        # Chain the bound methods so a frame runs no lookups or loop; the
+        # instances stay live, so their color/pattern setters still apply
+        stack = resolved[0].calculate_color
+        for effect in resolved[1:]:
+            stack = _chain_color_fns(stack, effect.calculate_color)
+        return stack
+    
+    def get_effect_stack(self, effects: List[ColorEffect]) -> ColorStackFn:
+        """
+        Get the compiled function applying a list of color effects.
+        
+        Stacks are cached by configuration identity and timing parameters,
+        so the same effects applied every frame compile once. Editing a
+        configuration's timing recompiles the stack on the next frame, and
+        the rebuild refreshes the timing of the cached effect instances.
+        
+        Args:
+            effects: Color effects to apply, in order
+            
+        Returns:
+            Function mapping (current_time, base_color) to the final color
+        """
+        key = tuple((id(effect_config), effect_config.type, effect_config.speed,
+                     effect_config.intensity, effect_config.bpm_sync, effect_config.bpm)
+                    for effect_config in effects)
+        stack = self._effect_stacks.get(key)
+        if stack is None:
+            stack = self._compile_effect_stack(self._resolve_effects(effects))
+            if len(self._effect_stacks) >= _EFFECT_CACHE_LIMIT:
+                self._effect_stacks.clear()
+            self._effect_stacks[key] = stack
+        return stack
     
     def apply_color_effects(self, text_element: TextElement, effects: List[ColorEffect],
                           current_time: float) -> Tuple[float, float, float, float]:
@@ -566,22 +1180,56 @@ class ColorEffectProcessor:
         if not effects:
             return text_element.color
         
-        current_color = text_element.color
+        return self.get_effect_stack(effects)(current_time, text_element.color)
+    
+    def apply_color_effects_batch(self, base_colors: np.ndarray, effects: List[ColorEffect],
+                                  current_time: float) -> np.ndarray:
+        """
+        Apply the same color effects to many base colors at once.
         
-        for effect_config in effects:
-            try:
-                effect = self.create_effect(effect_config)
-                current_color = effect.calculate_color(current_time, current_color)
-                
-                # Store active effect for parameter updates
-                effect_id = f"{effect_config.type}_{id(effect_config)}"
-                self._active_effects[effect_id] = effect
-                
-            except Exception as e:
-                print(f"Error applying color effect {effect_config.type}: {e}")
-                continue
-        
-        return current_color
+        Each effect is evaluated once per frame over the whole (N, 4)
+        array instead of once per text element. Colors are processed as
+        float32, which is ample for 8-bit output; results match
+        apply_color_effects row for row within float32 precision.
+        
+        Args:
+            base_colors: Base RGBA colors, shape (N, 4)
+            effects: Color effects applied to every color
+            current_time: Current timeline time
+            
+        Returns:
+            Final colors after applying all effects, shape (N, 4), float32
+        """
+        current_colors = np.array(base_colors, dtype=np.float32).reshape(-1, 4)
+        
+        for effect in self._resolve_effects(effects):
+            current_colors = effect.calculate_color_batch(current_time, current_colors)
+        
+        return current_colors
+    
+    def to_shader_uniforms(self, effects: List[ColorEffect],
+                           current_time: float) -> Optional[Dict[str, Any]]:
+        """
+        Get text shader uniforms applying color effects at current time.
+        
+        The text shader evaluates one color effect per draw, so stacks of
+        several effects are left to the CPU path.
+        
+        Args:
+            effects: Color effects applied to the text
+            current_time: Current timeline time
+            
+        Returns:
+            Dictionary of uniform values for TextRenderer.render_text, or
+            None if the effects have to be applied with apply_color_effects
+        """
+        resolved = self._resolve_effects(effects)
+        if not resolved:
+            return {'colorEffectType': COLOR_SHADER_NONE}
+        if len(resolved) != 1 or resolved[0].linear_light:
+            # The shader blends in sRGB only
+            return None
+        return resolved[0].shader_uniforms(current_time)
     
     def update_effect_parameters(self, effect_id: str, 
                                parameter_updates: Dict[str, Any]) -> bool:
@@ -613,6 +1261,7 @@ class ColorEffectProcessor:
     def cleanup_effects(self) -> None:
         """Clean up all active effects."""
         self._active_effects.clear()
+        self._effect_stacks.clear()
     
     def create_rainbow_effect(self, speed: float = 1.0, intensity: float = 1.0,
                             bpm_sync: bool = False, bpm: Optional[float] = None) -> ColorEffect:
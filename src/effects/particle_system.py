@@ -3,90 +3,61 @@ Enhanced particle system implementation with specific particle effects.
 Implements sparkle, fire, and smoke effects with texture-based rendering.
 """
 
+import ctypes
 import math
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 from dataclasses import dataclass
 import numpy as np
 
+try:
+    from numba import njit, prange
+except ImportError:
+    # Emitters update particles with NumPy array operations without numba
+    njit = None
+    prange = range
+
 try:
     import OpenGL.GL as gl
 except ImportError:
-    # Fallback for testing without OpenGL
-    class MockGL:
-        GL_ARRAY_BUFFER = 0x8892
-        GL_STATIC_DRAW = 0x88E4
-        GL_DYNAMIC_DRAW = 0x88E8
-        GL_TRIANGLES = 0x0004
-        GL_FLOAT = 0x1406
-        GL_FALSE = 0
-        GL_BLEND = 0x0BE2
-        GL_SRC_ALPHA = 0x0302
-        GL_ONE_MINUS_SRC_ALPHA = 0x0303
-        GL_DEPTH_TEST = 0x0B71
-        GL_TRUE = 1
-        GL_TEXTURE_2D = 0x0DE1
-        GL_RGBA = 0x1908
-        GL_UNSIGNED_BYTE = 0x1401
-        GL_TEXTURE_MIN_FILTER = 0x2801
-        GL_TEXTURE_MAG_FILTER = 0x2800
-        GL_LINEAR = 0x2601
-        GL_TEXTURE_WRAP_S = 0x2802
-        GL_TEXTURE_WRAP_T = 0x2803
-        GL_CLAMP_TO_EDGE = 0x812F
-        GL_TEXTURE0 = 0x84C0
-        
-        @staticmethod
-        def glGenVertexArrays(n): return 1
-        @staticmethod
-        def glGenBuffers(n): return 1
-        @staticmethod
-        def glGenTextures(n): return 1
-        @staticmethod
-        def glBindVertexArray(vao): pass
-        @staticmethod
-        def glBindBuffer(target, buffer): pass
-        @staticmethod
-        def glBindTexture(target, texture): pass
-        @staticmethod
-        def glBufferData(target, size, data, usage): pass
-        @staticmethod
-        def glVertexAttribPointer(index, size, type, normalized, stride, pointer): pass
-        @staticmethod
-        def glEnableVertexAttribArray(index): pass
-        @staticmethod
-        def glVertexAttribDivisor(index, divisor): pass
-        @staticmethod
-        def glBufferSubData(target, offset, size, data): pass
-        @staticmethod
-        def glEnable(cap): pass
-        @staticmethod
-        def glDisable(cap): pass
-        @staticmethod
-        def glBlendFunc(sfactor, dfactor): pass
-        @staticmethod
-        def glDepthMask(flag): pass
-        @staticmethod
-        def glDrawArraysInstanced(mode, first, count, instancecount): pass
-        @staticmethod
-        def glDeleteVertexArrays(n, arrays): pass
-        @staticmethod
-        def glDeleteBuffers(n, buffers): pass
-        @staticmethod
-        def glDeleteTextures(n, textures): pass
-        @staticmethod
-        def glTexImage2D(target, level, internalformat, width, height, border, format, type, data): pass
-        @staticmethod
-        def glTexParameteri(target, pname, param): pass
-        @staticmethod
-        def glActiveTexture(texture): pass
-    
-    gl = MockGL()
+    # Particles still simulate without OpenGL; the renderer will not initialize
+    gl = None
 
 from ..core.models import ParticleEffect, ParticleType, TextElement
 from ..graphics.shader_manager import ShaderManager
 
+# Per-instance 32-bit words: position (3), color packed as RGBA8, size,
+# rotation, life, texture index, GPU effect slot (-1 for none)
+_INSTANCE_FLOATS = 9
+_INSTANCE_COLOR_BYTES = slice(3 * 4, 4 * 4)
+
+# Particle arrays hold float32, the precision the shader consumes, so
+# rows upload without conversion
+_PARTICLE_DTYPE = np.float32
+
+# Effect phase offsets are wrapped to one period before they meet float32
+# particle data, which cannot resolve wall-clock seconds
+_TWO_PI = 2.0 * math.pi
+
+# Procedural particle textures are tiles of one atlas, side by side in
+# texture index order, so every particle type renders in a single draw
+_ATLAS_TILE_SIZE = 64
+
+# Camera uniform block: view, projection and view-projection matrices
+# (std140), shared by every particle draw through one binding point
+_CAMERA_BINDING = 0
+_CAMERA_FLOATS = 3 * 16
+
+# GPU effect parameters for one emitter: (phase offset, amplitude, alpha,
+# base size) and a rate (heat dissipation or expansion rate)
+GpuEffectParameters = Tuple[Tuple[float, float, float, float], float]
+
+# Distinct GPU effect parameter sets per frame; matches MAX_EFFECT_SLOTS in
+# particle_vertex.glsl. Emitters past the limit apply effects on the CPU.
+_MAX_EFFECT_SLOTS = 16
+
 
 @dataclass
 class Particle:
@@ -129,6 +100,210 @@ class Particle:
         self.rotation += self.angular_velocity * delta_time
 
 
+@dataclass
+class ParticleArrays:
+    """
+    Structure-of-arrays particle storage for an emitter.
+    
+    Arrays are preallocated to the emitter capacity; the first
+    active_count rows hold live particles.
+    """
+    positions: np.ndarray  # (N, 3)
+    velocities: np.ndarray  # (N, 3)
+    accelerations: np.ndarray  # (N, 3)
+    colors: np.ndarray  # (N, 4) RGBA
+    size: np.ndarray  # (N,)
+    life: np.ndarray  # (N,) 1.0 at spawn, dead at 0.0
+    max_life: np.ndarray  # (N,) lifetime in seconds
+    rotation: np.ndarray  # (N,)
+    angular_velocity: np.ndarray  # (N,)
+    texture_index: np.ndarray  # (N,)
+    rgba8: np.ndarray  # (N, 4) colors as uploaded, refreshed by pack_colors
+    active_count: int = 0
+    
+    @classmethod
+    def allocate(cls, capacity: int) -> 'ParticleArrays':
+        """Create empty storage for up to capacity particles."""
+        return cls(
+            positions=np.zeros((capacity, 3), dtype=_PARTICLE_DTYPE),
+            velocities=np.zeros((capacity, 3), dtype=_PARTICLE_DTYPE),
+            accelerations=np.zeros((capacity, 3), dtype=_PARTICLE_DTYPE),
+            colors=np.zeros((capacity, 4), dtype=_PARTICLE_DTYPE),
+            size=np.zeros(capacity, dtype=_PARTICLE_DTYPE),
+            life=np.zeros(capacity, dtype=_PARTICLE_DTYPE),
+            max_life=np.ones(capacity, dtype=_PARTICLE_DTYPE),
+            rotation=np.zeros(capacity, dtype=_PARTICLE_DTYPE),
+            angular_velocity=np.zeros(capacity, dtype=_PARTICLE_DTYPE),
+            texture_index=np.zeros(capacity, dtype=np.int32),
+            rgba8=np.zeros((capacity, 4), dtype=np.uint8)
+        )
+    
+    @property
+    def capacity(self) -> int:
+        """Maximum number of particles the arrays can hold."""
+        return len(self.life)
+    
+    def fields(self) -> Tuple[np.ndarray, ...]:
+        """Get every per-particle array."""
+        return (self.positions, self.velocities, self.accelerations, self.colors,
+                self.size, self.life, self.max_life, self.rotation,
+                self.angular_velocity, self.texture_index, self.rgba8)
+    
+    def write(self, index: int, particle: Particle) -> None:
+        """Store a particle record in the given row."""
+        self.positions[index] = particle.position
+        self.velocities[index] = particle.velocity
+        self.accelerations[index] = particle.acceleration
+        self.colors[index] = particle.color
+        self.size[index] = particle.size
+        self.life[index] = particle.life
+        self.max_life[index] = particle.max_life
+        self.rotation[index] = particle.rotation
+        self.angular_velocity[index] = particle.angular_velocity
+        self.texture_index[index] = particle.texture_index
+        self.pack_colors(index, index + 1)
+    
+    def pack_colors(self, start: int, stop: int) -> None:
+        """Refresh the RGBA8 upload copy of the colors in rows start to stop."""
+        scaled = self.colors[start:stop] * 255.0
+        scaled += 0.5
+        np.clip(scaled, 0.0, 255.0, out=scaled)
+        self.rgba8[start:stop] = scaled
+    
+    def read(self, index: int) -> Particle:
+        """Get a particle record copied from the given row."""
+        return Particle(
+            position=tuple(self.positions[index].tolist()),
+            velocity=tuple(self.velocities[index].tolist()),
+            acceleration=tuple(self.accelerations[index].tolist()),
+            color=tuple(self.colors[index].tolist()),
+            size=float(self.size[index]),
+            life=float(self.life[index]),
+            max_life=float(self.max_life[index]),
+            rotation=float(self.rotation[index]),
+            angular_velocity=float(self.angular_velocity[index]),
+            texture_index=int(self.texture_index[index])
+        )
+    
+    def remove(self, dead: np.ndarray) -> None:
+        """
+        Remove the particles in the given ascending rows by swapping in the tail.
+        
+        Surviving particles from the tail fill the dead rows that stay in
+        the active range, so only one row per death is copied. Particle
+        order is not preserved.
+        
+        Args:
+            dead: Ascending indices of dead rows below active_count
+        """
+        n = self.active_count
+        remaining = n - dead.size
+        holes = dead[:np.searchsorted(dead, remaining)]
+        if holes.size:
+            tail = np.arange(remaining, n)
+            survivors = np.setdiff1d(tail, dead[holes.size:], assume_unique=True)
+            for array in self.fields():
+                array[holes] = array[survivors]
+        self.active_count = remaining
+    
+    def clear(self) -> None:
+        """Remove all particles."""
+        self.active_count = 0
+
+
+def _integrate_kernel(positions, velocities, accelerations, life, max_life,
+                      rotation, angular_velocity, n, delta_time):
+    """
+    Advance the first n particles by delta_time, same order as Particle.update.
+    
+    Returns the number of particles whose life ran out, so frames without
+    deaths skip the search for dead rows.
+    """
+    dead = 0
+    for i in prange(n):
+        life[i] -= delta_time / max_life[i]
+        for axis in range(3):
+            velocities[i, axis] += accelerations[i, axis] * delta_time
+            positions[i, axis] += velocities[i, axis] * delta_time
+        rotation[i] += angular_velocity[i] * delta_time
+        if life[i] <= 0.0:
+            dead += 1
+    return dead
+
+
+def _make_sparkle_kernel(brightness_variation, alpha):
+    """Build the kernel twinkling the alpha of the first n sparkle particles."""
+    def sparkle_kernel(colors, life, rotation, n, phase_offset):
+        for i in prange(n):
+            brightness = 1.0 + brightness_variation * math.sin(rotation[i] + phase_offset)
+            colors[i, 3] = brightness * alpha * life[i]
+    return sparkle_kernel
+
+
+def _make_fire_kernel(heat_dissipation, flicker_intensity, alpha, original_size):
+    """Build the kernel cooling, flickering and shrinking the first n fire particles."""
+    def fire_kernel(colors, size, life, rotation, n, flicker_offset):
+        for i in prange(n):
+            heat_level = life[i] * (1.0 - (1.0 - life[i]) * heat_dissipation)
+            flicker = 1.0 + flicker_intensity * math.sin(rotation[i] * 2.0 + flicker_offset)
+            colors[i, 0] = min(1.0, flicker)
+            colors[i, 1] = min(1.0, (0.2 + 0.8 * heat_level) * flicker)
+            colors[i, 2] = min(1.0, max(0.0, heat_level - 0.5) * 2.0 * flicker)
+            colors[i, 3] = life[i] * alpha
+            size[i] = original_size * (0.5 + 0.5 * heat_level)
+    return fire_kernel
+
+
+def _make_smoke_kernel(expansion_rate, alpha, original_size):
+    """Build the kernel expanding and fading the first n smoke particles."""
+    def smoke_kernel(colors, size, life, n):
+        for i in prange(n):
+            age_factor = 1.0 - life[i]
+            size[i] = original_size * (1.0 + age_factor * expansion_rate) * 0.5
+            colors[i, 3] = alpha * (life[i] * (1.0 - age_factor * 0.5))
+    return smoke_kernel
+
+
+# Each kernel makes one pass over the particle rows; the NumPy paths in
+# the emitters compute the same values in several array passes
+_USE_PARTICLE_KERNELS = njit is not None
+if _USE_PARTICLE_KERNELS:
+    _integrate_kernel = njit(parallel=True, fastmath=True, cache=True)(_integrate_kernel)
+
+# Effect kernels specialized on emitter constants, by factory and constants
+_SPECIALIZED_KERNELS: Dict[Tuple[Any, ...], Callable[..., None]] = {}
+_SPECIALIZED_KERNEL_LIMIT = 64
+
+
+def _specialized_kernel(factory: Callable[..., Callable[..., None]],
+                        *constants: float) -> Callable[..., None]:
+    """
+    Get the effect kernel built by factory for the given emitter constants.
+    
+    Kernels are built once per distinct set of constants. Compiled with
+    numba, the constants a kernel closes over are frozen into the machine
+    code as literals, so they fold into the per-particle arithmetic.
+    
+    Args:
+        factory: Kernel factory taking the constants
+        constants: Effect constants of the emitter
+        
+    Returns:
+        Kernel taking the particle arrays and per-frame arguments
+    """
+    constants = tuple(float(value) for value in constants)
+    key = (factory,) + constants
+    kernel = _SPECIALIZED_KERNELS.get(key)
+    if kernel is None:
+        if len(_SPECIALIZED_KERNELS) >= _SPECIALIZED_KERNEL_LIMIT:
+            _SPECIALIZED_KERNELS.clear()
+        kernel = factory(*constants)
+        if _USE_PARTICLE_KERNELS:
+            kernel = njit(parallel=True, fastmath=True)(kernel)
+        _SPECIALIZED_KERNELS[key] = kernel
+    return kernel
+
+
 @dataclass
 class ParticleEmitterConfig:
     """Configuration for particle emitters with physics parameters."""
@@ -149,37 +324,119 @@ class ParticleEmitterConfig:
     blend_mode: str = "alpha"
 
 
+def _uniform(low, high, rnd: np.ndarray) -> np.ndarray:
+    """Map uniform [0, 1) draws onto [low, high), broadcasting tuple bounds per column."""
+    low = np.asarray(low, dtype=rnd.dtype)
+    return low + rnd * (np.asarray(high, dtype=rnd.dtype) - low)
+
+
 class BaseParticleEmitter(ABC):
     """Base class for particle emitters with configurable emission and physics."""
     
-    def __init__(self, config: ParticleEmitterConfig):
+    # Uniform draws per spawned particle consumed by _spawn_batch
+    _spawn_columns = 0
+    
+    def __init__(self, config: ParticleEmitterConfig, seed: Optional[int] = None):
         self.config = config
-        self.particles: List[Particle] = []
+        self._rng = np.random.default_rng(seed)
+        self.arrays = ParticleArrays.allocate(config.max_particles)
+        # Scratch space for per-frame vector and per-particle products
+        self._scratch = np.empty((config.max_particles, 3), dtype=_PARTICLE_DTYPE)
+        self._scratch_1d = np.empty(config.max_particles, dtype=_PARTICLE_DTYPE)
         self.emission_accumulator = 0.0
         self.is_active = True
         self.texture_id = 0
+        # When set, the particle shader applies the color and size effects
+        # and update leaves the spawn color and size in place
+        self.effects_on_gpu = False
     
     @abstractmethod
+    def _spawn_batch(self, arrays: ParticleArrays, start: int, rnd: np.ndarray) -> None:
+        """
+        Spawn len(rnd) new particles into the rows of arrays starting at start.
+        
+        Args:
+            arrays: Particle storage to write
+            start: First row to write
+            rnd: Uniform draws, one row of _spawn_columns values per particle
+        """
+        pass
+    
     def create_particle(self) -> Particle:
         """Create a new particle with emitter-specific properties."""
-        pass
+        single = ParticleArrays.allocate(1)
+        self._spawn_batch(single, 0, self._rng.random((1, self._spawn_columns), dtype=_PARTICLE_DTYPE))
+        return single.read(0)
     
-    def update(self, delta_time: float) -> None:
-        """Update emitter and all particles with physics simulation."""
-        if not self.is_active:
-            return
+    @property
+    def particles(self) -> List[Particle]:
+        """Get a snapshot of the active particles as Particle records."""
+        return [self.arrays.read(index) for index in range(self.arrays.active_count)]
+    
+    def update(self, delta_time: float, current_time: Optional[float] = None) -> None:
+        """
+        Update emitter and all particles with physics simulation.
         
-        # Update existing particles with physics
-        alive_particles = []
-        for particle in self.particles:
-            particle.update(delta_time)
-            if particle.is_alive():
-                alive_particles.append(particle)
+        Args:
+            delta_time: Seconds since the previous update
+            current_time: Monotonic frame time in seconds driving time-based
+                effects; sampled from time.perf_counter when omitted
+        """
+        if self.is_active:
+            self._simulate(delta_time)
         
-        self.particles = alive_particles
+        # Apply per-frame color and size effects unless the particle shader
+        # does; colors then change only at spawn and are packed only there
+        arrays = self.arrays
+        n = arrays.active_count
+        if n and not self.effects_on_gpu:
+            if current_time is None:
+                current_time = time.perf_counter()
+            self._apply_effects(n, current_time)
+            arrays.pack_colors(0, n)
+    
+    def _apply_effects(self, n: int, current_time: float) -> None:
+        """
+        Apply the emitter's per-frame color and size effects to the first n particles.
+        
+        Args:
+            n: Number of active particles
+            current_time: Monotonic frame time in seconds
+        """
+        pass
+    
+    def _simulate(self, delta_time: float) -> None:
+        """Advance particle physics, remove dead particles and emit new ones."""
+        # Update existing particles with physics, same order as Particle.update
+        arrays = self.arrays
+        n = arrays.active_count
+        if n:
+            life = arrays.life[:n]
+            if _USE_PARTICLE_KERNELS:
+                dead_count = _integrate_kernel(arrays.positions, arrays.velocities,
+                                               arrays.accelerations, arrays.life,
+                                               arrays.max_life, arrays.rotation,
+                                               arrays.angular_velocity, n, delta_time)
+            else:
+                velocities = arrays.velocities[:n]
+                scratch = self._scratch[:n]
+                
+                life -= delta_time / arrays.max_life[:n]
+                np.multiply(arrays.accelerations[:n], delta_time, out=scratch)
+                velocities += scratch
+                np.multiply(velocities, delta_time, out=scratch)
+                arrays.positions[:n] += scratch
+                arrays.rotation[:n] += arrays.angular_velocity[:n] * delta_time
+                dead_count = None
+            
+            # Swap surviving tail particles into the dead rows
+            if dead_count != 0:
+                dead = np.flatnonzero(life <= 0.0)
+                if dead.size:
+                    arrays.remove(dead)
         
         # Emit new particles based on emission rate
-        if len(self.particles) < self.config.max_particles:
+        if arrays.active_count < arrays.capacity:
             self._emit_particles(delta_time)
     
     def _emit_particles(self, delta_time: float) -> None:
@@ -189,33 +446,50 @@ class BaseParticleEmitter(ABC):
         particles_to_emit = int(self.emission_accumulator)
         self.emission_accumulator -= particles_to_emit
         
-        for _ in range(particles_to_emit):
-            if len(self.particles) >= self.config.max_particles:
-                break
+        arrays = self.arrays
+        count = min(particles_to_emit, arrays.capacity - arrays.active_count)
+        if count > 0:
+            # One draw covers every random property of the whole batch
+            rnd = self._rng.random((count, self._spawn_columns), dtype=_PARTICLE_DTYPE)
+            start = arrays.active_count
+            self._spawn_batch(arrays, start, rnd)
+            arrays.pack_colors(start, start + count)
+            arrays.active_count += count
+    
+    def _spawn_shared(self, arrays: ParticleArrays, rows: slice, rnd: np.ndarray,
+                      angular_speed: float) -> None:
+        """Write the lifetime, rotation and reset fields common to every emitter from 3 draws."""
+        arrays.max_life[rows] = _uniform(self.config.lifetime_min, self.config.lifetime_max,
+                                         rnd[:, 0])
+        arrays.rotation[rows] = _uniform(0.0, 2 * math.pi, rnd[:, 1])
+        arrays.angular_velocity[rows] = _uniform(-angular_speed, angular_speed, rnd[:, 2])
+        arrays.life[rows] = 1.0
+        arrays.texture_index[rows] = self.texture_index
+    
+    def gpu_effect_parameters(self, current_time: float) -> Optional[GpuEffectParameters]:
+        """
+        Get the particle shader parameters reproducing this emitter's effect.
+        
+        Args:
+            current_time: Current time in seconds
             
-            particle = self.create_particle()
-            self.particles.append(particle)
-    
-    def _random_in_range(self, min_val: float, max_val: float) -> float:
-        """Generate random value in range for physics variation."""
-        return min_val + np.random.random() * (max_val - min_val)
-    
-    def _random_vector_in_range(self, min_vec: Tuple[float, float, float],
-                               max_vec: Tuple[float, float, float]) -> Tuple[float, float, float]:
-        """Generate random vector with components in specified ranges."""
-        return (
-            self._random_in_range(min_vec[0], max_vec[0]),
-            self._random_in_range(min_vec[1], max_vec[1]),
-            self._random_in_range(min_vec[2], max_vec[2])
-        )
+        Returns:
+            Effect parameters for this emitter's particles, or None if
+            the emitter has no per-frame color or size effect
+        """
+        return None
+    
+    def _original_size(self) -> float:
+        """Get the mid-range particle size effects scale from."""
+        return self.config.size_min + (self.config.size_max - self.config.size_min) * 0.5
     
     def get_particle_count(self) -> int:
         """Get current number of active particles."""
-        return len(self.particles)
+        return self.arrays.active_count
     
     def clear_particles(self) -> None:
         """Remove all particles."""
-        self.particles.clear()
+        self.arrays.clear()
     
     def set_position(self, position: Tuple[float, float, float]) -> None:
         """Update emitter position."""
@@ -229,305 +503,261 @@ class BaseParticleEmitter(ABC):
 class SparkleEmitter(BaseParticleEmitter):
     """Sparkle particle emitter with texture-based rendering and twinkling behavior."""
     
-    def __init__(self, config: ParticleEmitterConfig):
-        super().__init__(config)
+    texture_index = 0  # Sparkle texture index
+    _spawn_columns = 13
+    
+    def __init__(self, config: ParticleEmitterConfig, seed: Optional[int] = None):
+        super().__init__(config, seed)
         self.twinkle_frequency = 3.0  # Twinkles per second
         self.brightness_variation = 0.4  # How much brightness varies
     
-    def create_particle(self) -> Particle:
-        """Create a sparkle particle with texture-based rendering and twinkling."""
-        pos_variance = self.config.position_variance
-        position = (
-            self.config.position[0] + self._random_in_range(-pos_variance[0], pos_variance[0]),
-            self.config.position[1] + self._random_in_range(-pos_variance[1], pos_variance[1]),
-            self.config.position[2] + self._random_in_range(-pos_variance[2], pos_variance[2])
-        )
+    def _spawn_batch(self, arrays: ParticleArrays, start: int, rnd: np.ndarray) -> None:
+        """Spawn a batch of sparkles with one column of draws per random property."""
+        config = self.config
+        rows = slice(start, start + len(rnd))
         
-        # Sparkle particles have gentle, floating movement
-        velocity = self._random_vector_in_range(
-            self.config.velocity_min,
-            self.config.velocity_max
-        )
+        variance = np.asarray(config.position_variance, dtype=_PARTICLE_DTYPE)
+        arrays.positions[rows] = config.position + _uniform(-variance, variance, rnd[:, 0:3])
         
-        # Add slight upward bias for magical floating effect
-        velocity = (velocity[0] * 0.7, velocity[1] + 5.0, velocity[2] * 0.7)
+        # Gentle floating movement with an upward bias
+        velocity = arrays.velocities[rows]
+        velocity[:] = _uniform(config.velocity_min, config.velocity_max, rnd[:, 3:6])
+        velocity *= (0.7, 1.0, 0.7)
+        velocity[:, 1] += 5.0
+        arrays.accelerations[rows] = config.acceleration
         
-        lifetime = self._random_in_range(
-            self.config.lifetime_min,
-            self.config.lifetime_max
-        )
-        
-        # Sparkles vary in size for visual interest
-        size = self._random_in_range(
-            self.config.size_min,
-            self.config.size_max
-        )
-        
-        # Random rotation for sparkle orientation
-        rotation = self._random_in_range(0, 2 * math.pi)
-        angular_velocity = self._random_in_range(-1.5, 1.5)
+        arrays.size[rows] = _uniform(config.size_min, config.size_max, rnd[:, 6])
+        self._spawn_shared(arrays, rows, rnd[:, 7:10], 1.5)
         
         # Sparkle color with slight variation
-        base_color = self.config.color_start
-        color_variation = 0.2
-        color = (
-            max(0.0, min(1.0, base_color[0] + self._random_in_range(-color_variation, color_variation))),
-            max(0.0, min(1.0, base_color[1] + self._random_in_range(-color_variation, color_variation))),
-            max(0.0, min(1.0, base_color[2] + self._random_in_range(-color_variation, color_variation))),
-            base_color[3]
-        )
+        base_color = config.color_start
+        colors = arrays.colors[rows]
+        np.clip(_uniform(-0.2, 0.2, rnd[:, 10:13]) + base_color[:3], 0.0, 1.0,
+                out=colors[:, :3])
+        colors[:, 3] = base_color[3]
+    
+    def _apply_effects(self, n: int, current_time: float) -> None:
+        """Apply twinkling effect to existing particles."""
+        arrays = self.arrays
+        if _USE_PARTICLE_KERNELS:
+            kernel = _specialized_kernel(_make_sparkle_kernel, self.brightness_variation,
+                                         self.config.color_start[3])
+            kernel(arrays.colors, arrays.life, arrays.rotation, n,
+                   self._twinkle_phase(current_time))
+            return
         
-        return Particle(
-            position=position,
-            velocity=velocity,
-            acceleration=self.config.acceleration,
-            color=color,
-            size=size,
-            life=1.0,
-            max_life=lifetime,
-            rotation=rotation,
-            angular_velocity=angular_velocity,
-            texture_index=0  # Sparkle texture index
-        )
+        # Create twinkling brightness variation
+        brightness = self._scratch_1d[:n]
+        np.add(arrays.rotation[:n], self._twinkle_phase(current_time), out=brightness)
+        np.sin(brightness, out=brightness)
+        brightness *= self.brightness_variation
+        brightness += 1.0
+        
+        # Apply brightness to alpha channel
+        brightness *= self.config.color_start[3]
+        np.multiply(brightness, arrays.life[:n], out=arrays.colors[:n, 3])
     
-    def update(self, delta_time: float) -> None:
-        """Update sparkle particles with twinkling effect."""
-        super().update(delta_time)
-        
-        # Apply twinkling effect to existing particles
-        current_time = time.time()
-        for particle in self.particles:
-            # Create twinkling brightness variation
-            twinkle_phase = current_time * self.twinkle_frequency + particle.rotation
-            brightness_factor = 1.0 + self.brightness_variation * math.sin(twinkle_phase)
-            
-            # Apply brightness to alpha channel
-            original_alpha = self.config.color_start[3]
-            particle.color = (
-                particle.color[0],
-                particle.color[1], 
-                particle.color[2],
-                original_alpha * brightness_factor * particle.life
-            )
+    def _twinkle_phase(self, current_time: float) -> float:
+        """Get the twinkle phase offset at current_time, wrapped to one period."""
+        return (current_time * self.twinkle_frequency) % _TWO_PI
+    
+    def gpu_effect_parameters(self, current_time: float) -> Optional[GpuEffectParameters]:
+        """Get the particle shader parameters for twinkling."""
+        phase = self._twinkle_phase(current_time)
+        return ((phase, float(self.brightness_variation), float(self.config.color_start[3]), 0.0),
+                0.0)
 
 
 class FireEmitter(BaseParticleEmitter):
     """Fire particle emitter with realistic particle behavior and coloring."""
     
-    def __init__(self, config: ParticleEmitterConfig):
-        super().__init__(config)
+    texture_index = 1  # Fire texture index
+    _spawn_columns = 10
+    
+    def __init__(self, config: ParticleEmitterConfig, seed: Optional[int] = None):
+        super().__init__(config, seed)
         self.heat_dissipation = 0.8  # How quickly fire cools
         self.flicker_intensity = 0.3  # Fire flicker strength
     
-    def create_particle(self) -> Particle:
-        """Create a fire particle with realistic behavior and coloring."""
-        pos_variance = self.config.position_variance
-        position = (
-            self.config.position[0] + self._random_in_range(-pos_variance[0], pos_variance[0]),
-            self.config.position[1],
-            self.config.position[2] + self._random_in_range(-pos_variance[2], pos_variance[2])
-        )
+    def _spawn_batch(self, arrays: ParticleArrays, start: int, rnd: np.ndarray) -> None:
+        """Spawn a batch of fire particles with one column of draws per random property."""
+        config = self.config
+        rows = slice(start, start + len(rnd))
         
-        base_velocity = self._random_vector_in_range(
-            self.config.velocity_min,
-            self.config.velocity_max
-        )
+        positions = arrays.positions[rows]
+        positions[:] = config.position
+        positions[:, 0] += _uniform(-config.position_variance[0], config.position_variance[0],
+                                    rnd[:, 0])
+        positions[:, 2] += _uniform(-config.position_variance[2], config.position_variance[2],
+                                    rnd[:, 1])
         
-        # Fire particles have strong upward movement with slight horizontal drift
-        velocity = (
-            base_velocity[0] * 0.4,  # Slight horizontal drift
-            abs(base_velocity[1]) + 20.0,  # Strong upward movement
-            base_velocity[2] * 0.4
-        )
+        # Strong upward movement with slight horizontal drift
+        velocity = arrays.velocities[rows]
+        velocity[:] = _uniform(config.velocity_min, config.velocity_max, rnd[:, 2:5])
+        velocity *= (0.4, 1.0, 0.4)
+        np.abs(velocity[:, 1], out=velocity[:, 1])
+        velocity[:, 1] += 20.0
+        arrays.accelerations[rows] = config.acceleration
         
-        lifetime = self._random_in_range(
-            self.config.lifetime_min,
-            self.config.lifetime_max
-        )
+        arrays.size[rows] = _uniform(config.size_min, config.size_max, rnd[:, 5])
+        self._spawn_shared(arrays, rows, rnd[:, 6:9], 1.0)
         
-        # Fire particles start larger and shrink as they cool
-        size = self._random_in_range(
-            self.config.size_min,
-            self.config.size_max
-        )
+        # Fire starts hot (red/orange) and cools to yellow/white
+        heat_factor = _uniform(0.7, 1.0, rnd[:, 9])
+        colors = arrays.colors[rows]
+        colors[:, 0] = 1.0
+        colors[:, 1] = 0.2 + 0.6 * heat_factor
+        colors[:, 2] = 0.3 * heat_factor
+        colors[:, 3] = config.color_start[3]
+    
+    def _apply_effects(self, n: int, current_time: float) -> None:
+        """Apply realistic cooling and flickering to existing fire particles."""
+        arrays = self.arrays
+        original_size = self._original_size()
+        if _USE_PARTICLE_KERNELS:
+            kernel = _specialized_kernel(_make_fire_kernel, self.heat_dissipation,
+                                         self.flicker_intensity, self.config.color_start[3],
+                                         original_size)
+            kernel(arrays.colors, arrays.size, arrays.life, arrays.rotation, n,
+                   self._flicker_phase(current_time))
+            return
         
-        rotation = self._random_in_range(0, 2 * math.pi)
-        angular_velocity = self._random_in_range(-1.0, 1.0)
+        life = arrays.life[:n]
+        colors = arrays.colors[:n]
+        red, green, blue = colors[:, 0], colors[:, 1], colors[:, 2]
         
-        # Fire starts hot (red/orange) and cools to yellow/white
-        heat_factor = self._random_in_range(0.7, 1.0)
-        color = (
-            1.0,  # Red component always high
-            0.2 + 0.6 * heat_factor,  # Green increases with heat
-            0.0 + 0.3 * heat_factor,  # Blue only at very high heat
-            self.config.color_start[3]
-        )
+        # Calculate cooling effect (particles get cooler as they age);
+        # heat level is life * (1 - age * heat_dissipation)
+        heat_level = np.subtract(1.0, life, out=self._scratch_1d[:n])
+        heat_level *= -self.heat_dissipation
+        heat_level += 1.0
+        heat_level *= life
         
-        return Particle(
-            position=position,
-            velocity=velocity,
-            acceleration=self.config.acceleration,
-            color=color,
-            size=size,
-            life=1.0,
-            max_life=lifetime,
-            rotation=rotation,
-            angular_velocity=angular_velocity,
-            texture_index=1  # Fire texture index
-        )
+        # Add flickering effect, kept in the red channel
+        np.multiply(arrays.rotation[:n], 2.0, out=red)
+        red += self._flicker_phase(current_time)
+        np.sin(red, out=red)
+        red *= self.flicker_intensity
+        red += 1.0
+        
+        # Fire color transition: Red -> Orange -> Yellow -> White (as it cools)
+        np.multiply(heat_level, 0.8, out=green)
+        green += 0.2
+        green *= red
+        np.subtract(heat_level, 0.5, out=blue)
+        np.maximum(blue, 0.0, out=blue)
+        blue *= 2.0
+        blue *= red
+        np.minimum(colors[:, :3], 1.0, out=colors[:, :3])
+        np.multiply(life, self.config.color_start[3], out=colors[:, 3])
+        
+        # Particles shrink as they cool
+        size = arrays.size[:n]
+        np.multiply(heat_level, 0.5, out=size)
+        size += 0.5
+        size *= original_size
     
-    def update(self, delta_time: float) -> None:
-        """Update fire particles with realistic cooling and flickering."""
-        super().update(delta_time)
-        
-        # Apply fire-specific effects to existing particles
-        current_time = time.time()
-        for particle in self.particles:
-            # Calculate cooling effect (particles get cooler as they age)
-            age_factor = 1.0 - particle.life
-            cooling = age_factor * self.heat_dissipation
-            
-            # Fire color transition: Red -> Orange -> Yellow -> White (as it cools)
-            heat_level = particle.life * (1.0 - cooling)
-            
-            # Add flickering effect
-            flicker_phase = current_time * 8.0 + particle.rotation * 2.0
-            flicker = 1.0 + self.flicker_intensity * math.sin(flicker_phase)
-            
-            # Update color based on heat level and flickering
-            red = 1.0 * flicker
-            green = (0.2 + 0.8 * heat_level) * flicker
-            blue = max(0.0, heat_level - 0.5) * 2.0 * flicker
-            
-            particle.color = (
-                min(1.0, red),
-                min(1.0, green),
-                min(1.0, blue),
-                particle.life * self.config.color_start[3]
-            )
-            
-            # Particles shrink as they cool
-            size_factor = 0.5 + 0.5 * heat_level
-            original_size = self.config.size_min + (self.config.size_max - self.config.size_min) * 0.5
-            particle.size = original_size * size_factor
+    def _flicker_phase(self, current_time: float) -> float:
+        """Get the flicker phase offset at current_time, wrapped to one period."""
+        return (current_time * 8.0) % _TWO_PI
+    
+    def gpu_effect_parameters(self, current_time: float) -> Optional[GpuEffectParameters]:
+        """Get the particle shader parameters for cooling and flickering."""
+        phase = self._flicker_phase(current_time)
+        return ((phase, float(self.flicker_intensity), float(self.config.color_start[3]),
+                 float(self._original_size())),
+                float(self.heat_dissipation))
 
 
 class SmokeEmitter(BaseParticleEmitter):
     """Smoke particle emitter with alpha blending and wind simulation."""
     
-    def __init__(self, config: ParticleEmitterConfig):
-        super().__init__(config)
+    texture_index = 2  # Smoke texture index
+    _spawn_columns = 13
+    
+    def __init__(self, config: ParticleEmitterConfig, seed: Optional[int] = None):
+        super().__init__(config, seed)
         self.wind_force = (15.0, 2.0, 0.0)  # Stronger horizontal wind
         self.turbulence_strength = 0.4  # Increased turbulence
         self.expansion_rate = 1.5  # How quickly smoke expands
         self.density_variation = 0.3  # Smoke density variation
     
-    def create_particle(self) -> Particle:
-        """Create a smoke particle with alpha blending and wind simulation."""
-        pos_variance = self.config.position_variance
-        position = (
-            self.config.position[0] + self._random_in_range(-pos_variance[0], pos_variance[0]),
-            self.config.position[1],
-            self.config.position[2] + self._random_in_range(-pos_variance[2], pos_variance[2])
-        )
+    def _spawn_batch(self, arrays: ParticleArrays, start: int, rnd: np.ndarray) -> None:
+        """Spawn a batch of smoke particles with one column of draws per random property."""
+        config = self.config
+        rows = slice(start, start + len(rnd))
         
-        velocity = self._random_vector_in_range(
-            self.config.velocity_min,
-            self.config.velocity_max
-        )
+        positions = arrays.positions[rows]
+        positions[:] = config.position
+        positions[:, 0] += _uniform(-config.position_variance[0], config.position_variance[0],
+                                    rnd[:, 0])
+        positions[:, 2] += _uniform(-config.position_variance[2], config.position_variance[2],
+                                    rnd[:, 1])
         
-        # Add stronger turbulence for realistic smoke behavior
-        turbulence = (
-            self._random_in_range(-self.turbulence_strength, self.turbulence_strength) * 20.0,
-            self._random_in_range(-self.turbulence_strength, self.turbulence_strength) * 10.0,
-            self._random_in_range(-self.turbulence_strength, self.turbulence_strength) * 20.0
-        )
+        arrays.velocities[rows] = _uniform(config.velocity_min, config.velocity_max, rnd[:, 2:5])
         
         # Combine base acceleration with wind and turbulence
-        acceleration = (
-            self.config.acceleration[0] + self.wind_force[0] + turbulence[0],
-            self.config.acceleration[1] + self.wind_force[1] + turbulence[1],
-            self.config.acceleration[2] + self.wind_force[2] + turbulence[2]
-        )
-        
-        lifetime = self._random_in_range(
-            self.config.lifetime_min,
-            self.config.lifetime_max
-        )
+        strength = self.turbulence_strength
+        acceleration = arrays.accelerations[rows]
+        acceleration[:] = _uniform(-strength, strength, rnd[:, 5:8])
+        acceleration *= (20.0, 10.0, 20.0)
+        acceleration += config.acceleration
+        acceleration += self.wind_force
         
         # Smoke starts small and expands
-        size = self._random_in_range(
-            self.config.size_min,
-            self.config.size_max
-        ) * 0.5  # Start smaller
-        
-        rotation = self._random_in_range(0, 2 * math.pi)
-        angular_velocity = self._random_in_range(-0.8, 0.8)
+        arrays.size[rows] = _uniform(config.size_min, config.size_max, rnd[:, 8]) * 0.5
+        self._spawn_shared(arrays, rows, rnd[:, 9:12], 0.8)
         
         # Smoke color with density variation
-        density = self._random_in_range(
-            1.0 - self.density_variation,
-            1.0 + self.density_variation
-        )
+        density = _uniform(1.0 - self.density_variation, 1.0 + self.density_variation,
+                           rnd[:, 12])
+        np.multiply(density[:, None], config.color_start, out=arrays.colors[rows])
+    
+    def update(self, delta_time: float, current_time: Optional[float] = None) -> None:
+        """Update smoke particles with expansion and wind effects."""
+        super().update(delta_time, current_time)
         
-        base_color = self.config.color_start
-        color = (
-            base_color[0] * density,
-            base_color[1] * density,
-            base_color[2] * density,
-            base_color[3] * density
-        )
+        arrays = self.arrays
+        n = arrays.active_count
+        if not n:
+            return
         
-        return Particle(
-            position=position,
-            velocity=velocity,
-            acceleration=acceleration,
-            color=color,
-            size=size,
-            life=1.0,
-            max_life=lifetime,
-            rotation=rotation,
-            angular_velocity=angular_velocity,
-            texture_index=2  # Smoke texture index
-        )
+        # Add continuous turbulence, a 10% chance per particle per frame,
+        # drawing the chance and the force for every particle at once
+        rnd = self._rng.random((n, 4), dtype=_PARTICLE_DTYPE)
+        kicked = np.flatnonzero(rnd[:, 0] < 0.1)
+        if kicked.size:
+            force = _uniform((-5.0, -2.0, -5.0), (5.0, 2.0, 5.0), rnd[kicked, 1:4])
+            arrays.velocities[kicked] += force * delta_time
     
-    def update(self, delta_time: float) -> None:
-        """Update smoke particles with expansion and wind effects."""
-        super().update(delta_time)
+    def _apply_effects(self, n: int, current_time: float) -> None:
+        """Grow and fade existing smoke particles with age."""
+        arrays = self.arrays
+        original_size = self._original_size()
+        if _USE_PARTICLE_KERNELS:
+            kernel = _specialized_kernel(_make_smoke_kernel, self.expansion_rate,
+                                         self.config.color_start[3], original_size)
+            kernel(arrays.colors, arrays.size, arrays.life, n)
+            return
         
-        # Apply smoke-specific effects to existing particles
-        for particle in self.particles:
-            # Smoke expands as it ages
-            age_factor = 1.0 - particle.life
-            expansion_factor = 1.0 + age_factor * self.expansion_rate
-            
-            # Calculate original size
-            original_size = self.config.size_min + (self.config.size_max - self.config.size_min) * 0.5
-            particle.size = original_size * expansion_factor * 0.5
-            
-            # Smoke becomes more transparent as it expands and ages
-            alpha_factor = particle.life * (1.0 - age_factor * 0.5)
-            
-            particle.color = (
-                particle.color[0],
-                particle.color[1],
-                particle.color[2],
-                self.config.color_start[3] * alpha_factor
-            )
-            
-            # Add continuous turbulence to existing particles
-            if np.random.random() < 0.1:  # 10% chance per frame
-                turbulence_force = (
-                    self._random_in_range(-5.0, 5.0),
-                    self._random_in_range(-2.0, 2.0),
-                    self._random_in_range(-5.0, 5.0)
-                )
-                
-                particle.velocity = (
-                    particle.velocity[0] + turbulence_force[0] * delta_time,
-                    particle.velocity[1] + turbulence_force[1] * delta_time,
-                    particle.velocity[2] + turbulence_force[2] * delta_time
-                )
+        # Smoke expands as it ages
+        age_factor = np.subtract(1.0, arrays.life[:n], out=self._scratch_1d[:n])
+        size = arrays.size[:n]
+        np.multiply(age_factor, self.expansion_rate, out=size)
+        size += 1.0
+        size *= original_size * 0.5
+        
+        # Smoke becomes more transparent as it expands and ages
+        alpha = arrays.colors[:n, 3]
+        np.multiply(age_factor, -0.5, out=alpha)
+        alpha += 1.0
+        alpha *= arrays.life[:n]
+        alpha *= self.config.color_start[3]
+    
+    def gpu_effect_parameters(self, current_time: float) -> Optional[GpuEffectParameters]:
+        """Get the particle shader parameters for expansion and fading."""
+        return ((0.0, 0.0, float(self.config.color_start[3]), float(self._original_size())),
+                float(self.expansion_rate))
     
     def set_wind_force(self, wind: Tuple[float, float, float]) -> None:
         """Set wind force affecting smoke particles."""
@@ -548,16 +778,31 @@ class ParticleRenderer:
         self.vao = 0
         self.vbo_vertices = 0
         self.vbo_instances = 0
-        self.particle_textures = []
+        self.particle_atlas = 0
         self.texture_paths = [
             "assets/textures/sparkle.png",
             "assets/textures/fire.png", 
             "assets/textures/smoke.png"
         ]
         self._is_initialized = False
+        # Instance data staged for upload, reused across frames
+        self._instance_buf = np.empty((self.max_particles, _INSTANCE_FLOATS), dtype=np.float32)
+        # Byte view of the same rows for the packed color
+        self._instance_bytes = self._instance_buf.view(np.uint8)
+        # Draw instances back to front so alpha blending composites correctly
+        self.depth_sort = True
+        # Host copy uploaded when the instance buffer cannot be mapped
+        self._upload_buf = np.empty_like(self._instance_buf)
+        # Camera uniform block contents, written once per frame
+        self._camera_ubo = 0
+        self._camera_block = np.zeros(_CAMERA_FLOATS, dtype=np.float32)
     
     def initialize(self) -> bool:
         """Initialize GPU resources for particle rendering."""
+        if gl is None:
+            print("Failed to initialize particle renderer: OpenGL is not available")
+            return False
+        
         try:
             # Load particle shader
             self.particle_shader = self.shader_manager.load_shader_program(
@@ -600,30 +845,58 @@ class ParticleRenderer:
             
             # Set up instance buffer
             gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.vbo_instances)
-            gl.glBufferData(gl.GL_ARRAY_BUFFER, self.max_particles * 9 * 4, None, gl.GL_DYNAMIC_DRAW)
+            gl.glBufferData(gl.GL_ARRAY_BUFFER, self._instance_buf.nbytes, None, gl.GL_STREAM_DRAW)
+            
+            stride = _INSTANCE_FLOATS * 4
             
             # Instance position (3 floats)
-            gl.glVertexAttribPointer(2, 3, gl.GL_FLOAT, gl.GL_FALSE, 9 * 4, None)
+            gl.glVertexAttribPointer(2, 3, gl.GL_FLOAT, gl.GL_FALSE, stride, None)
             gl.glEnableVertexAttribArray(2)
             gl.glVertexAttribDivisor(2, 1)
             
-            # Instance color (4 floats)
-            gl.glVertexAttribPointer(3, 4, gl.GL_FLOAT, gl.GL_FALSE, 9 * 4, gl.ctypes.c_void_p(3 * 4))
+            # Instance color (4 normalized unsigned bytes)
+            gl.glVertexAttribPointer(3, 4, gl.GL_UNSIGNED_BYTE, gl.GL_TRUE, stride, gl.ctypes.c_void_p(3 * 4))
             gl.glEnableVertexAttribArray(3)
             gl.glVertexAttribDivisor(3, 1)
             
             # Instance size (1 float)
-            gl.glVertexAttribPointer(4, 1, gl.GL_FLOAT, gl.GL_FALSE, 9 * 4, gl.ctypes.c_void_p(7 * 4))
+            gl.glVertexAttribPointer(4, 1, gl.GL_FLOAT, gl.GL_FALSE, stride, gl.ctypes.c_void_p(4 * 4))
             gl.glEnableVertexAttribArray(4)
             gl.glVertexAttribDivisor(4, 1)
             
             # Instance rotation (1 float)
-            gl.glVertexAttribPointer(5, 1, gl.GL_FLOAT, gl.GL_FALSE, 9 * 4, gl.ctypes.c_void_p(8 * 4))
+            gl.glVertexAttribPointer(5, 1, gl.GL_FLOAT, gl.GL_FALSE, stride, gl.ctypes.c_void_p(5 * 4))
             gl.glEnableVertexAttribArray(5)
             gl.glVertexAttribDivisor(5, 1)
             
-            # Create particle textures
-            self._create_particle_textures()
+            # Instance life (1 float)
+            gl.glVertexAttribPointer(6, 1, gl.GL_FLOAT, gl.GL_FALSE, stride, gl.ctypes.c_void_p(6 * 4))
+            gl.glEnableVertexAttribArray(6)
+            gl.glVertexAttribDivisor(6, 1)
+            
+            # Instance texture index (1 float)
+            gl.glVertexAttribPointer(7, 1, gl.GL_FLOAT, gl.GL_FALSE, stride, gl.ctypes.c_void_p(7 * 4))
+            gl.glEnableVertexAttribArray(7)
+            gl.glVertexAttribDivisor(7, 1)
+            
+            # Instance GPU effect slot (1 float)
+            gl.glVertexAttribPointer(8, 1, gl.GL_FLOAT, gl.GL_FALSE, stride, gl.ctypes.c_void_p(8 * 4))
+            gl.glEnableVertexAttribArray(8)
+            gl.glVertexAttribDivisor(8, 1)
+            
+            # Camera uniform block; GLSL 330 cannot declare the binding
+            # point, so the block is bound to it here
+            self._camera_ubo = gl.glGenBuffers(1)
+            gl.glBindBuffer(gl.GL_UNIFORM_BUFFER, self._camera_ubo)
+            gl.glBufferData(gl.GL_UNIFORM_BUFFER, self._camera_block.nbytes, None, gl.GL_DYNAMIC_DRAW)
+            gl.glBindBufferBase(gl.GL_UNIFORM_BUFFER, _CAMERA_BINDING, self._camera_ubo)
+            program_id = self.particle_shader.program_id
+            block_index = gl.glGetUniformBlockIndex(program_id, "Camera")
+            if block_index != gl.GL_INVALID_INDEX:
+                gl.glUniformBlockBinding(program_id, block_index, _CAMERA_BINDING)
+            
+            # Create the particle texture atlas
+            self._create_particle_atlas()
             
             self._is_initialized = True
             return True
@@ -632,116 +905,241 @@ class ParticleRenderer:
             print(f"Failed to initialize particle renderer: {e}")
             return False
     
-    def _create_particle_textures(self):
-        """Create procedural textures for different particle types."""
-        self.particle_textures = []
+    def _build_particle_atlas(self) -> np.ndarray:
+        """Lay the procedural particle textures out as atlas tiles by texture index."""
+        return np.concatenate([self._create_sparkle_texture(),
+                               self._create_fire_texture(),
+                               self._create_smoke_texture()], axis=1)
+    
+    def _create_particle_atlas(self):
+        """Create the texture atlas holding the procedural textures of every particle type."""
+        atlas = self._build_particle_atlas()
+        height, width = atlas.shape[:2]
         
-        for i, texture_path in enumerate(self.texture_paths):
-            texture_id = gl.glGenTextures(1)
-            gl.glBindTexture(gl.GL_TEXTURE_2D, texture_id)
-            
-            # Create procedural texture based on type
-            if i == 0:  # Sparkle
-                texture_data = self._create_sparkle_texture()
-            elif i == 1:  # Fire
-                texture_data = self._create_fire_texture()
-            else:  # Smoke
-                texture_data = self._create_smoke_texture()
-            
-            gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA, 64, 64, 0, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, texture_data)
-            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR)
-            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR)
-            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_S, gl.GL_CLAMP_TO_EDGE)
-            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_T, gl.GL_CLAMP_TO_EDGE)
-            
-            self.particle_textures.append(texture_id)
+        self.particle_atlas = gl.glGenTextures(1)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self.particle_atlas)
+        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA, width, height, 0, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, atlas)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_S, gl.GL_CLAMP_TO_EDGE)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_T, gl.GL_CLAMP_TO_EDGE)
+    
+    @staticmethod
+    def _texture_grid(size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Get the row index, x and y offsets from the center, and center distance of every texel."""
+        center = size // 2
+        y, x = np.mgrid[0:size, 0:size]
+        dx = x - center
+        dy = y - center
+        return y, dx, dy, np.sqrt(dx * dx + dy * dy)
     
     def _create_sparkle_texture(self) -> np.ndarray:
         """Create sparkle texture with star pattern."""
-        size = 64
+        size = _ATLAS_TILE_SIZE
         texture = np.zeros((size, size, 4), dtype=np.uint8)
         center = size // 2
+        _, dx, dy, dist = self._texture_grid(size)
         
-        for y in range(size):
-            for x in range(size):
-                dx = x - center
-                dy = y - center
-                dist = np.sqrt(dx*dx + dy*dy)
-                
-                # Create star pattern
-                angle = np.arctan2(dy, dx)
-                star_intensity = abs(np.cos(4 * angle)) * 0.7 + 0.3
-                
-                # Radial falloff
-                if dist < center:
-                    alpha = (1.0 - dist / center) * star_intensity
-                    texture[y, x] = [255, 255, 255, int(alpha * 255)]
+        # Create star pattern
+        star_intensity = np.abs(np.cos(4 * np.arctan2(dy, dx))) * 0.7 + 0.3
+        
+        # Radial falloff
+        inside = dist < center
+        alpha = (1.0 - dist[inside] / center) * star_intensity[inside]
+        texture[inside, :3] = 255
+        texture[inside, 3] = (alpha * 255).astype(np.uint8)
         
         return texture
     
     def _create_fire_texture(self) -> np.ndarray:
         """Create fire texture with flame pattern."""
-        size = 64
+        size = _ATLAS_TILE_SIZE
         texture = np.zeros((size, size, 4), dtype=np.uint8)
         center = size // 2
+        y, _, _, dist = self._texture_grid(size)
         
-        for y in range(size):
-            for x in range(size):
-                dx = x - center
-                dy = y - center
-                dist = np.sqrt(dx*dx + dy*dy)
-                
-                # Create flame shape (wider at bottom, narrower at top)
-                flame_width = center * (1.0 - y / size) * 0.8 + center * 0.2
-                
-                if dist < flame_width and dist < center:
-                    alpha = (1.0 - dist / flame_width) * (1.0 - y / size * 0.5)
-                    texture[y, x] = [255, 128, 0, int(alpha * 255)]
+        # Create flame shape (wider at bottom, narrower at top)
+        flame_width = center * (1.0 - y / size) * 0.8 + center * 0.2
+        
+        inside = (dist < flame_width) & (dist < center)
+        alpha = (1.0 - dist[inside] / flame_width[inside]) * (1.0 - y[inside] / size * 0.5)
+        texture[inside, :3] = (255, 128, 0)
+        texture[inside, 3] = (alpha * 255).astype(np.uint8)
         
         return texture
     
     def _create_smoke_texture(self) -> np.ndarray:
         """Create smoke texture with soft circular gradient."""
-        size = 64
+        size = _ATLAS_TILE_SIZE
         texture = np.zeros((size, size, 4), dtype=np.uint8)
         center = size // 2
+        _, _, _, dist = self._texture_grid(size)
         
-        for y in range(size):
-            for x in range(size):
-                dx = x - center
-                dy = y - center
-                dist = np.sqrt(dx*dx + dy*dy)
-                
-                # Soft circular gradient
-                if dist < center:
-                    alpha = (1.0 - dist / center) ** 2
-                    texture[y, x] = [128, 128, 128, int(alpha * 255)]
+        # Soft circular gradient
+        inside = dist < center
+        alpha = (1.0 - dist[inside] / center) ** 2
+        texture[inside, :3] = 128
+        texture[inside, 3] = (alpha * 255).astype(np.uint8)
         
         return texture
     
-    def render_particles(self, particles: List[Particle], view_matrix: np.ndarray, projection_matrix: np.ndarray):
-        """Render particles using instanced drawing."""
-        if not self._is_initialized or not particles:
+    def _stage_instances(self, particle_arrays: List[ParticleArrays],
+                         buffer: Optional[np.ndarray] = None,
+                         effect_slots: Optional[List[int]] = None) -> int:
+        """
+        Copy active particles into the instance staging buffer.
+        
+        Args:
+            particle_arrays: Particle storage of each emitter to draw
+            buffer: Instance rows to write, the staging buffer by default
+            effect_slots: GPU effect slot of each emitter, -1 for none; no
+                GPU effects by default
+            
+        Returns:
+            Number of instances staged, at most max_particles
+        """
+        if buffer is None:
+            buffer = self._instance_buf
+            instance_bytes = self._instance_bytes
+        else:
+            instance_bytes = buffer.view(np.uint8)
+        count = 0
+        for emitter_index, arrays in enumerate(particle_arrays):
+            n = min(arrays.active_count, self.max_particles - count)
+            if n <= 0:
+                continue
+            end = count + n
+            buffer[count:end, 0:3] = arrays.positions[:n]  # Position
+            buffer[count:end, 4] = arrays.size[:n]  # Size
+            buffer[count:end, 5] = arrays.rotation[:n]  # Rotation
+            buffer[count:end, 6] = arrays.life[:n]  # Life
+            buffer[count:end, 7] = arrays.texture_index[:n]  # Texture index
+            buffer[count:end, 8] = effect_slots[emitter_index] if effect_slots else -1.0
+            
+            instance_bytes[count:end, _INSTANCE_COLOR_BYTES] = arrays.rgba8[:n]  # Color
+            count = end
+        return count
+    
+    def update_camera(self, view_matrix: np.ndarray, projection_matrix: np.ndarray) -> None:
+        """
+        Write the camera matrices into the camera uniform block.
+        
+        Matrices are laid out as set_uniform uploads them, so the shader
+        sees the same view and projection as with plain uniforms.
+        
+        Args:
+            view_matrix: Camera view matrix
+            projection_matrix: Camera projection matrix
+        """
+        if not self._camera_ubo:
             return
         
-        # Prepare instance data
-        instance_data = []
-        for particle in particles:
-            instance_data.extend([
-                particle.position[0], particle.position[1], particle.position[2],  # Position
-                particle.color[0], particle.color[1], particle.color[2], particle.color[3],  # Color
-                particle.size,  # Size
-                particle.rotation  # Rotation
-            ])
-        
-        if not instance_data:
+        block = self._camera_block
+        block[0:16] = np.ravel(view_matrix)
+        block[16:32] = np.ravel(projection_matrix)
+        # The shader reads these row-major arrays transposed, so the
+        # product it needs is view @ projection
+        block[32:48] = np.ravel(np.dot(view_matrix, projection_matrix))
+        
+        gl.glBindBuffer(gl.GL_UNIFORM_BUFFER, self._camera_ubo)
+        gl.glBufferSubData(gl.GL_UNIFORM_BUFFER, 0, block.nbytes, block)
+    
+    def _sort_instances(self, instance_count: int, view_matrix: np.ndarray,
+                        out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Get the staged instances ordered back to front for alpha blending.
+        
+        Args:
+            instance_count: Number of staged instances
+            view_matrix: Camera view matrix, applied as view @ position
+            out: Rows to write the sorted instances to, the upload copy by default
+            
+        Returns:
+            Staged instances, farthest from the camera first
+        """
+        if out is None:
+            out = self._upload_buf[:instance_count]
+        staged = self._instance_buf[:instance_count]
+        # View-space z grows toward the camera; the translation term is the
+        # same for every particle and cannot change the order
+        depths = staged[:, 0:3] @ np.asarray(view_matrix, dtype=np.float32)[2, :3]
+        order = np.argsort(depths)
+        return np.take(staged, order, axis=0, out=out)
+    
+    def _write_instances(self, particle_arrays: List[ParticleArrays], instance_count: int,
+                         view_matrix: np.ndarray, out: np.ndarray,
+                         effect_slots: Optional[List[int]] = None) -> None:
+        """Write the instances to draw into out, back to front when depth sorting."""
+        if self.depth_sort:
+            self._stage_instances(particle_arrays, effect_slots=effect_slots)
+            self._sort_instances(instance_count, view_matrix, out)
+        else:
+            self._stage_instances(particle_arrays, out, effect_slots)
+    
+    def _map_instance_buffer(self, instance_count: int) -> Optional[np.ndarray]:
+        """
+        Map the bound instance buffer's first rows for writing, discarding its contents.
+        
+        Invalidating the whole buffer orphans the storage the previous
+        frame's draw reads from, so the mapping does not wait on it.
+        
+        Args:
+            instance_count: Number of instance rows to map
+            
+        Returns:
+            Array over the mapped driver memory, or None if mapping failed
+        """
+        size = instance_count * _INSTANCE_FLOATS
+        pointer = gl.glMapBufferRange(gl.GL_ARRAY_BUFFER, 0, size * 4,
+                                      gl.GL_MAP_WRITE_BIT | gl.GL_MAP_INVALIDATE_BUFFER_BIT)
+        address = getattr(pointer, 'value', pointer)
+        if not address:
+            return None
+        mapped = (ctypes.c_float * size).from_address(address)
+        return np.ctypeslib.as_array(mapped).reshape(instance_count, _INSTANCE_FLOATS)
+    
+    def render_particles(self, particle_arrays: List[ParticleArrays], view_matrix: np.ndarray,
+                         projection_matrix: np.ndarray,
+                         effect_parameters: Optional[List[GpuEffectParameters]] = None,
+                         effect_slots: Optional[List[int]] = None):
+        """
+        Render the active particles of each emitter using instanced drawing.
+        
+        Args:
+            particle_arrays: Particle storage of each emitter to draw
+            view_matrix: Camera view matrix
+            projection_matrix: Camera projection matrix
+            effect_parameters: Shader effect parameter table, at most
+                _MAX_EFFECT_SLOTS entries
+            effect_slots: Index into effect_parameters for each emitter whose
+                color and size effects run on the GPU, -1 for the others
+        """
+        if not self._is_initialized:
             return
         
-        instance_array = np.array(instance_data, dtype=np.float32)
+        instance_count = min(sum(arrays.active_count for arrays in particle_arrays),
+                             self.max_particles)
+        if not instance_count:
+            return
+        
+        self.update_camera(view_matrix, projection_matrix)
         
-        # Upload instance data
+        # Write instance data straight into fresh driver memory
         gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.vbo_instances)
-        gl.glBufferSubData(gl.GL_ARRAY_BUFFER, 0, instance_array.nbytes, instance_array)
+        mapped = self._map_instance_buffer(instance_count)
+        if mapped is not None:
+            self._write_instances(particle_arrays, instance_count, view_matrix, mapped,
+                                  effect_slots)
+            if not gl.glUnmapBuffer(gl.GL_ARRAY_BUFFER):
+                # The mapped contents were lost, e.g. on a display mode change
+                return
+        else:
+            # Upload a host copy into orphaned storage instead
+            instance_array = self._upload_buf[:instance_count]
+            self._write_instances(particle_arrays, instance_count, view_matrix, instance_array,
+                                  effect_slots)
+            gl.glBufferData(gl.GL_ARRAY_BUFFER, self._instance_buf.nbytes, None, gl.GL_STREAM_DRAW)
+            gl.glBufferSubData(gl.GL_ARRAY_BUFFER, 0, instance_array.nbytes, instance_array)
         
         # Set up rendering state
         gl.glEnable(gl.GL_BLEND)
@@ -753,19 +1151,21 @@ class ParticleRenderer:
         if shader_program:
             shader_program.use()
             
-            # Set uniforms
-            shader_program.set_uniform("viewMatrix", view_matrix)
-            shader_program.set_uniform("projectionMatrix", projection_matrix)
+            # Set uniforms; the camera matrices come from the camera block
+            for slot, (params, rate) in enumerate(effect_parameters or ()):
+                shader_program.set_uniform(f"effectParams[{slot}]", params)
+                shader_program.set_uniform(f"effectRates[{slot}]", rate)
         
-            # Bind texture (use first texture for now)
-            if self.particle_textures:
+            # Bind the atlas; each particle samples the tile of its texture index
+            if self.particle_atlas:
                 gl.glActiveTexture(gl.GL_TEXTURE0)
-                gl.glBindTexture(gl.GL_TEXTURE_2D, self.particle_textures[0])
+                gl.glBindTexture(gl.GL_TEXTURE_2D, self.particle_atlas)
                 shader_program.set_uniform("particleTexture", 0)
+                shader_program.set_uniform("useTexture", True)
         
         # Draw particles
         gl.glBindVertexArray(self.vao)
-        gl.glDrawArraysInstanced(gl.GL_TRIANGLES, 0, 6, len(particles))
+        gl.glDrawArraysInstanced(gl.GL_TRIANGLES, 0, 6, instance_count)
         
         # Restore state
         gl.glDepthMask(gl.GL_TRUE)
@@ -779,20 +1179,75 @@ class ParticleRenderer:
             gl.glDeleteBuffers(1, [self.vbo_vertices])
         if self.vbo_instances:
             gl.glDeleteBuffers(1, [self.vbo_instances])
-        if self.particle_textures:
-            gl.glDeleteTextures(len(self.particle_textures), self.particle_textures)
+        if self._camera_ubo:
+            gl.glDeleteBuffers(1, [self._camera_ubo])
+            self._camera_ubo = 0
+        if self.particle_atlas:
+            gl.glDeleteTextures(1, [self.particle_atlas])
+            self.particle_atlas = 0
         
         self._is_initialized = False
 
 
+# Default emitter physics per particle type, overridden by physics_parameters
+_EMITTER_DEFAULTS: Mapping[ParticleType, Mapping[str, Any]] = MappingProxyType({
+    ParticleType.SPARKLE: MappingProxyType({
+        'max_particles': 150,
+        'lifetime_min': 1.0,
+        'lifetime_max': 3.0,
+        'position_variance': (20.0, 20.0, 5.0),
+        'velocity_min': (-12.0, -8.0, -5.0),
+        'velocity_max': (12.0, 15.0, 5.0),
+        'acceleration': (0.0, -30.0, 0.0),  # Light gravity
+        'size_min': 4.0,
+        'size_max': 12.0,
+        'color_start': (1.0, 0.9, 0.7, 0.9),
+        'color_end': (1.0, 1.0, 1.0, 0.0)
+    }),
+    ParticleType.FIRE: MappingProxyType({
+        'max_particles': 250,
+        'lifetime_min': 0.8,
+        'lifetime_max': 1.8,
+        'position_variance': (10.0, 0.0, 10.0),
+        'velocity_min': (-20.0, 40.0, -20.0),
+        'velocity_max': (20.0, 100.0, 20.0),
+        'acceleration': (0.0, -20.0, 0.0),  # Reduced gravity for fire
+        'size_min': 8.0,
+        'size_max': 20.0,
+        'color_start': (1.0, 0.3, 0.0, 0.8),
+        'color_end': (1.0, 1.0, 0.2, 0.0)
+    }),
+    ParticleType.SMOKE: MappingProxyType({
+        'max_particles': 200,
+        'lifetime_min': 2.0,
+        'lifetime_max': 5.0,
+        'position_variance': (15.0, 0.0, 15.0),
+        'velocity_min': (-5.0, 15.0, -5.0),
+        'velocity_max': (5.0, 35.0, 5.0),
+        'acceleration': (0.0, -5.0, 0.0),  # Very light gravity for smoke
+        'size_min': 12.0,
+        'size_max': 30.0,
+        'color_start': (0.7, 0.7, 0.7, 0.6),
+        'color_end': (0.4, 0.4, 0.4, 0.0)
+    }),
+})
+_NO_DEFAULTS: Mapping[str, Any] = MappingProxyType({})
+
+
 class ParticleSystem:
     """Main particle system managing multiple emitters with enhanced effects."""
     
-    def __init__(self, shader_manager: ShaderManager):
+    def __init__(self, shader_manager: ShaderManager, seed: Optional[int] = None):
         self.shader_manager = shader_manager
         self.emitters: Dict[str, BaseParticleEmitter] = {}
+        # Seeds every emitter's generator, so a seeded system replays exactly
+        self._rng = np.random.default_rng(seed)
         self.effect_configs: Dict[str, ParticleEffect] = {}
         self.renderer = ParticleRenderer(shader_manager)
+        # Evaluate per-frame color and size effects in the particle shader
+        self.gpu_effects = False
+        # Frame time of the last update, shared by the emitters and the shader
+        self.current_time = 0.0
         self._is_initialized = False
     
     def initialize(self) -> bool:
@@ -814,16 +1269,19 @@ class ParticleSystem:
         try:
             emitter_config = self._create_emitter_config(effect_config, position)
             
+            seed = int(self._rng.integers(2 ** 32))
+            
             if effect_config.type == ParticleType.SPARKLE:
-                emitter = SparkleEmitter(emitter_config)
+                emitter = SparkleEmitter(emitter_config, seed)
             elif effect_config.type == ParticleType.FIRE:
-                emitter = FireEmitter(emitter_config)
+                emitter = FireEmitter(emitter_config, seed)
             elif effect_config.type == ParticleType.SMOKE:
-                emitter = SmokeEmitter(emitter_config)
+                emitter = SmokeEmitter(emitter_config, seed)
             else:
                 print(f"Unsupported particle type: {effect_config.type}")
                 return False
             
+            emitter.effects_on_gpu = self.gpu_effects
             self.emitters[emitter_id] = emitter
             self.effect_configs[emitter_id] = effect_config
             
@@ -838,56 +1296,10 @@ class ParticleSystem:
         """Create emitter configuration with physics parameters."""
         physics = effect_config.physics_parameters
         
-        # Default physics parameters for different particle types
-        if effect_config.type == ParticleType.SPARKLE:
-            defaults = {
-                'max_particles': 150,
-                'lifetime_min': 1.0,
-                'lifetime_max': 3.0,
-                'position_variance': (20.0, 20.0, 5.0),
-                'velocity_min': (-12.0, -8.0, -5.0),
-                'velocity_max': (12.0, 15.0, 5.0),
-                'acceleration': (0.0, -30.0, 0.0),  # Light gravity
-                'size_min': 4.0,
-                'size_max': 12.0,
-                'color_start': (1.0, 0.9, 0.7, 0.9),
-                'color_end': (1.0, 1.0, 1.0, 0.0)
-            }
-        elif effect_config.type == ParticleType.FIRE:
-            defaults = {
-                'max_particles': 250,
-                'lifetime_min': 0.8,
-                'lifetime_max': 1.8,
-                'position_variance': (10.0, 0.0, 10.0),
-                'velocity_min': (-20.0, 40.0, -20.0),
-                'velocity_max': (20.0, 100.0, 20.0),
-                'acceleration': (0.0, -20.0, 0.0),  # Reduced gravity for fire
-                'size_min': 8.0,
-                'size_max': 20.0,
-                'color_start': (1.0, 0.3, 0.0, 0.8),
-                'color_end': (1.0, 1.0, 0.2, 0.0)
-            }
-        elif effect_config.type == ParticleType.SMOKE:
-            defaults = {
-                'max_particles': 200,
-                'lifetime_min': 2.0,
-                'lifetime_max': 5.0,
-                'position_variance': (15.0, 0.0, 15.0),
-                'velocity_min': (-5.0, 15.0, -5.0),
-                'velocity_max': (5.0, 35.0, 5.0),
-                'acceleration': (0.0, -5.0, 0.0),  # Very light gravity for smoke
-                'size_min': 12.0,
-                'size_max': 30.0,
-                'color_start': (0.7, 0.7, 0.7, 0.6),
-                'color_end': (0.4, 0.4, 0.4, 0.0)
-            }
-        else:
-            defaults = {}
-        
-        # Override defaults with custom physics parameters
-        for key, value in physics.items():
-            if key in defaults:
-                defaults[key] = value
+        # Override the type's defaults with custom physics parameters
+        type_defaults = _EMITTER_DEFAULTS.get(effect_config.type, _NO_DEFAULTS)
+        defaults = {**type_defaults, **{key: value for key, value in physics.items()
+                                        if key in type_defaults}}
         
         return ParticleEmitterConfig(
             emission_rate=effect_config.emission_rate,
@@ -931,27 +1343,88 @@ class ParticleSystem:
             return True
         return False
     
-    def update(self, delta_time: float) -> None:
-        """Update all particle emitters and their physics simulation."""
+    def set_gpu_effects(self, enabled: bool) -> None:
+        """
+        Move per-frame particle color and size effects to the particle shader.
+        
+        Physics stays on the CPU. With GPU effects the emitters keep spawn
+        colors and sizes in their particle arrays, and each emitter's
+        particles are drawn with that emitter's own effect parameters.
+        
+        Args:
+            enabled: Whether the shader evaluates the effects
+        """
+        self.gpu_effects = enabled
+        for emitter in self.emitters.values():
+            emitter.effects_on_gpu = enabled
+    
+    def update(self, delta_time: float, current_time: Optional[float] = None) -> None:
+        """
+        Update all particle emitters and their physics simulation.
+        
+        Args:
+            delta_time: Seconds since the previous update
+            current_time: Monotonic frame time in seconds shared by every
+                emitter; sampled once from time.perf_counter when omitted
+        """
         if not self._is_initialized:
             return
         
+        if current_time is None:
+            current_time = time.perf_counter()
+        self.current_time = current_time
         for emitter in self.emitters.values():
-            emitter.update(delta_time)
+            emitter.update(delta_time, current_time)
     
     def render(self, view_matrix: np.ndarray, projection_matrix: np.ndarray) -> None:
         """Render all particles using GPU-based rendering."""
         if not self._is_initialized:
             return
         
-        # Collect all particles from all emitters
-        all_particles = []
-        for emitter in self.emitters.values():
-            all_particles.extend(emitter.particles)
+        # Render the particle storage of all emitters using the renderer
+        particle_arrays = [emitter.arrays for emitter in self.emitters.values()
+                           if emitter.arrays.active_count]
+        if not particle_arrays:
+            return
+        
+        effect_parameters, effect_slots = None, None
+        if self.gpu_effects:
+            effect_parameters, effect_slots = self._assign_effect_slots(
+                [emitter for emitter in self.emitters.values() if emitter.arrays.active_count])
+        self.renderer.render_particles(particle_arrays, view_matrix, projection_matrix,
+                                       effect_parameters, effect_slots)
+    
+    def _assign_effect_slots(self, emitters: List[BaseParticleEmitter]
+                             ) -> Tuple[List[GpuEffectParameters], List[int]]:
+        """
+        Build the shader effect parameter table for the emitters to draw.
+        
+        Emitters with equal parameters share a slot. Once the table is full,
+        further emitters apply their effects on the CPU for this frame.
         
-        # Render particles using the renderer
-        if all_particles:
-            self.renderer.render_particles(all_particles, view_matrix, projection_matrix)
+        Args:
+            emitters: Emitters to draw, in draw order
+            
+        Returns:
+            Parameter table and the slot of each emitter, -1 for none
+        """
+        table: List[GpuEffectParameters] = []
+        slot_of: Dict[GpuEffectParameters, int] = {}
+        slots = []
+        for emitter in emitters:
+            parameters = emitter.gpu_effect_parameters(self.current_time)
+            slot = -1
+            if parameters is not None:
+                slot = slot_of.get(parameters, -1)
+                if slot < 0 and len(table) < _MAX_EFFECT_SLOTS:
+                    slot = slot_of[parameters] = len(table)
+                    table.append(parameters)
+                elif slot < 0:
+                    n = emitter.arrays.active_count
+                    emitter._apply_effects(n, self.current_time)
+                    emitter.arrays.pack_colors(0, n)
+            slots.append(slot)
+        return table, slots
     
     def get_emitter_particle_count(self, emitter_id: str) -> int:
         """Get particle count for a specific emitter."""
@@ -960,7 +1433,7 @@ class ParticleSystem:
     
     def get_total_particle_count(self) -> int:
         """Get total number of active particles across all emitters."""
-        return sum(emitter.get_particle_count() for emitter in self.emitters.values())
+        return sum(emitter.arrays.active_count for emitter in self.emitters.values())
     
     def clear_all_particles(self) -> None:
         """Clear all particles from all emitters."""
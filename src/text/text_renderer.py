@@ -51,6 +51,8 @@ class TextVertex:
     position: Tuple[float, float, float]
     tex_coord: Tuple[float, float]
     color: Tuple[float, float, float, float]
+    # Per-element animation (offset_x, offset_y, progress, alpha)
+    animation: Tuple[float, float, float, float] = (0.0, 0.0, 0.0, 1.0)
 
 
 class TextMesh:
@@ -76,16 +78,17 @@ class TextMesh:
         
     def add_quad(self, x: float, y: float, width: float, height: float,
                  u1: float, v1: float, u2: float, v2: float,
-                 color: Tuple[float, float, float, float]) -> None:
+                 color: Tuple[float, float, float, float],
+                 animation: Tuple[float, float, float, float] = (0.0, 0.0, 0.0, 1.0)) -> None:
         """Add a textured quad to the mesh."""
         base_index = len(self.vertices)
         
         # Add vertices (bottom-left, bottom-right, top-right, top-left)
         self.vertices.extend([
-            TextVertex((x, y, 0.0), (u1, v2), color),                    # Bottom-left
-            TextVertex((x + width, y, 0.0), (u2, v2), color),           # Bottom-right
-            TextVertex((x + width, y + height, 0.0), (u2, v1), color),  # Top-right
-            TextVertex((x, y + height, 0.0), (u1, v1), color)           # Top-left
+            TextVertex((x, y, 0.0), (u1, v2), color, animation),                    # Bottom-left
+            TextVertex((x + width, y, 0.0), (u2, v2), color, animation),           # Bottom-right
+            TextVertex((x + width, y + height, 0.0), (u2, v1), color, animation),  # Top-right
+            TextVertex((x, y + height, 0.0), (u1, v1), color, animation)           # Top-left
         ])
         
         # Add indices for two triangles
@@ -105,6 +108,7 @@ class TextMesh:
             vertex_data.extend(vertex.position)
             vertex_data.extend(vertex.tex_coord)
             vertex_data.extend(vertex.color)
+            vertex_data.extend(vertex.animation)
             
         vertex_array = np.array(vertex_data, dtype=np.float32)
         index_array = np.array(self.indices, dtype=np.uint32)
@@ -127,7 +131,7 @@ class TextMesh:
         gl.glBufferData(gl.GL_ELEMENT_ARRAY_BUFFER, index_array.nbytes, index_array, gl.GL_DYNAMIC_DRAW)
         
         # Configure vertex attributes
-        stride = 9 * 4  # 3 position + 2 texcoord + 4 color floats
+        stride = 13 * 4  # 3 position + 2 texcoord + 4 color + 4 animation floats
         
         # Position attribute (location 0)
         gl.glVertexAttribPointer(0, 3, gl.GL_FLOAT, gl.GL_FALSE, stride, None)
@@ -141,6 +145,10 @@ class TextMesh:
         gl.glVertexAttribPointer(2, 4, gl.GL_FLOAT, gl.GL_FALSE, stride, gl.ctypes.c_void_p(5 * 4))
         gl.glEnableVertexAttribArray(2)
         
+        # Animation attribute (location 3)
+        gl.glVertexAttribPointer(3, 4, gl.GL_FLOAT, gl.GL_FALSE, stride, gl.ctypes.c_void_p(9 * 4))
+        gl.glEnableVertexAttribArray(3)
+        
         # Store counts
         self.vertex_count = len(self.vertices)
         self.index_count = len(self.indices)
@@ -207,17 +215,87 @@ class TextRenderer:
         layout (location = 0) in vec3 position;
         layout (location = 1) in vec2 texCoord;
         layout (location = 2) in vec4 color;
+        layout (location = 3) in vec4 animation;
         
         uniform mat4 projection;
         uniform mat4 model;
+        uniform vec2 slideOffset;
+        
+        // Color effect evaluated per vertex; the time-dependent values are
+        // computed once per frame by ColorEffectProcessor.to_shader_uniforms
+        uniform int colorEffectType;  // 0 none, 1 rainbow, 2 blend, 3 temperature
+        uniform float colorEffectHue;
+        uniform float colorEffectAmount;
+        uniform vec4 colorEffectTarget;
+        uniform vec3 colorEffectMultiplier;
         
         out vec2 TexCoord;
         out vec4 VertexColor;
         
+        vec3 rgbToHsv(vec3 c) {
+            float maxc = max(c.r, max(c.g, c.b));
+            float minc = min(c.r, min(c.g, c.b));
+            if (maxc == minc) {
+                return vec3(0.0, 0.0, maxc);
+            }
+            float range = maxc - minc;
+            vec3 rc = (vec3(maxc) - c) / range;
+            float h;
+            if (c.r == maxc) {
+                h = rc.b - rc.g;
+            } else if (c.g == maxc) {
+                h = 2.0 + rc.r - rc.b;
+            } else {
+                h = 4.0 + rc.g - rc.r;
+            }
+            return vec3(fract(h / 6.0), range / maxc, maxc);
+        }
+        
+        vec3 hsvToRgb(vec3 c) {
+            float h6 = c.x * 6.0;
+            float sector = floor(h6);
+            float f = h6 - sector;
+            float p = c.z * (1.0 - c.y);
+            float q = c.z * (1.0 - c.y * f);
+            float t = c.z * (1.0 - c.y * (1.0 - f));
+            int i = int(mod(sector, 6.0));
+            if (i == 0) return vec3(c.z, t, p);
+            if (i == 1) return vec3(q, c.z, p);
+            if (i == 2) return vec3(p, c.z, t);
+            if (i == 3) return vec3(p, q, c.z);
+            if (i == 4) return vec3(t, p, c.z);
+            return vec3(c.z, p, q);
+        }
+        
+        vec4 applyColorEffect(vec4 base) {
+            if (colorEffectType == 1) {
+                // Rainbow: rotate hue, keeping at least 80% saturation and 50% value
+                vec3 hsv = rgbToHsv(base.rgb);
+                float hue = colorEffectAmount < 1.0
+                    ? hsv.x + (colorEffectHue - hsv.x) * colorEffectAmount
+                    : colorEffectHue;
+                vec3 rgb = hsvToRgb(vec3(hue, max(hsv.y, 0.8), max(hsv.z, 0.5)));
+                if (colorEffectAmount < 1.0) {
+                    rgb = mix(base.rgb, rgb, colorEffectAmount);
+                }
+                return vec4(rgb, base.a);
+            } else if (colorEffectType == 2) {
+                // Pulse and strobe: blend toward a target color
+                return mix(base, colorEffectTarget, colorEffectAmount);
+            } else if (colorEffectType == 3) {
+                // Temperature: blend toward the tinted color
+                return vec4(mix(base.rgb, base.rgb * colorEffectMultiplier, colorEffectAmount), base.a);
+            }
+            return base;
+        }
+        
         void main() {
-            gl_Position = projection * model * vec4(position, 1.0);
+            // Animation offsets in pixels, applied before projection
+            vec2 offset = slideOffset + animation.xy;
+            gl_Position = projection * model * vec4(position + vec3(offset, 0.0), 1.0);
             TexCoord = texCoord;
-            VertexColor = color;
+            vec4 effectColor = applyColorEffect(color);
+            VertexColor = vec4(effectColor.rgb, effectColor.a * animation.w);
         }
         """
         
@@ -236,6 +314,7 @@ class TextRenderer:
         uniform vec4 shadowColor;
         uniform bool enableOutline;
         uniform bool enableShadow;
+        uniform float animationAlpha;
         
         void main() {
             // Sample the font atlas
@@ -278,6 +357,7 @@ class TextRenderer:
                 }
             }
             
+            finalColor.a *= animationAlpha;
             FragColor = finalColor;
         }
         """
@@ -308,7 +388,9 @@ class TextRenderer:
             [0.0, 0.0, 0.0, 1.0]
         ], dtype=np.float32)
         
-    def render_text(self, text: str, x: float, y: float, style: TextStyle) -> None:
+    def render_text(self, text: str, x: float, y: float, style: TextStyle,
+                    animation_uniforms: Optional[Dict[str, Any]] = None,
+                    color_uniforms: Optional[Dict[str, Any]] = None) -> None:
         """
         Render text at specified position with given style.
         
@@ -317,6 +399,11 @@ class TextRenderer:
             x: X position in pixels
             y: Y position in pixels
             style: Text styling parameters
+            animation_uniforms: Animation shader uniforms (slideOffset,
+                animationAlpha), e.g. from
+                AnimationEffectProcessor.to_shader_uniforms
+            color_uniforms: Color effect shader uniforms, e.g. from
+                ColorEffectProcessor.to_shader_uniforms
         """
         if not self._text_shader or not text:
             return
@@ -340,9 +427,44 @@ class TextRenderer:
         self._current_mesh.upload_to_gpu()
         
         # Render text
-        self._render_text_mesh(atlas, style)
+        self._render_text_mesh(atlas, style, animation_uniforms or {}, color_uniforms or {})
+        
+    def render_text_batch(self, texts: List[str], positions: List[Tuple[float, float]],
+                          style: TextStyle, animation_data: Optional[np.ndarray] = None,
+                          color_uniforms: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Render several texts sharing a style in one draw call.
+        
+        Args:
+            texts: Text strings to render
+            positions: (x, y) position of each text in pixels
+            style: Text styling parameters shared by all texts
+            animation_data: Optional (N, 4) per-text animation rows, e.g. from
+                AnimationEffectProcessor.batch_instance_data
+            color_uniforms: Color effect shader uniforms shared by all texts
+        """
+        if not self._text_shader or not texts:
+            return
+            
+        atlas = self.font_manager.get_font_atlas(style.font_path, style.font_size)
+        if not atlas:
+            logger.error(f"Font atlas not found: {style.font_path} at size {style.font_size}")
+            return
+            
+        self.font_manager.render_text_glyphs(style.font_path, style.font_size, "".join(texts))
+        self._current_mesh.clear()
         
-    def _generate_text_mesh(self, text: str, x: float, y: float, style: TextStyle, atlas: FontAtlas) -> None:
+        # Merge all texts into one mesh, tagging each with its animation row
+        rows = animation_data.tolist() if animation_data is not None else None
+        for index, (text, (x, y)) in enumerate(zip(texts, positions)):
+            animation = tuple(rows[index]) if rows is not None else (0.0, 0.0, 0.0, 1.0)
+            self._generate_text_mesh(text, x, y, style, atlas, animation)
+            
+        self._current_mesh.upload_to_gpu()
+        self._render_text_mesh(atlas, style, {}, color_uniforms or {})
+        
+    def _generate_text_mesh(self, text: str, x: float, y: float, style: TextStyle, atlas: FontAtlas,
+                            animation: Tuple[float, float, float, float] = (0.0, 0.0, 0.0, 1.0)) -> None:
         """Generate mesh data for text rendering."""
         current_x = x
         current_y = y
@@ -381,13 +503,15 @@ class TextRenderer:
             # Add quad for this glyph
             self._current_mesh.add_quad(
                 glyph_x, glyph_y, glyph.width, glyph.height,
-                u1, v1, u2, v2, style.color
+                u1, v1, u2, v2, style.color, animation
             )
             
             # Advance to next character position
             current_x += glyph.advance + style.character_spacing
             
-    def _render_text_mesh(self, atlas: FontAtlas, style: TextStyle) -> None:
+    def _render_text_mesh(self, atlas: FontAtlas, style: TextStyle,
+                          animation_uniforms: Dict[str, Any],
+                          color_uniforms: Dict[str, Any]) -> None:
         """Render the generated text mesh."""
         if not self._text_shader or not atlas.texture_id:
             return
@@ -415,6 +539,16 @@ class TextRenderer:
         self._text_shader.set_uniform("enableShadow", 
                                     style.shadow_offset[0] != 0.0 or style.shadow_offset[1] != 0.0)
         
+        # Set animation uniforms; effects are evaluated per vertex on the GPU
+        self._text_shader.set_uniform("slideOffset", animation_uniforms.get("slideOffset", (0.0, 0.0)))
+        self._text_shader.set_uniform("animationAlpha", float(animation_uniforms.get("animationAlpha", 1.0)))
+        
+        # Set color effect uniforms; unset effects leave vertex colors unchanged
+        self._text_shader.set_uniform("colorEffectType", int(color_uniforms.get("colorEffectType", 0)))
+        for name, value in color_uniforms.items():
+            if name != "colorEffectType":
+                self._text_shader.set_uniform(name, value)
+        
         # Render mesh
         self._current_mesh.render()
         
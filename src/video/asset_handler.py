@@ -268,12 +268,15 @@ class VideoAssetHandler:
         
         return metadata
     
-    def validate_video_file(self, path: str) -> ValidationResult:
+    def validate_video_file(self, path: str,
+                            file_stat: Optional[os.stat_result] = None) -> ValidationResult:
         """
         Validate video file format and accessibility.
         
         Args:
             path: Path to video file
+            file_stat: Stat result of the file if the caller already has one,
+                which then stands in for the existence and size checks
             
         Returns:
             ValidationResult with validation status and metadata
@@ -283,7 +286,7 @@ class VideoAssetHandler:
         metadata = {}
         
         # Check file existence
-        if not os.path.exists(path):
+        if file_stat is None and not os.path.exists(path):
             return ValidationResult(
                 is_valid=False,
                 error_message=f"Video file does not exist: {path}",
@@ -306,7 +309,7 @@ class VideoAssetHandler:
         
         # Check file size
         try:
-            file_size = os.path.getsize(path)
+            file_size = file_stat.st_size if file_stat is not None else os.path.getsize(path)
             metadata['file_size'] = file_size
             
             if file_size == 0:
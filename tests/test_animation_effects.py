@@ -4,6 +4,7 @@ Tests for animation effects implementation.
 
 import pytest
 import math
+import numpy as np
 from src.effects.animation_effects import (
     AnimationEffectProcessor, FadeEffect, SlideEffect, 
     TypewriterEffect, BounceEffect, AnimationState
@@ -12,6 +13,7 @@ from src.core.models import (
     AnimationEffect, AnimationType, EasingType, TextElement, Keyframe,
     InterpolationType
 )
+from src.core.keyframe_system import KeyframeSystem
 
 
 class TestAnimationEffectProcessor:
@@ -99,6 +101,34 @@ class TestAnimationEffectProcessor:
         with pytest.raises(ValueError, match="Unsupported animation type"):
             self.processor.create_effect(config)
     
+    def test_invalid_configuration_rejected_on_creation(self, caplog):
+        """Test that invalid configurations fail at creation and are logged once."""
+        negative = AnimationEffect(
+            type=AnimationType.FADE_IN, duration=-1.0, parameters={}, easing_curve=EasingType.LINEAR
+        )
+        malformed = AnimationEffect(
+            type=AnimationType.SLIDE_LEFT, duration=1.0,
+            parameters={'distance': 'far'}, easing_curve=EasingType.LINEAR
+        )
+        fade_config = AnimationEffect(
+            type=AnimationType.FADE_IN, duration=1.0, parameters={}, easing_curve=EasingType.LINEAR
+        )
+        
+        with pytest.raises(ValueError, match="Invalid duration"):
+            self.processor.create_effect(negative)
+        with pytest.raises(ValueError, match="Invalid parameters"):
+            self.processor.create_effect(malformed)
+        
+        with caplog.at_level("WARNING", logger="src.effects.animation_effects"):
+            for current_time in (0.25, 0.5, 0.75):
+                result = self.processor.apply_animation_effects(
+                    self.sample_text, [negative, malformed, fade_config],
+                    current_time=current_time, start_time=0.0
+                )
+                assert result['alpha'] == pytest.approx(current_time)
+        
+        assert len(caplog.records) == 2
+    
     def test_apply_single_animation_effect(self):
         """Test applying a single animation effect."""
         fade_config = AnimationEffect(
@@ -144,6 +174,265 @@ class TestAnimationEffectProcessor:
         assert 'alpha' in properties
         assert 'offset_x' in properties
     
+    def test_fused_fade_slide_matches_separate_effects(self):
+        """Test that the fused fade + slide path matches applying each effect."""
+        fade_config = AnimationEffect(
+            type=AnimationType.FADE_IN,
+            duration=2.0,
+            parameters={'fade_type': 'in_out'},
+            easing_curve=EasingType.EASE_IN
+        )
+        slide_config = AnimationEffect(
+            type=AnimationType.SLIDE_RIGHT,
+            duration=1.0,
+            parameters={'direction': 'right', 'distance': 60.0, 'slide_type': 'in'},
+            easing_curve=EasingType.EASE_OUT
+        )
+        
+        for current_time in (-0.5, 0.0, 0.5, 1.5, 3.0):
+            expected = {}
+            for config in (fade_config, slide_config):
+                expected.update(self.processor.apply_animation_effects(
+                    self.sample_text, [config], current_time=current_time, start_time=0.0
+                ))
+            for effects in ([fade_config, slide_config], [slide_config, fade_config]):
+                fused = self.processor.apply_animation_effects(
+                    self.sample_text, effects, current_time=current_time, start_time=0.0
+                )
+                assert fused == expected, current_time
+    
+    def test_effect_instances_cached_per_config(self):
+        """Test that effect instances are reused across frames for the same config."""
+        fade_config = AnimationEffect(
+            type=AnimationType.FADE_IN,
+            duration=2.0,
+            parameters={'fade_type': 'in'},
+            easing_curve=EasingType.LINEAR
+        )
+        
+        effect = self.processor.get_effect(fade_config)
+        assert self.processor.get_effect(fade_config) is effect
+        # The stateless keyframe helper is shared rather than allocated per effect
+        assert effect.keyframe_system is self.processor.keyframe_system
+        
+        for current_time in (0.5, 1.0, 1.5):
+            self.processor.apply_animation_effects(
+                self.sample_text, [fade_config], current_time=current_time, start_time=0.0
+            )
+        assert self.processor.get_effect(fade_config) is effect
+        
+        # An updated configuration gets its own instance
+        updated = self.processor.update_effect_parameters(fade_config, {'fade_type': 'out'})
+        assert self.processor.get_effect(updated) is not effect
+        
+        self.processor.clear_effect_cache()
+        assert self.processor.get_effect(fade_config) is not effect
+    
+    def test_finished_effects_reuse_final_properties(self):
+        """Test that finished effects reuse memoized end-state properties."""
+        bounce_config = AnimationEffect(
+            type=AnimationType.BOUNCE, duration=1.0,
+            parameters={'direction': 'both'}, easing_curve=EasingType.LINEAR
+        )
+        typewriter_config = AnimationEffect(
+            type=AnimationType.TYPEWRITER, duration=1.0, parameters={}, easing_curve=EasingType.LINEAR
+        )
+        bounce = self.processor.get_effect(bounce_config)
+        
+        first = self.processor.apply_animation_effects(
+            self.sample_text, [bounce_config, typewriter_config], current_time=2.0, start_time=0.0
+        )
+        assert bounce.final_properties(self.sample_text) is bounce.final_properties(self.sample_text)
+        assert first == {
+            **bounce.calculate_properties(1.0, self.sample_text),
+            **self.processor.get_effect(typewriter_config).calculate_properties(1.0, self.sample_text)
+        }
+        assert first['content'] == self.sample_text.content
+        
+        # The memo is keyed by the element inputs
+        moved = TextElement(
+            content=self.sample_text.content, font_family="Arial", font_size=24.0,
+            color=self.sample_text.color, position=(5.0, 6.0), rotation=(0.0, 0.0, 0.0), effects=[]
+        )
+        assert bounce.final_properties(moved) == bounce.calculate_properties(1.0, moved)
+        assert bounce.final_properties(moved) != bounce.final_properties(self.sample_text)
+    
+    def test_final_properties_accept_list_and_array_fields(self):
+        """Test that finished effects handle list and ndarray colors and positions."""
+        fade_config = AnimationEffect(
+            type=AnimationType.FADE_IN, duration=1.0, parameters={}, easing_curve=EasingType.LINEAR
+        )
+        fade = self.processor.get_effect(fade_config)
+        
+        for color, position in (([1.0, 1.0, 1.0, 1.0], [0.0, 0.0]),
+                                (np.array([1.0, 0.5, 0.0, 1.0]), np.array([10.0, 20.0]))):
+            element = TextElement(
+                content="Hello", font_family="Arial", font_size=24.0,
+                color=color, position=position, rotation=(0.0, 0.0, 0.0), effects=[]
+            )
+            properties = self.processor.apply_animation_effects(
+                element, [fade_config], current_time=2.0, start_time=0.0
+            )
+            assert properties['alpha'] == pytest.approx(fade.calculate_properties(1.0, element)['alpha'])
+            assert fade.final_properties(element) is fade.final_properties(element)
+        
+        # Fields that cannot be hashed even as tuples skip the memo
+        nested = TextElement(
+            content="Hello", font_family="Arial", font_size=24.0,
+            color=[1.0, 1.0, 1.0, 1.0], position=[[0.0], [0.0]], rotation=(0.0, 0.0, 0.0), effects=[]
+        )
+        assert fade.final_properties(nested) == fade.calculate_properties(1.0, nested)
+    
+    def test_shader_uniforms_match_cpu_properties(self):
+        """Test that shader uniforms reproduce the CPU-calculated effect."""
+        fade_config = AnimationEffect(
+            type=AnimationType.FADE_OUT, duration=1.0,
+            parameters={'fade_type': 'out'}, easing_curve=EasingType.LINEAR
+        )
+        slide_config = AnimationEffect(
+            type=AnimationType.SLIDE_UP, duration=1.0,
+            parameters={'direction': 'up', 'slide_type': 'through'}, easing_curve=EasingType.LINEAR
+        )
+        bounce_config = AnimationEffect(
+            type=AnimationType.BOUNCE, duration=1.0,
+            parameters={'direction': 'both'}, easing_curve=EasingType.LINEAR
+        )
+        typewriter_config = AnimationEffect(
+            type=AnimationType.TYPEWRITER, duration=1.0, parameters={}, easing_curve=EasingType.LINEAR
+        )
+        
+        for progress in (0.0, 0.3, 0.8):
+            fade = self.processor.to_shader_uniforms(fade_config, progress)
+            cpu = self.processor.get_effect(fade_config).calculate_properties(progress, self.sample_text)
+            assert fade == {'animationAlpha': pytest.approx(cpu['alpha'])}
+            
+            for config in (slide_config, bounce_config):
+                uniforms = self.processor.to_shader_uniforms(config, progress)
+                cpu = self.processor.get_effect(config).calculate_properties(progress, self.sample_text)
+                assert uniforms['slideOffset'] == pytest.approx((cpu['offset_x'], cpu['offset_y']))
+        
+        # Per-character reveal has no uniform equivalent
+        assert self.processor.to_shader_uniforms(typewriter_config, 0.5) is None
+    
+    def test_group_for_batching_and_instance_data(self):
+        """Test grouping by shared effects and per-element animation rows."""
+        def fade():
+            return AnimationEffect(AnimationType.FADE_IN, 1.0, {'fade_type': 'in'}, EasingType.LINEAR)
+        slide = AnimationEffect(AnimationType.SLIDE_LEFT, 1.0, {'distance': 50.0}, EasingType.LINEAR)
+        typewriter = AnimationEffect(AnimationType.TYPEWRITER, 1.0, {}, EasingType.LINEAR)
+        elements = [self.sample_text] * 5
+        
+        groups = self.processor.group_for_batching(
+            elements, [[fade(), slide], [fade(), slide], [slide], [typewriter], [fade(), slide]]
+        )
+        # Equal configurations group together even when they are distinct objects
+        assert sorted(groups.values()) == [[0, 1, 4], [2], [3]]
+        assert groups[None] == [3]
+        
+        starts = np.array([0.0, 0.5, 2.0])
+        data = self.processor.batch_instance_data([fade(), slide], 1.0, starts)
+        assert data.dtype == np.float32 and data.shape == (3, 4)
+        for row, start in zip(data, starts):
+            props = self.processor.apply_animation_effects(
+                self.sample_text, [fade(), slide], current_time=1.0, start_time=start
+            )
+            if not props:
+                assert row.tolist() == [0.0, 0.0, 0.0, 1.0]
+                continue
+            assert row[0] == pytest.approx(props['offset_x'])
+            assert row[1] == pytest.approx(props['offset_y'])
+            assert row[3] == pytest.approx(props['alpha'])
+        
+        with pytest.raises(ValueError, match="cannot be evaluated on the GPU"):
+            self.processor.batch_instance_data([typewriter], 1.0, starts)
+    
+    def test_effects_skipped_before_start(self):
+        """Test that effects are not resolved or evaluated before their start."""
+        fade_config = AnimationEffect(
+            type=AnimationType.FADE_IN, duration=1.0, parameters={}, easing_curve=EasingType.LINEAR
+        )
+        bounce_config = AnimationEffect(
+            type=AnimationType.BOUNCE, duration=1.0, parameters={}, easing_curve=EasingType.LINEAR
+        )
+        
+        result = self.processor.apply_animation_effects(
+            self.sample_text, [fade_config, bounce_config], current_time=0.5, start_time=1.0
+        )
+        assert result == {}
+        assert self.processor._effect_cache == {}
+        
+        # Active and finished effects are evaluated from the same timing window
+        active = self.processor.apply_animation_effects(
+            self.sample_text, [fade_config, bounce_config], current_time=1.5, start_time=1.0
+        )
+        assert active['alpha'] == pytest.approx(0.5)
+        finished = self.processor.apply_animation_effects(
+            self.sample_text, [fade_config, bounce_config], current_time=3.0, start_time=1.0
+        )
+        assert finished['alpha'] == 1.0
+    
+    def test_keyframe_interpolation_uses_sorted_cache(self):
+        """Test keyframe lookup across monotonic, seeking and edited timelines."""
+        keyframes = [
+            Keyframe(2.0, {'opacity': 1.0}, InterpolationType.LINEAR),
+            Keyframe(0.0, {'opacity': 0.0}, InterpolationType.LINEAR),
+            Keyframe(1.0, {'opacity': 0.5}, InterpolationType.LINEAR),
+        ]
+        
+        def opacity(current_time):
+            return self.processor.interpolate_keyframe_animations(
+                keyframes, current_time, self.sample_text
+            ).get('opacity')
+        
+        assert opacity(-1.0) == 0.0
+        assert opacity(0.5) == pytest.approx(0.25)
+        assert opacity(0.75) == pytest.approx(0.375)
+        assert opacity(1.0) == pytest.approx(0.5)
+        assert opacity(1.5) == pytest.approx(0.75)
+        assert opacity(3.0) == 1.0
+        # Seeking backwards
+        assert opacity(0.25) == pytest.approx(0.125)
+        
+        # Adding a keyframe invalidates the cached sort
+        keyframes.append(Keyframe(4.0, {'opacity': 0.0}, InterpolationType.LINEAR))
+        assert opacity(3.0) == pytest.approx(0.5)
+        assert self.processor.interpolate_keyframe_animations([], 1.0, self.sample_text) == {}
+    
+    def test_batch_matches_per_element_application(self):
+        """Test that batch application matches applying effects element by element."""
+        elements = [
+            TextElement(
+                content=f"Line {i}",
+                font_family="Arial",
+                font_size=24.0,
+                color=(1.0, 0.5, 0.25, 1.0),
+                position=(10.0 * i, 20.0 * i),
+                rotation=(0.0, 0.0, 0.0),
+                effects=[]
+            )
+            for i in range(6)
+        ]
+        start_times = [0.0, 0.5, 1.0, 1.5, 3.0, 5.0]
+        effects = [
+            AnimationEffect(AnimationType.FADE_IN, 2.0, {'fade_type': 'in_out'}, EasingType.EASE_IN_OUT),
+            AnimationEffect(AnimationType.SLIDE_UP, 2.0, {'direction': 'up', 'slide_type': 'through'},
+                            EasingType.BOUNCE),
+            AnimationEffect(AnimationType.TYPEWRITER, 1.0, {'show_cursor': False}, EasingType.LINEAR),
+            AnimationEffect(AnimationType.BOUNCE, 1.5, {'direction': 'both'}, EasingType.EASE_OUT),
+        ]
+        
+        for current_time in (0.0, 0.3, 0.7, 1.25, 2.5, 4.0):
+            batch = self.processor.apply_animation_effects_batch(elements, effects, current_time, start_times)
+            for element, start_time, properties in zip(elements, start_times, batch):
+                expected = self.processor.apply_animation_effects(element, effects, current_time, start_time)
+                assert properties.keys() == expected.keys()
+                for key, value in expected.items():
+                    assert properties[key] == pytest.approx(value), (current_time, key)
+        
+        # Elements whose animation has not started get no properties
+        batch = self.processor.apply_animation_effects_batch(elements, effects, 0.25, start_times)
+        assert batch[0] and batch[1] == {}
+    
     def test_update_effect_parameters(self):
         """Test real-time parameter updates."""
         config = AnimationEffect(
@@ -210,6 +499,8 @@ class TestFadeEffect:
         assert props_0['alpha'] == 0.0
         assert abs(props_50['alpha'] - 0.5) < 0.01
         assert props_100['alpha'] == 1.0
+        # RGB is carried over and only the alpha channel replaced
+        assert props_50['color'] == self.sample_text.color[:3] + (props_50['alpha'],)
     
     def test_fade_out_effect(self):
         """Test fade out animation."""
@@ -251,6 +542,26 @@ class TestFadeEffect:
         assert props_50['alpha'] == 1.0  # Peak at middle
         assert props_75['alpha'] < 1.0
         assert props_100['alpha'] == 0.0
+    
+    def test_fade_alpha_matches_property_interpolation(self):
+        """Test inlined fade alpha against generic property interpolation."""
+        for fade_type in ('in', 'out', 'in_out'):
+            effect = FadeEffect(AnimationEffect(
+                type=AnimationType.FADE_IN, duration=1.0,
+                parameters={'fade_type': fade_type, 'start_alpha': 0.2, 'end_alpha': 0.9},
+                easing_curve=EasingType.LINEAR
+            ))
+            for i in range(11):
+                progress = i / 10.0
+                if fade_type == 'in':
+                    expected = effect.interpolate_property(0.2, 0.9, progress)
+                elif fade_type == 'out':
+                    expected = effect.interpolate_property(0.9, 0.2, progress)
+                elif progress <= 0.5:
+                    expected = effect.interpolate_property(0.2, 0.9, progress * 2.0)
+                else:
+                    expected = effect.interpolate_property(0.9, 0.2, (progress - 0.5) * 2.0)
+                assert effect.calculate_alpha(progress) == pytest.approx(expected)
 
 
 class TestSlideEffect:
@@ -325,6 +636,68 @@ class TestSlideEffect:
         assert props_0['position'][1] > self.sample_text.position[1]  # Start below
         assert abs(props_50['position'][1] - self.sample_text.position[1]) < 0.01  # Middle at original
         assert props_100['position'][1] < self.sample_text.position[1]  # End above
+    
+    def test_slide_parameters_resolved_at_construction(self):
+        """Test slide geometry resolved at construction, including fallbacks."""
+        config = AnimationEffect(
+            type=AnimationType.SLIDE_DOWN,
+            duration=1.0,
+            parameters={'direction': 'down', 'distance': 80.0, 'slide_type': 'in'},
+            easing_curve=EasingType.LINEAR
+        )
+        props = SlideEffect(config).calculate_properties(0.25, self.sample_text)
+        assert props['offset_x'] == 0.0
+        assert props['offset_y'] == pytest.approx(60.0)
+        
+        # Unknown slide types leave the element in place
+        config.parameters['slide_type'] = 'sideways'
+        props = SlideEffect(config).calculate_properties(0.25, self.sample_text)
+        assert props['offset_x'] == 0.0 and props['offset_y'] == 0.0
+        assert props['position'] == self.sample_text.position
+    
+    def test_slide_offsets_for_all_directions_and_types(self):
+        """Test folded slide offsets against the slide definitions."""
+        directions = {'left': (-1.0, 0.0), 'right': (1.0, 0.0), 'up': (0.0, -1.0), 'down': (0.0, 1.0)}
+        fractions = {
+            'in': lambda p: 1.0 - p,
+            'out': lambda p: p,
+            'through': lambda p: (p - 0.5) * 2.0,
+        }
+        for direction, (dx, dy) in directions.items():
+            for slide_type, fraction in fractions.items():
+                effect = SlideEffect(AnimationEffect(
+                    type=AnimationType.SLIDE_LEFT, duration=1.0,
+                    parameters={'direction': direction, 'distance': 120.0, 'slide_type': slide_type},
+                    easing_curve=EasingType.LINEAR
+                ))
+                for progress in (0.0, 0.3, 0.5, 1.0):
+                    props = effect.calculate_properties(progress, self.sample_text)
+                    amount = 120.0 * fraction(progress)
+                    assert props['offset_x'] == pytest.approx(dx * amount)
+                    assert props['offset_y'] == pytest.approx(dy * amount)
+                    assert props['position'] == pytest.approx((200.0 + dx * amount, 300.0 + dy * amount))
+    
+    def test_parameters_resolved_to_attributes(self):
+        """Test that effect parameters are converted to attributes on construction."""
+        slide = SlideEffect(AnimationEffect(
+            type=AnimationType.SLIDE_UP, duration=1.0,
+            parameters={'direction': 'up', 'distance': 40}, easing_curve=EasingType.LINEAR
+        ))
+        assert (slide.direction, slide.distance, slide.slide_type) == ('up', 40.0, 'in')
+        assert isinstance(slide.distance, float)
+        
+        fade = FadeEffect(AnimationEffect(
+            type=AnimationType.FADE_OUT, duration=1.0,
+            parameters={'fade_type': 'out', 'end_alpha': 1}, easing_curve=EasingType.LINEAR
+        ))
+        assert (fade.fade_type, fade.start_alpha, fade.end_alpha) == ('out', 0.0, 1.0)
+        
+        bounce = BounceEffect(AnimationEffect(
+            type=AnimationType.BOUNCE, duration=1.0,
+            parameters={'bounce_count': '2', 'direction': 'both'}, easing_curve=EasingType.LINEAR
+        ))
+        assert bounce.bounce_count == 2
+        assert bounce.gravity == 980.0
 
 
 class TestTypewriterEffect:
@@ -380,6 +753,32 @@ class TestTypewriterEffect:
         # Should have cursor when animation is active
         assert '|' in props_50['content'] or len(props_50['content']) > 0
         assert props_50['visible_chars'] < len(self.sample_text.content)
+    
+    def test_typewriter_speed_curves_and_blink(self):
+        """Test typing speed curves, cursor blink phases and reuse across elements."""
+        def make(typing_speed):
+            return TypewriterEffect(AnimationEffect(
+                type=AnimationType.TYPEWRITER,
+                duration=1.0,
+                parameters={'typing_speed': typing_speed, 'cursor_blink_rate': 2.0},
+                easing_curve=EasingType.LINEAR
+            ))
+        
+        assert make('accelerate').calculate_properties(0.5, self.sample_text)['typing_progress'] == 0.25
+        assert make('decelerate').calculate_properties(0.5, self.sample_text)['typing_progress'] == 0.75
+        assert make('unknown').calculate_properties(0.5, self.sample_text)['typing_progress'] == 0.5
+        
+        # Two blinks per second over one second: cursor shown in [0, 0.25) and [0.5, 0.75)
+        effect = make('linear')
+        assert effect.calculate_properties(0.1, self.sample_text)['content'].endswith('|')
+        assert not effect.calculate_properties(0.3, self.sample_text)['content'].endswith('|')
+        assert effect.calculate_properties(0.6, self.sample_text)['content'].endswith('|')
+        
+        # The cached slice follows the element being animated
+        other = TextElement("Other text!!", "Courier", 16.0, (1.0, 1.0, 1.0, 1.0),
+                            (0.0, 0.0), (0.0, 0.0, 0.0), [])
+        assert effect.calculate_properties(0.3, other)['content'] == "Oth"
+        assert effect.calculate_properties(0.3, self.sample_text)['content'] == "Hel"
 
 
 class TestBounceEffect:
@@ -443,9 +842,77 @@ class TestBounceEffect:
         assert pos_mid >= 0.0  # Should be above ground during bounce
 
 
+    def test_bounce_horizontal_oscillation(self):
+        """Test horizontal bounce oscillation against its definition."""
+        config = AnimationEffect(
+            type=AnimationType.BOUNCE, duration=1.0,
+            parameters={'direction': 'horizontal', 'bounce_height': 40.0, 'bounce_count': 2},
+            easing_curve=EasingType.LINEAR
+        )
+        effect = BounceEffect(config)
+        
+        for progress in (0.0, 0.1, 0.33, 0.5, 0.9):
+            expected = 40.0 * 0.3 * math.sin(progress * 2 * 2.0 * 2 * math.pi) * (1.0 - progress)
+            props = effect.calculate_properties(progress, self.sample_text)
+            assert props['offset_x'] == pytest.approx(expected, abs=1e-9)
+            assert props['offset_y'] == 0.0
+    
+    def test_bounce_segment_lookup_matches_simulation(self):
+        """Test the precomputed bounce segments against a step-by-step simulation."""
+        def simulate(time, height, gravity, damping, bounce_count):
+            if time <= 0:
+                return 0.0
+            bounce_time = math.sqrt(2 * height / gravity) * 2
+            total_time = 0.0
+            current_height = height
+            for _ in range(bounce_count + 1):
+                if time <= total_time + bounce_time:
+                    local_time = time - total_time
+                    if local_time <= bounce_time / 2:
+                        pos = current_height * local_time / (bounce_time / 2) - 0.5 * gravity * local_time ** 2
+                    else:
+                        t = local_time - bounce_time / 2
+                        pos = current_height - 0.5 * gravity * t * t
+                    return max(0.0, pos)
+                total_time += bounce_time
+                current_height *= damping
+                bounce_time = math.sqrt(2 * current_height / gravity) * 2
+                if current_height < 0.1:
+                    break
+            return 0.0
+        
+        effect = BounceEffect(AnimationEffect(
+            type=AnimationType.BOUNCE,
+            duration=1.5,
+            parameters={'bounce_height': 50.0, 'gravity': 980.0, 'damping': 0.8, 'bounce_count': 3},
+            easing_curve=EasingType.LINEAR
+        ))
+        params = (50.0, 980.0, 0.8, 3)
+        times = [i * 0.01 for i in range(150)]
+        # Forward playback, then scrubbing backwards, then other physics
+        for time in times + times[::-1]:
+            assert effect._calculate_bounce_position(time, *params) == pytest.approx(simulate(time, *params))
+        for time in times:
+            assert effect._calculate_bounce_position(time, 20.0, 500.0, 0.5, 5) == pytest.approx(
+                simulate(time, 20.0, 500.0, 0.5, 5))
+
+
 class TestAnimationState:
     """Test cases for AnimationState and timing."""
     
+    def test_states_and_effects_use_slots(self):
+        """Test that per-frame objects carry no instance dictionary."""
+        effect = FadeEffect(AnimationEffect(
+            type=AnimationType.FADE_IN, duration=1.0, parameters={}, easing_curve=EasingType.LINEAR
+        ))
+        state = effect.get_animation_state(0.5, 0.0)
+        
+        assert not hasattr(state, '__dict__')
+        assert not hasattr(effect, '__dict__')
+        assert state.progress == pytest.approx(0.5)
+        with pytest.raises(AttributeError):
+            effect.unknown_attribute = 1
+    
     def test_animation_timing(self):
         """Test animation timing and state calculation."""
         config = AnimationEffect(
@@ -498,6 +965,51 @@ class TestAnimationState:
         # Ease-in should have slower progress at 50% time
         assert state_linear.progress == 0.5
         assert state_ease_in.progress < 0.5
+    
+    def test_easing_table_matches_keyframe_system(self):
+        """Test that the effect easing table matches KeyframeSystem easing."""
+        keyframe_system = KeyframeSystem()
+        
+        for easing in EasingType:
+            effect = FadeEffect(AnimationEffect(
+                type=AnimationType.FADE_IN,
+                duration=1.0,
+                parameters={},
+                easing_curve=easing
+            ))
+            for i in range(21):
+                t = i / 20.0
+                expected = keyframe_system._apply_easing(t, easing)
+                assert effect._apply_easing(t, easing) == pytest.approx(expected, abs=1e-3)
+                if 0.0 < t < 1.0:
+                    assert effect.get_animation_state(t, 0.0).progress == pytest.approx(expected, abs=1e-3)
+    
+    def test_easing_lookup_tables(self):
+        """Test lookup-table easing against exact evaluation."""
+        keyframe_system = KeyframeSystem()
+        
+        for easing in (EasingType.BOUNCE, EasingType.ELASTIC):
+            approximate = FadeEffect(AnimationEffect(
+                type=AnimationType.FADE_IN, duration=1.0, parameters={}, easing_curve=easing
+            ))
+            exact = FadeEffect(AnimationEffect(
+                type=AnimationType.FADE_IN, duration=1.0,
+                parameters={'exact_easing': True}, easing_curve=easing
+            ))
+            times = np.linspace(0.0, 0.999, 97)
+            
+            for t in times:
+                expected = keyframe_system._apply_easing(t, easing)
+                assert exact.get_progress(t, 0.0) == pytest.approx(expected)
+                assert approximate.get_progress(t, 0.0) == pytest.approx(expected, abs=1e-3)
+            
+            # Batch evaluation interpolates the same table
+            _, batch = approximate.get_progress_batch(1.0, 1.0 - times)
+            expected = [approximate.get_progress(t, 0.0) for t in times]
+            np.testing.assert_allclose(batch, expected, atol=1e-9)
+            # Table endpoints stay exact
+            assert approximate._apply_easing(0.0, easing) == pytest.approx(0.0, abs=1e-12)
+            assert approximate._apply_easing(1.0, easing) == pytest.approx(1.0)
 
 
 if __name__ == "__main__":
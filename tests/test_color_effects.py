@@ -4,11 +4,13 @@ Tests for color effects implementation.
 
 import pytest
 import math
+import numpy as np
 from unittest.mock import Mock, patch
 
 from src.effects.color_effects import (
     ColorEffectProcessor, RainbowEffect, PulseEffect, StrobeEffect,
-    ColorTemperatureEffect, BaseColorEffect, ColorState
+    ColorTemperatureEffect, BaseColorEffect, ColorState,
+    _hsv_to_rgb_np, _rgb_to_hsv_np, _blackbody_multipliers_np
 )
 from src.core.models import ColorEffect, TextElement
 
@@ -35,6 +37,20 @@ class TestBaseColorEffect:
         assert state.progress == 0.0
         assert state.cycle_count == 0
     
+    def test_get_color_matches_state_color(self):
+        """Test that the fast color path matches the full state and starts the clock."""
+        config = ColorEffect(type='rainbow', speed=1.0, intensity=0.7)
+        effect = RainbowEffect(config)
+        base_color = (0.2, 0.6, 0.4, 1.0)
+        
+        assert effect.get_color(1.5, base_color) == effect.calculate_color(1.5, base_color)
+        assert effect._start_time == 1.5
+        
+        state = effect.get_color_state(2.25, base_color)
+        assert state.current_color == effect.get_color(2.25, base_color)
+        assert state.progress == pytest.approx(0.75)
+        assert state.cycle_count == 0
+    
     def test_bpm_time_calculation(self):
         """Test BPM-synchronized time calculation."""
         config = ColorEffect(type='test', speed=1.0, intensity=1.0, bpm_sync=True, bpm=120.0)
@@ -74,6 +90,26 @@ class TestBaseColorEffect:
         assert abs(rgb[1] - 1.0) < 0.001
         assert abs(rgb[2] - 0.0) < 0.001
     
+    def test_vectorized_hsv_conversion_matches_colorsys(self):
+        """Test NumPy HSV conversions against colorsys."""
+        import colorsys
+        
+        rng = np.random.default_rng(7)
+        rgb = np.vstack([rng.random((200, 3)),
+                         [(0.0, 0.0, 0.0), (1.0, 1.0, 1.0), (1.0, 0.0, 0.0),
+                          (0.0, 1.0, 0.0), (0.0, 0.0, 1.0), (1.0, 1.0, 0.0)]])
+        hsv = np.column_stack(_rgb_to_hsv_np(rgb[:, 0], rgb[:, 1], rgb[:, 2]))
+        expected_hsv = np.array([colorsys.rgb_to_hsv(*color) for color in rgb])
+        assert np.allclose(hsv, expected_hsv, atol=1e-12)
+        
+        hue = rng.random(200) * 2.0 - 0.5
+        saturation = rng.random(200)
+        value = rng.random(200)
+        converted = np.column_stack(_hsv_to_rgb_np(hue, saturation, value))
+        expected_rgb = np.array([colorsys.hsv_to_rgb(*hsv_color)
+                                 for hsv_color in zip(hue, saturation, value)])
+        assert np.allclose(converted, expected_rgb, atol=1e-12)
+    
     def test_color_interpolation(self):
         """Test color interpolation."""
         config = ColorEffect(type='test', speed=1.0, intensity=1.0)
@@ -93,6 +129,42 @@ class TestBaseColorEffect:
         
         for i in range(4):
             assert abs(result[i] - expected[i]) < 0.001
+        
+        # Arrays broadcast across rows
+        colors = np.array([color1, color2])
+        result = effect._interpolate_color(colors, np.array(color2), 0.5)
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == [[0.5, 0.5, 0.0, 1.0], [0.0, 1.0, 0.0, 1.0]]
+    
+    def test_linear_light_interpolation(self):
+        """Test opt-in interpolation in linear light."""
+        config = ColorEffect(type='test', speed=1.0, intensity=1.0)
+        
+        class MockEffect(BaseColorEffect):
+            def calculate_color(self, current_time, base_color):
+                return base_color
+        
+        effect = MockEffect(config)
+        black = (0.0, 0.0, 0.0, 0.0)
+        white = (1.0, 1.0, 1.0, 1.0)
+        assert effect._interpolate_color(black, white, 0.5) == pytest.approx((0.5, 0.5, 0.5, 0.5))
+        
+        effect.update_parameters({'linear_light': True})
+        assert effect.linear_light is True
+        
+        # Half the light of white encodes to about 0.735 in sRGB; alpha stays linear
+        result = effect._interpolate_color(black, white, 0.5)
+        assert result == pytest.approx((0.7354, 0.7354, 0.7354, 0.5), abs=1e-4)
+        assert effect._interpolate_color(black, white, 0.0) == pytest.approx(black)
+        assert effect._interpolate_color(black, white, 1.0) == pytest.approx(white)
+        
+        # The array form uses the lookup tables and agrees closely
+        colors = np.array([black, (0.2, 0.4, 0.6, 1.0)], dtype=np.float32)
+        blended = effect._interpolate_color(colors, np.array(white, dtype=np.float32), 0.5)
+        assert blended.dtype == np.float32
+        for row, color in enumerate(colors.tolist()):
+            expected = effect._interpolate_color(tuple(color), white, 0.5)
+            assert blended[row] == pytest.approx(expected, abs=1e-3)
     
     def test_parameter_updates(self):
         """Test parameter updates."""
@@ -116,6 +188,24 @@ class TestBaseColorEffect:
         effect.update_parameters({'bpm_sync': True, 'bpm': 140.0})
         assert effect.config.bpm_sync is True
         assert effect.config.bpm == 140.0
+        
+        # Derived timing constants follow the updates
+        assert effect._inv_cycle_duration == 2.0
+        assert effect._cycle_duration == 0.5
+        assert effect._beats_per_second == pytest.approx(140.0 / 60.0)
+        assert effect._get_bpm_time(0.25) == pytest.approx((0.25 * 140.0 / 60.0) % 1.0)
+        assert effect._phase(0.25) == pytest.approx((0.25 * 2.0 * 140.0 / 60.0) % 1.0)
+
+    
+    def test_effects_and_state_use_slots(self):
+        """Test that effect instances and color states carry no attribute dict."""
+        for effect_class, effect_type in ((RainbowEffect, 'rainbow'), (PulseEffect, 'pulse'),
+                                          (StrobeEffect, 'strobe'),
+                                          (ColorTemperatureEffect, 'temperature')):
+            effect = effect_class(ColorEffect(type=effect_type, speed=1.0, intensity=1.0))
+            assert not hasattr(effect, '__dict__')
+            state = effect.get_color_state(0.25, (0.5, 0.5, 0.5, 1.0))
+            assert not hasattr(state, '__dict__')
 
 
 class TestRainbowEffect:
@@ -157,6 +247,35 @@ class TestRainbowEffect:
         assert result[1] > 0.0  # Should have some green
 
 
+    def test_scalar_and_batch_rainbow_agree(self):
+        """Test the scalar rainbow kernel against the vectorized path."""
+        rng = np.random.default_rng(3)
+        base_colors = np.vstack([rng.random((50, 4)),
+                                 [(0.0, 0.0, 0.0, 1.0), (1.0, 1.0, 1.0, 1.0),
+                                  (0.0, 0.6, 0.6, 1.0), (0.2, 0.2, 0.9, 0.5)]])
+        
+        for intensity in (1.0, 0.4):
+            effect = RainbowEffect(ColorEffect(type='rainbow', speed=0.7, intensity=intensity))
+            for current_time in (0.0, 0.3, 2.9):
+                batch = effect.calculate_color_batch(current_time, base_colors)
+                for row, color in enumerate(base_colors.tolist()):
+                    scalar = effect.calculate_color(current_time, tuple(color))
+                    assert scalar == pytest.approx(tuple(batch[row]), abs=1e-9)
+
+
+    def test_full_intensity_matches_hsv_reference(self):
+        """Test the full-intensity shortcut against a colorsys round trip."""
+        import colorsys
+        
+        effect = RainbowEffect(ColorEffect(type='rainbow', speed=1.0, intensity=1.0))
+        rng = np.random.default_rng(11)
+        for color in rng.random((30, 4)).tolist() + [[0.3, 0.3, 0.3, 1.0]]:
+            _, saturation, value = colorsys.rgb_to_hsv(*color[:3])
+            expected = colorsys.hsv_to_rgb(0.4, max(saturation, 0.8), max(value, 0.5))
+            result = effect.calculate_color(0.4, tuple(color))
+            assert result == pytest.approx((*expected, color[3]), abs=1e-12)
+
+
 class TestPulseEffect:
     """Test pulse color effect."""
     
@@ -202,6 +321,12 @@ class TestPulseEffect:
         # Results should be different for different curves
         assert sine_result != triangle_result
         assert triangle_result != square_result
+        
+        # Unknown curves fall back to a linear ramp
+        effect.set_pulse_color((0.0, 1.0, 0.0, 1.0))
+        effect.set_pulse_curve('unknown')
+        linear_result = effect.calculate_color(0.25, base_color)
+        assert linear_result == pytest.approx((0.75, 0.25, 0.0, 1.0))
     
     def test_bpm_synchronization(self):
         """Test BPM synchronization for pulse effect."""
@@ -250,6 +375,29 @@ class TestStrobeEffect:
         
         assert flash1 != base_color
         assert flash2 != base_color
+        
+        # Unknown patterns behave like single; speed changes rescale flashes
+        effect.set_pattern('unknown')
+        assert effect.calculate_color(0.55, base_color) == base_color
+        assert effect.calculate_color(0.05, base_color) != base_color
+        effect.update_parameters({'speed': 2.0})
+        assert effect._flash_ratio == pytest.approx(0.2)
+    
+    def test_random_pattern_is_deterministic(self):
+        """Test that the random strobe pattern depends only on time."""
+        config = ColorEffect(type='strobe', speed=1.0, intensity=1.0)
+        effect = StrobeEffect(config)
+        effect.set_pattern('random')
+        effect.set_flash_duration(0.25)
+        base_color = (0.0, 0.0, 0.0, 1.0)
+        
+        times = [i / 1000.0 for i in range(1000)]
+        first = [effect.calculate_color(t, base_color) != base_color for t in times]
+        second = [effect.calculate_color(t, base_color) != base_color for t in times]
+        
+        assert first == second
+        # Flash probability is twice the flash ratio
+        assert 0.4 < sum(first) / len(first) < 0.6
     
     def test_strobe_intensity(self):
         """Test strobe intensity effect."""
@@ -302,6 +450,54 @@ class TestColorTemperatureEffect:
         # (This is a simplified test - actual color temperature is complex)
         assert warm_color != base_color or cool_color != base_color
     
+    def test_temperature_lookup_table(self):
+        """Test the precomputed blackbody table against the exact formula."""
+        config = ColorEffect(type='temperature', speed=1.0, intensity=1.0)
+        effect = ColorTemperatureEffect(config)
+        effect.set_transition_curve('linear')
+        base_color = (1.0, 1.0, 1.0, 1.0)
+        
+        for current_time in (0.0, 0.1, 0.37, 0.5, 0.99):
+            temperature = (effect.min_temperature +
+                           (effect.max_temperature - effect.min_temperature) * current_time)
+            exact = effect._apply_color_temperature(base_color, temperature)
+            assert effect.calculate_color(current_time, base_color) == pytest.approx(exact, abs=5e-3)
+        
+        # Changing the range rebuilds the table
+        table = effect._temp_lut
+        effect.set_temperature_range(3000, 6000)
+        effect.calculate_color(0.0, base_color)
+        assert effect._temp_lut is not table
+        assert effect._temp_lut.shape == (512, 3)
+        assert effect.calculate_color(0.0, base_color) == pytest.approx(
+            effect._apply_color_temperature(base_color, 3000), abs=1e-6)
+    
+    def test_vectorized_blackbody_matches_scalar(self):
+        """Test that the vectorized table builder matches the scalar formula."""
+        temperatures = np.linspace(1000.0, 40000.0, 391)
+        multipliers = _blackbody_multipliers_np(temperatures)
+        
+        assert multipliers.shape == (391, 3)
+        for temperature, row in zip(temperatures.tolist(), multipliers.tolist()):
+            assert row == pytest.approx(
+                ColorTemperatureEffect._blackbody_multiplier(temperature), abs=1e-12)
+    
+    def test_batch_temperature_shares_one_table_row(self):
+        """Test that batched temperature scales every row by one table entry."""
+        config = ColorEffect(type='temperature', speed=1.0, intensity=0.6)
+        effect = ColorTemperatureEffect(config)
+        base_colors = np.random.default_rng(5).random((64, 4)).astype(np.float32)
+        
+        result = effect.calculate_color_batch(0.3, base_colors)
+        
+        multiplier = effect._temp_lut[effect._temp_lut_index(0.3)]
+        scale = 1.0 + (multiplier - 1.0) * 0.6
+        assert np.allclose(result[:, :3], base_colors[:, :3] * scale, atol=1e-6)
+        assert np.array_equal(result[:, 3], base_colors[:, 3])
+        for row in (0, 17, 63):
+            expected = effect.calculate_color(0.3, tuple(base_colors[row].tolist()))
+            assert result[row] == pytest.approx(expected, abs=1e-6)
+    
     def test_transition_curves(self):
         """Test different transition curves."""
         config = ColorEffect(type='temperature', speed=1.0, intensity=1.0)
@@ -439,6 +635,192 @@ class TestColorEffectProcessor:
         assert temp.speed == 0.5
         assert temp.bpm_sync is False
     
+    def test_batch_matches_scalar_application(self):
+        """Test that batched color effects match per-element results."""
+        processor = ColorEffectProcessor()
+        base_colors = np.array([
+            (1.0, 0.0, 0.0, 1.0),
+            (0.2, 0.4, 0.6, 0.8),
+            (0.5, 0.5, 0.5, 1.0),
+            (0.0, 0.0, 0.0, 0.5),
+        ])
+        effects = [
+            ColorEffect(type='rainbow', speed=1.0, intensity=0.5),
+            ColorEffect(type='pulse', speed=2.0, intensity=0.3, bpm_sync=True, bpm=120.0),
+            ColorEffect(type='strobe', speed=1.0, intensity=0.7),
+            ColorEffect(type='temperature', speed=0.5, intensity=0.8),
+        ]
+        
+        for current_time in (0.0, 0.05, 0.3, 1.7):
+            batch = processor.apply_color_effects_batch(base_colors, effects, current_time)
+            assert batch.shape == (4, 4)
+            assert batch.dtype == np.float32
+            for row, color in enumerate(base_colors):
+                element = TextElement(
+                    content="Test", font_family="Arial", font_size=24.0,
+                    color=tuple(color), position=(0.0, 0.0),
+                    rotation=(0.0, 0.0, 0.0), effects=[]
+                )
+                expected = processor.apply_color_effects(element, effects, current_time)
+                assert batch[row] == pytest.approx(expected, abs=1e-6)
+        
+        # Every effect keeps float32 input in float32
+        colors32 = base_colors.astype(np.float32)
+        for config in effects:
+            effect = processor.get_effect(config)
+            assert effect.calculate_color_batch(0.05, colors32).dtype == np.float32
+    
+    def test_effect_instances_reused_across_frames(self):
+        """Test that effect instances are cached per configuration."""
+        processor = ColorEffectProcessor()
+        text_element = TextElement(
+            content="Test", font_family="Arial", font_size=24.0,
+            color=(1.0, 0.0, 0.0, 1.0), position=(0.0, 0.0),
+            rotation=(0.0, 0.0, 0.0), effects=[]
+        )
+        config = ColorEffect(type='pulse', speed=1.0, intensity=1.0)
+        
+        processor.apply_color_effects(text_element, [config], 0.0)
+        effect = processor.get_effect(config)
+        effect.set_pulse_color((0.0, 0.0, 1.0, 1.0))
+        
+        # Settings on the cached instance persist across frames
+        color = processor.apply_color_effects(text_element, [config], 0.25)
+        assert processor.get_effect(config) is effect
+        assert color == pytest.approx((0.0, 0.0, 1.0, 1.0))
+        
+        processor.invalidate(config)
+        assert processor.get_effect(config) is not effect
+    
+    def test_compiled_effect_stack(self):
+        """Test that compiled effect stacks match applying each effect in turn."""
+        processor = ColorEffectProcessor()
+        rainbow = ColorEffect(type='rainbow', speed=0.5, intensity=0.6)
+        pulse = ColorEffect(type='pulse', speed=2.0, intensity=0.4)
+        strobe = ColorEffect(type='strobe', speed=3.0, intensity=0.8)
+        effects = [rainbow, pulse, strobe]
+        base_color = (0.3, 0.5, 0.7, 1.0)
+        
+        stack = processor.get_effect_stack(effects)
+        assert processor.get_effect_stack(effects) is stack
+        for current_time in (0.0, 0.13, 0.4, 1.7):
+            expected = base_color
+            for config in effects:
+                expected = processor.get_effect(config).calculate_color(current_time, expected)
+            assert stack(current_time, base_color) == expected
+        assert processor.get_effect_stack([])(0.5, base_color) == base_color
+        
+        # Parameter changes and cleanup recompile the stack
+        processor.get_effect(pulse).update_parameters({'speed': 1.0})
+        assert processor.get_effect_stack(effects) is not stack
+        stack = processor.get_effect_stack(effects)
+        processor.cleanup_effects()
+        assert processor.get_effect_stack(effects) is not stack
+    
+    def test_direct_config_edits_apply_to_cached_effects(self):
+        """Test that editing a configuration's timing directly changes the next frame."""
+        processor = ColorEffectProcessor()
+        pulse = ColorEffect(type='pulse', speed=2.0, intensity=0.8)
+        strobe = ColorEffect(type='strobe', speed=2.0, intensity=0.8)
+        base_color = (0.3, 0.5, 0.7, 1.0)
+        base_colors = np.array([base_color])
+        
+        for config in (pulse, strobe):
+            processor.get_effect_stack([config])(0.3, base_color)
+            config.speed = 0.5
+            config.bpm_sync, config.bpm = True, 90.0
+            
+            expected = ColorEffectProcessor().create_effect(config).calculate_color(0.3, base_color)
+            assert processor.get_effect_stack([config])(0.3, base_color) == expected
+            np.testing.assert_allclose(
+                processor.apply_color_effects_batch(base_colors, [config], 0.3)[0],
+                expected, atol=1e-6)
+    
+    def test_unsupported_effects_skipped(self, caplog):
+        """Test that unsupported effects are skipped and reported once."""
+        processor = ColorEffectProcessor()
+        base_colors = np.array([(1.0, 0.0, 0.0, 1.0)])
+        effects = [ColorEffect(type='unsupported', speed=1.0, intensity=1.0)]
+        
+        with caplog.at_level('WARNING'):
+            for current_time in (0.0, 0.1):
+                result = processor.apply_color_effects_batch(base_colors, effects, current_time)
+                assert np.array_equal(result, base_colors)
+        
+        assert len([r for r in caplog.records if 'unsupported' in r.getMessage()]) == 1
+    
+    def test_shader_uniforms_match_cpu_colors(self):
+        """Test that shader uniforms reproduce the CPU color results."""
+        import colorsys
+        
+        def apply_uniforms(uniforms, base):
+            # Mirrors applyColorEffect in the text vertex shader
+            base = np.asarray(base)
+            amount = uniforms.get('colorEffectAmount', 0.0)
+            if uniforms['colorEffectType'] == 1:
+                h, s, v = colorsys.rgb_to_hsv(*base[:3])
+                hue = h + (uniforms['colorEffectHue'] - h) * amount if amount < 1.0 else uniforms['colorEffectHue']
+                rgb = np.array(colorsys.hsv_to_rgb(hue, max(s, 0.8), max(v, 0.5)))
+                if amount < 1.0:
+                    rgb = base[:3] + (rgb - base[:3]) * amount
+                return (*rgb, base[3])
+            if uniforms['colorEffectType'] == 2:
+                return tuple(base + (np.asarray(uniforms['colorEffectTarget']) - base) * amount)
+            if uniforms['colorEffectType'] == 3:
+                rgb = base[:3] + (base[:3] * uniforms['colorEffectMultiplier'] - base[:3]) * amount
+                return (*rgb, base[3])
+            return tuple(base)
+        
+        processor = ColorEffectProcessor()
+        base_color = (0.8, 0.3, 0.1, 0.9)
+        element = TextElement(
+            content="Test", font_family="Arial", font_size=24.0,
+            color=base_color, position=(0.0, 0.0),
+            rotation=(0.0, 0.0, 0.0), effects=[]
+        )
+        configs = [
+            ColorEffect(type='rainbow', speed=1.0, intensity=1.0),
+            ColorEffect(type='rainbow', speed=0.5, intensity=0.6, bpm_sync=True, bpm=100.0),
+            ColorEffect(type='pulse', speed=2.0, intensity=0.7),
+            ColorEffect(type='strobe', speed=1.0, intensity=0.8),
+            ColorEffect(type='temperature', speed=0.5, intensity=0.9),
+        ]
+        
+        for config in configs:
+            for current_time in (0.0, 0.05, 0.4, 1.3):
+                uniforms = processor.to_shader_uniforms([config], current_time)
+                expected = processor.apply_color_effects(element, [config], current_time)
+                assert apply_uniforms(uniforms, base_color) == pytest.approx(expected, abs=1e-9)
+        
+        # No effects map to a pass-through; stacks stay on the CPU
+        assert processor.to_shader_uniforms([], 0.0) == {'colorEffectType': 0}
+        assert processor.to_shader_uniforms(configs[:2], 0.0) is None
+    
+    def test_linear_light_effects_batch_and_scalar_agree(self):
+        """Test linear-light blending across scalar and batch paths."""
+        processor = ColorEffectProcessor()
+        base_colors = np.array([(1.0, 0.0, 0.0, 1.0), (0.2, 0.4, 0.6, 0.8)])
+        configs = [
+            ColorEffect(type='rainbow', speed=1.0, intensity=0.5),
+            ColorEffect(type='pulse', speed=2.0, intensity=0.6),
+            ColorEffect(type='strobe', speed=1.0, intensity=0.7),
+            ColorEffect(type='temperature', speed=0.5, intensity=0.8),
+        ]
+        for config in configs:
+            processor.get_effect(config).update_parameters({'linear_light': True})
+            assert processor.to_shader_uniforms([config], 0.0) is None
+        
+        for current_time in (0.05, 0.3):
+            batch = processor.apply_color_effects_batch(base_colors, configs, current_time)
+            for row, color in enumerate(base_colors):
+                element = TextElement(
+                    content="Test", font_family="Arial", font_size=24.0,
+                    color=tuple(color), position=(0.0, 0.0),
+                    rotation=(0.0, 0.0, 0.0), effects=[]
+                )
+                expected = processor.apply_color_effects(element, configs, current_time)
+                assert batch[row] == pytest.approx(expected, abs=2e-3)
+    
     def test_cleanup_effects(self):
         """Test cleaning up active effects."""
         processor = ColorEffectProcessor()
@@ -3,10 +3,15 @@ Tests for data models and validation system.
 """
 
 import unittest
+import codecs
 import tempfile
 import os
+import subprocess
+import sys
 import json
 from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 from src.core.models import (
     TextElement, SubtitleTrack, Keyframe, VideoAsset, AudioAsset, Project,
     ExportSettings, AnimationType, VisualEffectType, ParticleType, EasingType,
@@ -22,6 +27,22 @@ class TestValidationSystem(unittest.TestCase):
         """Set up test fixtures."""
         self.validation_system = ValidationSystem()
         self.temp_dir = tempfile.mkdtemp()
+        
+        # Keep capability reports out of the user's real cache
+        self.cache_path = Path(self.temp_dir) / 'cache' / 'opengl_caps.json'
+        cache_patch = patch('src.core.validation._CAPABILITY_CACHE_PATH', self.cache_path)
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+        
+        # GPU identity is memoized per process; probe it afresh in each test
+        ValidationSystem._get_gpu_identity.cache_clear()
+        self.addCleanup(ValidationSystem._get_gpu_identity.cache_clear)
+        
+        # Read sysfs from the temp dir so the host's GPUs do not leak into tests
+        self.drm_path = Path(self.temp_dir) / 'drm'
+        drm_patch = patch('src.core.validation._DRM_CLASS_PATH', self.drm_path)
+        drm_patch.start()
+        self.addCleanup(drm_patch.stop)
     
     def tearDown(self):
         """Clean up test fixtures."""
@@ -87,6 +108,68 @@ class TestValidationSystem(unittest.TestCase):
         self.assertFalse(result.is_valid)
         self.assertIn("Unsupported audio format", result.error_message)
     
+    def test_asset_handlers_reused_across_calls(self):
+        """Test that one handler instance serves every validate_*_file call."""
+        self.assertIsNotNone(self.validation_system._video_handler)
+        self.assertIsNotNone(self.validation_system._audio_handler)
+        
+        handler = MagicMock()
+        handler.validate_video_file.return_value = ValidationResult(is_valid=True)
+        self.validation_system._video_handler = handler
+        for name in ("a.mp4", "b.mp4"):
+            self.validation_system.validate_video_file(name)
+        self.assertEqual(handler.validate_video_file.call_count, 2)
+        
+        # Without a handler the basic validation is used
+        self.validation_system._audio_handler = None
+        result = self.validation_system.validate_audio_file("nonexistent.mp3")
+        self.assertFalse(result.is_valid)
+        self.assertIn("does not exist", result.error_message)
+    
+    def test_basic_validation_fallback(self):
+        """Test the handler-free validators derive existence and size from one stat."""
+        video_file = self.create_temp_file("clip.mp4", "x" * 10)
+        
+        with patch('src.core.validation.os.path.exists') as exists, \
+             patch('src.core.validation.os.path.getsize') as getsize:
+            result = self.validation_system._basic_video_validation(video_file)
+            exists.assert_not_called()
+            getsize.assert_not_called()
+        self.assertTrue(result.is_valid)
+        self.assertEqual(result.metadata['file_size'], 10)
+        
+        result = self.validation_system._basic_audio_validation("missing.mp3")
+        self.assertFalse(result.is_valid)
+        self.assertIn("Audio file does not exist", result.error_message)
+        
+        result = self.validation_system._basic_audio_validation(video_file)
+        self.assertFalse(result.is_valid)
+        self.assertIn("Unsupported audio format: .mp4", result.error_message)
+    
+    def test_mime_types_from_mimetypes_registry(self):
+        """Test MIME type metadata, including the registered subtitle types."""
+        ass_file = self.create_temp_file("test.ass", "[Script Info]\n")
+        result = self.validation_system.validate_subtitle_file(ass_file)
+        self.assertEqual(result.metadata['mime_type'], 'text/ass')
+        
+        video_file = self.create_temp_file("test.mp4")
+        result = self.validation_system._basic_video_validation(video_file)
+        self.assertEqual(result.metadata['mime_type'], 'video/mp4')
+    
+    def test_validate_subtitle_file_shallow(self):
+        """Test that shallow subtitle validation does not read the file."""
+        subtitle_file = self.create_temp_file("empty.srt", "")
+        
+        with patch('builtins.open') as mock_open:
+            result = self.validation_system.validate_subtitle_file(subtitle_file, deep=False)
+            mock_open.assert_not_called()
+        self.assertTrue(result.is_valid)
+        self.assertEqual(result.metadata['format'], '.srt')
+        self.assertEqual(result.warnings, [])
+        
+        result = self.validation_system.validate_subtitle_file(subtitle_file)
+        self.assertIn("Subtitle file appears to be empty", result.warnings)
+    
     def test_validate_subtitle_file_supported_format(self):
         """Test validation of supported subtitle formats."""
         # Create temporary subtitle files
@@ -112,6 +195,84 @@ class TestValidationSystem(unittest.TestCase):
         self.assertTrue(result.is_valid)  # Should still be valid but with warning
         self.assertIn("appears to be empty", str(result.warnings))
     
+    def test_validate_subtitle_file_whitespace_only(self):
+        """Test that whitespace-only files are empty regardless of BOM or encoding."""
+        contents = {
+            "blank.srt": b" \r\n\t\n",
+            "blank_bom.srt": codecs.BOM_UTF8 + b"\n\n",
+            "blank_utf16.srt": "  \n".encode('utf-16'),
+        }
+        for name, data in contents.items():
+            path = os.path.join(self.temp_dir, name)
+            with open(path, 'wb') as f:
+                f.write(data)
+            result = self.validation_system.validate_subtitle_file(path)
+            self.assertTrue(result.is_valid, name)
+            self.assertIn("appears to be empty", str(result.warnings), name)
+    
+    def test_validate_subtitle_file_encoding_detection(self):
+        """Test subtitle encoding detection from BOMs and non-UTF-8 content."""
+        srt_content = "1\n00:00:01,000 --> 00:00:05,000\nПривет мир\n"
+        
+        utf16_file = os.path.join(self.temp_dir, "utf16.srt")
+        with open(utf16_file, 'wb') as f:
+            f.write(srt_content.encode('utf-16'))
+        result = self.validation_system.validate_subtitle_file(utf16_file)
+        self.assertTrue(result.is_valid)
+        self.assertIn(result.metadata['encoding'], ('utf-16-le', 'utf-16-be'))
+        self.assertNotIn("appears to be empty", str(result.warnings))
+        
+        utf8_bom_file = os.path.join(self.temp_dir, "bom.srt")
+        with open(utf8_bom_file, 'wb') as f:
+            f.write(srt_content.encode('utf-8-sig'))
+        result = self.validation_system.validate_subtitle_file(utf8_bom_file)
+        self.assertEqual(result.metadata['encoding'], 'utf-8-sig')
+        
+        legacy_file = os.path.join(self.temp_dir, "legacy.srt")
+        with open(legacy_file, 'wb') as f:
+            f.write(srt_content.encode('cp1251'))
+        result = self.validation_system.validate_subtitle_file(legacy_file)
+        self.assertTrue(result.is_valid)
+        self.assertNotEqual(result.metadata['encoding'], 'utf-8')
+        self.assertIn("may have character issues", str(result.warnings))
+    
+    def test_validate_files_batch(self):
+        """Test validating a mixed list of files in one batch."""
+        video_file = self.create_temp_file("clip.mp4")
+        audio_file = self.create_temp_file("song.wav")
+        subtitle_file = self.create_temp_file("lyrics.srt", "1\n00:00:01,000 --> 00:00:02,000\nHi\n")
+        missing_file = os.path.join(self.temp_dir, "missing.mp3")
+        unsupported_file = self.create_temp_file("notes.txt")
+        missing_dir_file = os.path.join(self.temp_dir, "nope", "clip.mov")
+        
+        paths = [video_file, audio_file, subtitle_file, missing_file, unsupported_file, missing_dir_file]
+        results = self.validation_system.validate_files_batch(paths)
+        
+        self.assertEqual(list(results), paths)
+        self.assertTrue(results[video_file].is_valid)
+        self.assertTrue(results[audio_file].is_valid)
+        self.assertTrue(results[subtitle_file].is_valid)
+        # Batch validation skips reading subtitle contents
+        self.assertNotIn('encoding', results[subtitle_file].metadata)
+        self.assertIn("Audio file does not exist", results[missing_file].error_message)
+        self.assertIn("Unsupported file format", results[unsupported_file].error_message)
+        self.assertIn("Video file does not exist", results[missing_dir_file].error_message)
+    
+    def test_validate_files_batch_stats_each_file_once(self):
+        """Test that batch validation hands each file's stat result to its validator."""
+        video_file = self.create_temp_file("clip.mp4")
+        audio_file = self.create_temp_file("song.wav")
+        
+        with patch('src.core.validation.os.scandir') as scandir, \
+             patch('os.path.exists', side_effect=AssertionError("re-checked existence")), \
+             patch('os.path.getsize', side_effect=AssertionError("re-stat'ed size")):
+            results = self.validation_system.validate_files_batch([video_file, audio_file])
+            scandir.assert_not_called()
+        
+        for path in (video_file, audio_file):
+            self.assertTrue(results[path].is_valid, results[path].error_message)
+            self.assertEqual(results[path].metadata['file_size'], os.path.getsize(path))
+    
     def test_validate_opengl_capabilities(self):
         """Test OpenGL capability validation."""
         report = self.validation_system.validate_opengl_capabilities()
@@ -123,6 +284,164 @@ class TestValidationSystem(unittest.TestCase):
         self.assertIsInstance(report.supports_vertex_arrays, bool)
         self.assertIsInstance(report.supports_framebuffers, bool)
     
+    def test_opengl_capabilities_disk_cache(self):
+        """Test that only probed capability reports persist per GPU identity."""
+        probed = {
+            'version': '4.6.0 NVIDIA 535.54', 'glsl_version': '4.60', 'max_texture_size': 32768,
+            'vertex_arrays': True, 'framebuffers': True,
+            'vendor': 'NVIDIA Corporation', 'renderer': 'NVIDIA GeForce RTX 3080'
+        }
+        
+        with patch.object(ValidationSystem, '_get_gpu_identity', return_value='gpu-a'):
+            # Estimates made without a context are never persisted
+            with patch.object(ValidationSystem, '_probe_via_qt_context', return_value=None):
+                self.validation_system.validate_opengl_capabilities()
+            self.assertFalse(self.cache_path.exists())
+            
+            with patch.object(ValidationSystem, '_probe_via_qt_context', return_value=probed):
+                report = ValidationSystem().validate_opengl_capabilities()
+            self.assertTrue(self.cache_path.exists())
+            
+            # A fresh instance loads the probed report without creating a context
+            with patch.object(ValidationSystem, '_probe_via_qt_context') as probe, \
+                 patch.object(ValidationSystem, '_detect_opengl_info') as detect:
+                cached = ValidationSystem().validate_opengl_capabilities()
+                probe.assert_not_called()
+                detect.assert_not_called()
+            self.assertEqual(cached, report)
+        
+        # A different GPU or driver misses the cache and probes again
+        with patch.object(ValidationSystem, '_get_gpu_identity', return_value='gpu-b'), \
+             patch.object(ValidationSystem, '_probe_via_qt_context', return_value=None) as probe, \
+             patch.object(ValidationSystem, '_detect_opengl_info', return_value=None) as detect:
+            ValidationSystem().validate_opengl_capabilities()
+            probe.assert_called_once()
+            detect.assert_called_once()
+    
+    def test_gpu_identity_includes_driver_version(self):
+        """Test that a driver upgrade changes the GPU identity."""
+        lspci_output = (b"01:00.0 VGA compatible controller [0300]: NVIDIA GA102 [10de:2206]\n"
+                        b"\tKernel driver in use: nvidia\n")
+        completed = subprocess.CompletedProcess(args=[], returncode=0, stdout=lspci_output)
+        
+        identities = []
+        for release in ('6.1.0-13-amd64', '6.1.0-18-amd64'):
+            ValidationSystem._get_gpu_identity.cache_clear()
+            with patch('src.core.validation._WMIC_PATH', None), \
+                 patch('src.core.validation._SYSPROFILER_PATH', None), \
+                 patch('src.core.validation._IS_LINUX', True), \
+                 patch('src.core.validation._LSPCI_PATH', '/usr/bin/lspci'), \
+                 patch('src.core.validation._NVIDIA_DRIVER_VERSION_PATH',
+                       Path(self.temp_dir) / 'missing'), \
+                 patch('src.core.validation.platform.release', return_value=release), \
+                 patch('src.core.validation.subprocess.run', return_value=completed):
+                identities.append(self.validation_system._get_gpu_identity())
+        
+        self.assertIsNotNone(identities[0])
+        self.assertNotEqual(identities[0], identities[1])
+    
+    def test_gpu_identity_reads_sysfs(self):
+        """Test that Linux GPU identity comes from sysfs without spawning lspci."""
+        device = self.drm_path / 'card0' / 'device'
+        device.mkdir(parents=True)
+        (device / 'vendor').write_text("0x10de\n")
+        (device / 'device').write_text("0x2206\n")
+        (self.drm_path / 'card0-HDMI-A-1').mkdir()
+        
+        with patch('src.core.validation._WMIC_PATH', None), \
+             patch('src.core.validation._SYSPROFILER_PATH', None), \
+             patch('src.core.validation._IS_LINUX', True), \
+             patch('src.core.validation._LSPCI_PATH', '/usr/bin/lspci'), \
+             patch('src.core.validation.subprocess.run') as run:
+            self.assertEqual(ValidationSystem._read_drm_devices(), ["0x10de:0x2206"])
+            identity = self.validation_system._get_gpu_identity()
+            self.assertIsNotNone(identity)
+            run.assert_not_called()
+            
+            # The identity is memoized for the process
+            (device / 'device').write_text("0x2204\n")
+            self.assertEqual(self.validation_system._get_gpu_identity(), identity)
+    
+    def test_detect_opengl_info_gpu_vendor(self):
+        """Test vendor classification from GPU names when PyOpenGL is unavailable."""
+        cases = {
+            "NVIDIA GeForce RTX 3080": ('NVIDIA', 16384),
+            "AMD Radeon RX 7900 XTX": ('AMD', 16384),
+            "Radeon Pro 560X": ('AMD', 16384),
+            "Intel UHD Graphics 630": ('Intel', 8192),
+            "Matrox G200eR2": ('Unknown', 8192),
+        }
+        
+        with patch.dict(sys.modules, {'OpenGL': None, 'OpenGL.GL': None}):
+            for gpu_name, (vendor, texture_size) in cases.items():
+                with patch.object(ValidationSystem, '_get_gpu_info', return_value=gpu_name):
+                    info = self.validation_system._detect_opengl_info()
+                self.assertEqual(info['vendor'], vendor, gpu_name)
+                self.assertEqual(info['max_texture_size'], texture_size, gpu_name)
+    
+    def test_gpu_probes_skip_missing_tools(self):
+        """Test that GPU probes do not spawn processes for tools absent from PATH."""
+        with patch('src.core.validation._WMIC_PATH', None), \
+             patch('src.core.validation._SYSPROFILER_PATH', None), \
+             patch('src.core.validation._LSPCI_PATH', None), \
+             patch('src.core.validation.subprocess.run') as run:
+            self.assertIsNone(self.validation_system._get_gpu_info())
+            self.assertIsNone(self.validation_system._get_gpu_identity())
+            run.assert_not_called()
+    
+    def test_gpu_probe_decodes_stdout_only(self):
+        """Test that GPU probes capture raw stdout and decode it after success."""
+        lspci_output = b"01:00.0 VGA compatible controller [0300]: NVIDIA GA102 [10de:2206]\r\n"
+        completed = subprocess.CompletedProcess(args=[], returncode=0, stdout=lspci_output)
+        
+        with patch('src.core.validation._WMIC_PATH', None), \
+             patch('src.core.validation._SYSPROFILER_PATH', None), \
+             patch('src.core.validation._IS_LINUX', True), \
+             patch('src.core.validation._LSPCI_PATH', '/usr/bin/lspci'), \
+             patch('src.core.validation.subprocess.run', return_value=completed) as run:
+            self.assertIn("NVIDIA GA102 [10de:2206]", self.validation_system._get_gpu_info())
+            self.assertIsNotNone(self.validation_system._get_gpu_identity())
+            
+            _, kwargs = run.call_args
+            self.assertIs(kwargs['stderr'], subprocess.DEVNULL)
+            self.assertNotIn('text', kwargs)
+            
+            run.return_value = subprocess.CompletedProcess(args=[], returncode=1, stdout=lspci_output)
+            self.assertIsNone(self.validation_system._get_gpu_info())
+    
+    def test_opengl_capabilities_prefer_context_probe(self):
+        """Test that values read from a real GL context take precedence."""
+        probed = {
+            'version': '3.1.0 Mesa 20.0', 'glsl_version': '1.40', 'max_texture_size': 4096,
+            'vertex_arrays': True, 'framebuffers': True,
+            'vendor': 'Mesa', 'renderer': 'llvmpipe'
+        }
+        with patch.object(ValidationSystem, '_probe_via_qt_context', return_value=probed), \
+             patch.object(ValidationSystem, '_detect_opengl_info') as detect:
+            report = self.validation_system.validate_opengl_capabilities()
+            detect.assert_not_called()
+        self.assertEqual((report.opengl_version, report.gpu_model), ('3.1.0 Mesa 20.0', 'llvmpipe'))
+        
+        # Without a running Qt application no context is created
+        with patch('PyQt6.QtGui.QGuiApplication.instance', return_value=None), \
+             patch('PyQt6.QtGui.QOpenGLContext') as context:
+            self.assertIsNone(self.validation_system._probe_via_qt_context())
+            context.assert_not_called()
+        
+        # A failed query still releases the context and destroys the surface
+        with patch('PyQt6.QtGui.QGuiApplication.instance', return_value=MagicMock()), \
+             patch('PyQt6.QtGui.QOpenGLContext') as context_class, \
+             patch('PyQt6.QtGui.QOffscreenSurface') as surface_class, \
+             patch('OpenGL.GL.glGetString', side_effect=RuntimeError("no context")):
+            context = context_class.return_value
+            context.create.return_value = True
+            context.makeCurrent.return_value = True
+            surface_class.return_value.isValid.return_value = True
+            
+            self.assertIsNone(self.validation_system._probe_via_qt_context())
+            context.doneCurrent.assert_called_once()
+            surface_class.return_value.destroy.assert_called_once()
+    
     def test_validate_export_settings_valid(self):
         """Test validation of valid export settings."""
         settings = ExportSettings(
@@ -194,6 +513,44 @@ class TestValidationSystem(unittest.TestCase):
         self.assertTrue(result.is_valid)
         self.assertIn("even numbers", str(result.warnings))
     
+    def test_validate_export_settings_cached_results_are_independent(self):
+        """Test that memoized export validation returns fresh result objects."""
+        settings = ExportSettings(
+            resolution=(1921, 1081),
+            fps=30.0,
+            format="mp4",
+            quality_preset="normal",
+            codec="h264"
+        )
+        
+        first = self.validation_system.validate_export_settings(settings)
+        first.warnings.append("mutated")
+        first.metadata['mutated'] = True
+        
+        second = self.validation_system.validate_export_settings(settings)
+        self.assertIsNot(first, second)
+        self.assertNotIn("mutated", second.warnings)
+        self.assertNotIn('mutated', second.metadata)
+        self.assertIn("even numbers", str(second.warnings))
+    
+    def test_compile_export_validator(self):
+        """Test that compiled export validators are shared and format-specific."""
+        validator = ValidationSystem.compile_export_validator("mp4")
+        self.assertIs(validator, ValidationSystem.compile_export_validator("mp4"))
+        
+        settings = ExportSettings(resolution=(1920, 1080), fps=30.0, format="mp4",
+                                  quality_preset="normal", codec="h264")
+        result = validator(settings)
+        self.assertTrue(result.is_valid)
+        self.assertEqual(result.metadata['resolution_name'], '1080p')
+        
+        settings.codec = "vp9"
+        self.assertIn("Codec vp9 not supported for format mp4", validator(settings).error_message)
+        
+        result = ValidationSystem.compile_export_validator("flv")(settings)
+        self.assertFalse(result.is_valid)
+        self.assertIn("Unsupported export format: flv", result.error_message)
+    
     def test_get_supported_formats(self):
         """Test getting supported file formats."""
         formats = self.validation_system.get_supported_formats()
@@ -227,6 +584,39 @@ class TestValidationSystem(unittest.TestCase):
         self.assertTrue(result.is_valid)
         self.assertIn('capabilities', result.metadata)
     
+    def test_opengl_requirements_version_parsing(self):
+        """Test version parsing on CapabilityReport and cached requirement checks."""
+        def report(version):
+            return CapabilityReport(version, "4.60", 16384, True, True, "NVIDIA", "GPU")
+        
+        modern = report("4.6.0 NVIDIA 535.54")
+        self.assertEqual((modern.major_version, modern.minor_version), (4, 6))
+        self.assertEqual((report("3").major_version, report("3").minor_version), (3, None))
+        self.assertIsNone(report("Unknown").major_version)
+        
+        cases = {
+            "3.2": (False, "OpenGL 3.2 detected"),
+            "Unknown": (False, "Cannot determine OpenGL version"),
+            "abc.def": (False, "Invalid OpenGL version format"),
+            "4.6": (True, None),
+        }
+        for version, (is_valid, message) in cases.items():
+            system = ValidationSystem()
+            system._opengl_capabilities = report(version)
+            result = system.check_opengl_minimum_requirements()
+            self.assertEqual(result.is_valid, is_valid, version)
+            if message:
+                self.assertIn(message, result.error_message)
+        
+        # Repeated checks reuse the evaluation but hand out independent results
+        with patch.object(ValidationSystem, '_evaluate_opengl_requirements',
+                          wraps=system._evaluate_opengl_requirements) as evaluate:
+            first = system.check_opengl_minimum_requirements()
+            first.warnings.append("mutated")
+            second = system.check_opengl_minimum_requirements()
+            evaluate.assert_not_called()
+        self.assertNotIn("mutated", second.warnings)
+    
     def test_validate_format_compatibility(self):
         """Test format compatibility validation."""
         # Test compatible formats
@@ -8,7 +8,9 @@ from unittest.mock import Mock, patch
 
 from src.effects.particle_system import (
     ParticleSystem, SparkleEmitter, FireEmitter, SmokeEmitter,
-    Particle, ParticleEmitterConfig, ParticleRenderer
+    Particle, ParticleArrays, ParticleEmitterConfig, ParticleRenderer,
+    _integrate_kernel, _make_sparkle_kernel, _make_fire_kernel, _make_smoke_kernel,
+    _specialized_kernel, _INSTANCE_FLOATS, _MAX_EFFECT_SLOTS
 )
 from src.core.models import ParticleEffect, ParticleType
 from src.graphics.shader_manager import ShaderManager
@@ -95,6 +97,192 @@ class TestParticle:
         assert particle.life <= 0.0
 
 
+class TestParticleArrays:
+    """Test structure-of-arrays particle storage."""
+    
+    def _make_particle(self, life):
+        return Particle(
+            position=(1.0, 2.0, 3.0),
+            velocity=(0.5, -1.0, 0.0),
+            acceleration=(0.0, -9.75, 0.0),
+            color=(0.125, 0.25, 0.375, 0.5),
+            size=6.0,
+            life=life,
+            max_life=2.0,
+            rotation=0.25,
+            angular_velocity=1.5,
+            texture_index=2
+        )
+    
+    def test_write_and_read_round_trip(self):
+        """Test that particle records survive storage in the arrays."""
+        arrays = ParticleArrays.allocate(4)
+        particle = self._make_particle(0.75)
+        
+        arrays.write(1, particle)
+        
+        assert arrays.capacity == 4
+        assert arrays.read(1) == particle
+    
+    def test_arrays_store_float32(self):
+        """Test that particle data is stored at the precision the shader reads."""
+        arrays = ParticleArrays.allocate(4)
+        
+        for array in arrays.fields():
+            if array is not arrays.texture_index and array is not arrays.rgba8:
+                assert array.dtype == np.float32
+        
+        emitter = SparkleEmitter(ParticleEmitterConfig(
+            emission_rate=100.0, max_particles=16, lifetime_min=1.0, lifetime_max=2.0,
+            position=(0.0, 0.0, 0.0), position_variance=(1.0, 1.0, 1.0),
+            velocity_min=(-1.0, -1.0, -1.0), velocity_max=(1.0, 1.0, 1.0),
+            acceleration=(0.0, -9.8, 0.0), size_min=1.0, size_max=2.0,
+            color_start=(1.0, 1.0, 1.0, 1.0), color_end=(1.0, 1.0, 1.0, 0.0)))
+        emitter.update(0.1, current_time=1.0e6)
+        assert emitter.arrays.positions.dtype == np.float32
+        assert emitter.arrays.colors.dtype == np.float32
+        
+        # Large frame times are wrapped before they meet float32 rotations
+        n = emitter.get_particle_count()
+        brightness = 1.0 + 0.4 * np.sin(emitter.arrays.rotation[:n].astype(np.float64)
+                                         + 1.0e6 * 3.0)
+        assert emitter.arrays.colors[:n, 3] == pytest.approx(
+            brightness * emitter.arrays.life[:n], abs=1e-5)
+    
+    def test_remove_swaps_tail_particles_into_dead_rows(self):
+        """Test that removal fills dead rows with surviving tail particles."""
+        arrays = ParticleArrays.allocate(6)
+        for index, life in enumerate((0.9, -0.1, 0.5, 0.0, 0.2, 0.7)):
+            arrays.write(index, self._make_particle(life))
+        arrays.active_count = 6
+        
+        arrays.remove(np.flatnonzero(arrays.life[:6] <= 0.0))
+        
+        assert arrays.active_count == 4
+        assert arrays.life[:4].tolist() == pytest.approx([0.9, 0.2, 0.5, 0.7])
+        
+        # Deaths confined to the tail copy nothing
+        arrays.life[2:4] = -1.0
+        arrays.remove(np.flatnonzero(arrays.life[:4] <= 0.0))
+        assert arrays.life[:2].tolist() == pytest.approx([0.9, 0.2])
+    
+    def test_emitter_update_matches_particle_update(self):
+        """Test that the array update integrates like Particle.update."""
+        config = ParticleEmitterConfig(
+            emission_rate=0.0,
+            max_particles=8,
+            lifetime_min=1.0,
+            lifetime_max=3.0,
+            position=(0.0, 0.0, 0.0),
+            position_variance=(10.0, 10.0, 10.0),
+            velocity_min=(-5.0, -5.0, -5.0),
+            velocity_max=(5.0, 5.0, 5.0),
+            acceleration=(0.0, -50.0, 0.0),
+            size_min=2.0,
+            size_max=8.0,
+            color_start=(1.0, 1.0, 1.0, 1.0),
+            color_end=(1.0, 1.0, 1.0, 0.0)
+        )
+        emitter = SmokeEmitter(config)
+        emitter.set_turbulence(0.0)
+        particles = [emitter.create_particle() for _ in range(5)]
+        for index, particle in enumerate(particles):
+            emitter.arrays.write(index, particle)
+        emitter.arrays.active_count = len(particles)
+        
+        # Draws of one never trigger a per-frame turbulence kick
+        with patch.object(emitter, '_rng', Mock(random=np.ones)):
+            emitter.update(0.05)
+        
+        for index, particle in enumerate(particles):
+            particle.update(0.05)
+            updated = emitter.particles[index]
+            assert updated.position == pytest.approx(particle.position, abs=1e-6)
+            assert updated.velocity == pytest.approx(particle.velocity, abs=1e-6)
+            assert updated.life == pytest.approx(particle.life, abs=1e-6)
+            assert updated.rotation == pytest.approx(particle.rotation, abs=1e-6)
+            
+            # Smoke expands and fades with age
+            age_factor = 1.0 - particle.life
+            assert updated.size == pytest.approx(5.0 * (1.0 + age_factor * 1.5) * 0.5)
+            assert updated.color[3] == pytest.approx(
+                particle.life * (1.0 - age_factor * 0.5))
+
+
+class TestParticleKernels:
+    """Test the single-pass particle kernels against the per-particle formulas."""
+    
+    def _random_arrays(self, count):
+        rng = np.random.default_rng(11)
+        arrays = ParticleArrays.allocate(count)
+        arrays.positions[:] = rng.uniform(-10.0, 10.0, (count, 3))
+        arrays.velocities[:] = rng.uniform(-5.0, 5.0, (count, 3))
+        arrays.accelerations[:] = rng.uniform(-50.0, 0.0, (count, 3))
+        arrays.colors[:] = rng.random((count, 4))
+        arrays.size[:] = rng.uniform(2.0, 8.0, count)
+        arrays.life[:] = rng.uniform(0.05, 1.0, count)
+        arrays.max_life[:] = rng.uniform(0.5, 3.0, count)
+        arrays.rotation[:] = rng.uniform(0.0, 6.0, count)
+        arrays.angular_velocity[:] = rng.uniform(-1.5, 1.5, count)
+        arrays.active_count = count
+        return arrays
+    
+    def test_integrate_kernel(self):
+        """Test that the integration kernel matches Particle.update."""
+        arrays = self._random_arrays(6)
+        arrays.life[:2] = 0.01
+        particles = [arrays.read(index) for index in range(6)]
+        
+        dead_count = _integrate_kernel(arrays.positions, arrays.velocities,
+                                       arrays.accelerations, arrays.life, arrays.max_life,
+                                       arrays.rotation, arrays.angular_velocity, 6, 0.05)
+        
+        assert dead_count == 2
+        
+        for index, particle in enumerate(particles):
+            particle.update(0.05)
+            updated = arrays.read(index)
+            assert updated.position == pytest.approx(particle.position, abs=1e-6)
+            assert updated.velocity == pytest.approx(particle.velocity, abs=1e-6)
+            assert updated.life == pytest.approx(particle.life, abs=1e-6)
+            assert updated.rotation == pytest.approx(particle.rotation, abs=1e-6)
+    
+    def test_effect_kernels(self):
+        """Test the sparkle, fire and smoke kernels."""
+        arrays = self._random_arrays(6)
+        life, rotation = arrays.life.copy(), arrays.rotation.copy()
+        
+        sparkle_kernel = _specialized_kernel(_make_sparkle_kernel, 0.4, 0.9)
+        sparkle_kernel(arrays.colors, arrays.life, arrays.rotation, 6, 4.5)
+        assert arrays.colors[:, 3] == pytest.approx(
+            0.9 * (1.0 + 0.4 * np.sin(4.5 + rotation)) * life)
+        
+        fire_kernel = _specialized_kernel(_make_fire_kernel, 0.8, 0.3, 0.8, 12.0)
+        fire_kernel(arrays.colors, arrays.size, arrays.life, arrays.rotation, 6, 2.0)
+        heat_level = life * (1.0 - (1.0 - life) * 0.8)
+        flicker = 1.0 + 0.3 * np.sin(2.0 + rotation * 2.0)
+        assert arrays.colors[:, 0] == pytest.approx(np.minimum(1.0, flicker))
+        assert arrays.colors[:, 1] == pytest.approx(
+            np.minimum(1.0, (0.2 + 0.8 * heat_level) * flicker))
+        assert arrays.colors[:, 2] == pytest.approx(
+            np.minimum(1.0, np.maximum(0.0, heat_level - 0.5) * 2.0 * flicker))
+        assert arrays.colors[:, 3] == pytest.approx(life * 0.8)
+        assert arrays.size == pytest.approx(12.0 * (0.5 + 0.5 * heat_level))
+        
+        smoke_kernel = _specialized_kernel(_make_smoke_kernel, 1.5, 0.6, 18.0)
+        smoke_kernel(arrays.colors, arrays.size, arrays.life, 6)
+        assert arrays.size == pytest.approx(18.0 * (1.0 + (1.0 - life) * 1.5) * 0.5)
+        assert arrays.colors[:, 3] == pytest.approx(0.6 * life * (1.0 - (1.0 - life) * 0.5))
+    
+    def test_specialized_kernels_are_cached_per_constants(self):
+        """Test that kernels are built once per distinct set of emitter constants."""
+        kernel = _specialized_kernel(_make_smoke_kernel, 1.5, 0.6, 18.0)
+        
+        assert _specialized_kernel(_make_smoke_kernel, 1.5, np.float64(0.6), 18) is kernel
+        assert _specialized_kernel(_make_smoke_kernel, 2.0, 0.6, 18.0) is not kernel
+        assert _specialized_kernel(_make_fire_kernel, 1.5, 0.6, 18.0, 1.0) is not kernel
+
+
 class TestParticleEmitterConfig:
     """Test particle emitter configuration."""
     
@@ -234,6 +422,32 @@ class TestSparkleEmitter:
         
         # Should not emit new particles when inactive
         assert len(emitter.particles) == initial_count
+    
+    def test_twinkle_alpha(self):
+        """Test that twinkling scales alpha by brightness and remaining life."""
+        config = ParticleEmitterConfig(
+            emission_rate=200.0,
+            max_particles=50,
+            lifetime_min=1.0,
+            lifetime_max=3.0,
+            position=(0.0, 0.0, 0.0),
+            position_variance=(10.0, 10.0, 10.0),
+            velocity_min=(-5.0, -5.0, -5.0),
+            velocity_max=(5.0, 5.0, 5.0),
+            acceleration=(0.0, -50.0, 0.0),
+            size_min=2.0,
+            size_max=8.0,
+            color_start=(1.0, 1.0, 1.0, 0.8),
+            color_end=(1.0, 1.0, 1.0, 0.0)
+        )
+        emitter = SparkleEmitter(config)
+        
+        emitter.update(0.1, current_time=12.5)
+        
+        assert emitter.get_particle_count() > 0
+        for particle in emitter.particles:
+            brightness = 1.0 + 0.4 * np.sin(12.5 * 3.0 + particle.rotation)
+            assert particle.color[3] == pytest.approx(0.8 * brightness * particle.life)
 
 
 class TestFireEmitter:
@@ -290,6 +504,41 @@ class TestFireEmitter:
         
         assert emitter.heat_dissipation == 0.8
         assert emitter.flicker_intensity == 0.3
+    
+    def test_fire_cooling_and_flicker(self):
+        """Test that fire color and size follow heat level and flicker."""
+        config = ParticleEmitterConfig(
+            emission_rate=300.0,
+            max_particles=100,
+            lifetime_min=0.2,
+            lifetime_max=0.5,
+            position=(0.0, 0.0, 0.0),
+            position_variance=(10.0, 10.0, 10.0),
+            velocity_min=(-20.0, 50.0, -20.0),
+            velocity_max=(20.0, 100.0, 20.0),
+            acceleration=(0.0, -30.0, 0.0),
+            size_min=8.0,
+            size_max=16.0,
+            color_start=(1.0, 0.3, 0.0, 0.9),
+            color_end=(1.0, 1.0, 0.0, 0.0)
+        )
+        emitter = FireEmitter(config)
+        
+        for _ in range(4):
+            emitter.update(0.05, current_time=3.7)
+        
+        assert emitter.get_particle_count() > 0
+        for particle in emitter.particles:
+            heat_level = particle.life * (1.0 - (1.0 - particle.life) * 0.8)
+            flicker = 1.0 + 0.3 * np.sin(3.7 * 8.0 + particle.rotation * 2.0)
+            expected = (
+                min(1.0, flicker),
+                min(1.0, (0.2 + 0.8 * heat_level) * flicker),
+                min(1.0, max(0.0, heat_level - 0.5) * 2.0 * flicker),
+                particle.life * 0.9
+            )
+            assert particle.color == pytest.approx(expected, abs=1e-6)
+            assert particle.size == pytest.approx(12.0 * (0.5 + 0.5 * heat_level))
 
 
 class TestSmokeEmitter:
@@ -353,6 +602,49 @@ class TestSmokeEmitter:
         # Test that smoke particles start smaller
         original_size = config.size_min + (config.size_max - config.size_min) * 0.5
         assert particle.size <= original_size
+    
+    def test_batched_spawn_stays_in_range(self):
+        """Test that one batched draw spawns particles like create_particle."""
+        config = ParticleEmitterConfig(
+            emission_rate=200.0,
+            max_particles=150,
+            lifetime_min=2.0,
+            lifetime_max=4.0,
+            position=(0.0, 0.0, 0.0),
+            position_variance=(15.0, 0.0, 15.0),
+            velocity_min=(-5.0, 20.0, -5.0),
+            velocity_max=(5.0, 40.0, 5.0),
+            acceleration=(0.0, -10.0, 0.0),
+            size_min=12.0,
+            size_max=24.0,
+            color_start=(0.8, 0.8, 0.8, 0.8),
+            color_end=(0.5, 0.5, 0.5, 0.0)
+        )
+        emitter = SmokeEmitter(config, seed=3)
+        emitter._emit_particles(0.5)
+        
+        arrays = emitter.arrays
+        n = arrays.active_count
+        assert n == 100
+        assert np.all(np.abs(arrays.positions[:n, 0]) <= 15.0)
+        assert np.all(arrays.positions[:n, 1] == 0.0)
+        assert np.all((arrays.velocities[:n, 1] >= 20.0) & (arrays.velocities[:n, 1] <= 40.0))
+        assert np.all((arrays.max_life[:n] >= 2.0) & (arrays.max_life[:n] <= 4.0))
+        assert np.all((arrays.size[:n] >= 6.0) & (arrays.size[:n] <= 12.0))
+        assert np.all(arrays.life[:n] == 1.0)
+        assert np.all(arrays.texture_index[:n] == 2)
+        
+        # Wind plus turbulence of at most 0.4 * 20 around the base acceleration
+        assert np.all(np.abs(arrays.accelerations[:n, 0] - 15.0) <= 8.0)
+        
+        # Density scales every channel alike
+        assert np.allclose(arrays.colors[:n, 0], arrays.colors[:n, 3])
+        assert np.all((arrays.colors[:n, 0] >= 0.56) & (arrays.colors[:n, 0] <= 1.04))
+        
+        # A seeded emitter spawns the same batch again
+        again = SmokeEmitter(config, seed=3)
+        again._emit_particles(0.5)
+        assert np.array_equal(again.arrays.positions[:n], arrays.positions[:n])
 
 
 @patch('OpenGL.GL.glGenVertexArrays')
@@ -368,7 +660,7 @@ class TestParticleRenderer:
         assert renderer.shader_manager == mock_shader_manager
         assert not renderer._is_initialized
         assert renderer.max_particles == 10000
-        assert len(renderer.particle_textures) == 0
+        assert renderer.particle_atlas == 0
         assert len(renderer.texture_paths) == 3  # sparkle, fire, smoke
     
     def test_renderer_initialization(self, mock_gen_buffers, mock_gen_vaos):
@@ -389,18 +681,221 @@ class TestParticleRenderer:
              patch('OpenGL.GL.glVertexAttribPointer'), \
              patch('OpenGL.GL.glEnableVertexAttribArray'), \
              patch('OpenGL.GL.glVertexAttribDivisor'), \
-             patch('OpenGL.GL.glGenTextures'), \
+             patch('OpenGL.GL.glGenTextures', return_value=4), \
              patch('OpenGL.GL.glBindTexture'), \
-             patch('OpenGL.GL.glTexImage2D'), \
-             patch('OpenGL.GL.glTexParameteri'):
+             patch('OpenGL.GL.glTexImage2D') as mock_tex_image, \
+             patch('OpenGL.GL.glTexParameteri'), \
+             patch('OpenGL.GL.glBindBufferBase') as mock_bind_base, \
+             patch('OpenGL.GL.glGetUniformBlockIndex', return_value=0), \
+             patch('OpenGL.GL.glUniformBlockBinding') as mock_block_binding:
             
             result = renderer.initialize()
             
             assert result
             assert renderer._is_initialized
             assert renderer.particle_shader == mock_shader_program
-            # Should have created procedural textures
-            assert len(renderer.particle_textures) == 3
+            # Should have created one atlas of the procedural textures
+            assert renderer.particle_atlas == 4
+            mock_tex_image.assert_called_once()
+            assert mock_tex_image.call_args[0][3:5] == (192, 64)
+            # The camera block is bound to its binding point
+            assert mock_bind_base.call_args[0][1] == 0
+            mock_block_binding.assert_called_once_with(mock_shader_program.program_id, 0, 0)
+    
+    def test_camera_block_matches_uniform_matrices(self, mock_gen_buffers, mock_gen_vaos):
+        """Test that the camera block holds the matrices as uniforms uploaded them."""
+        renderer = ParticleRenderer(Mock(spec=ShaderManager))
+        renderer._camera_ubo = 1
+        view = np.arange(16, dtype=np.float64).reshape(4, 4)
+        projection = np.eye(4) * 2.0
+        projection[0, 3] = 1.0
+        
+        with patch('OpenGL.GL.glBindBuffer'), \
+             patch('OpenGL.GL.glBufferSubData') as mock_sub_data:
+            renderer.update_camera(view, projection)
+        
+        block = renderer._camera_block
+        assert mock_sub_data.call_args[0][2] == 3 * 64
+        assert block[0:16].tolist() == view.flatten().tolist()
+        assert block[16:32].tolist() == projection.flatten().tolist()
+        
+        # GLSL reads each block column-major, so viewProjection applied to a
+        # point equals projectionMatrix * viewMatrix in the shader
+        def as_glsl(values):
+            return values.reshape(4, 4).T
+        point = np.array([1.0, 2.0, 3.0, 1.0])
+        assert np.allclose(as_glsl(block[32:48]) @ point,
+                           as_glsl(block[16:32]) @ as_glsl(block[0:16]) @ point)
+    
+    def test_initialization_without_opengl(self, mock_gen_buffers, mock_gen_vaos):
+        """Test that the renderer refuses to initialize when OpenGL is missing."""
+        mock_shader_manager = Mock(spec=ShaderManager)
+        renderer = ParticleRenderer(mock_shader_manager)
+        
+        with patch('src.effects.particle_system.gl', None):
+            assert not renderer.initialize()
+        
+        assert not renderer._is_initialized
+        mock_shader_manager.load_shader_program.assert_not_called()
+    
+    def test_procedural_textures_match_per_texel_formulas(self, mock_gen_buffers, mock_gen_vaos):
+        """Test that the vectorized textures match the per-texel formulas."""
+        renderer = ParticleRenderer(Mock(spec=ShaderManager))
+        size, center = 64, 32
+        expected = {name: np.zeros((size, size, 4), dtype=np.uint8)
+                    for name in ('sparkle', 'fire', 'smoke')}
+        for y in range(size):
+            for x in range(size):
+                dx, dy = x - center, y - center
+                dist = np.sqrt(dx * dx + dy * dy)
+                if dist < center:
+                    star = abs(np.cos(4 * np.arctan2(dy, dx))) * 0.7 + 0.3
+                    expected['sparkle'][y, x] = [255, 255, 255,
+                                                 int((1.0 - dist / center) * star * 255)]
+                    expected['smoke'][y, x] = [128, 128, 128,
+                                               int((1.0 - dist / center) ** 2 * 255)]
+                flame_width = center * (1.0 - y / size) * 0.8 + center * 0.2
+                if dist < flame_width and dist < center:
+                    alpha = (1.0 - dist / flame_width) * (1.0 - y / size * 0.5)
+                    expected['fire'][y, x] = [255, 128, 0, int(alpha * 255)]
+        
+        assert np.array_equal(renderer._create_sparkle_texture(), expected['sparkle'])
+        assert np.array_equal(renderer._create_fire_texture(), expected['fire'])
+        assert np.array_equal(renderer._create_smoke_texture(), expected['smoke'])
+    
+    def test_particle_atlas_tiles_by_texture_index(self, mock_gen_buffers, mock_gen_vaos):
+        """Test that the atlas holds each procedural texture at its texture index."""
+        renderer = ParticleRenderer(Mock(spec=ShaderManager))
+        
+        atlas = renderer._build_particle_atlas()
+        
+        assert atlas.shape == (64, 192, 4)
+        assert atlas.flags['C_CONTIGUOUS']
+        assert np.array_equal(atlas[:, 0:64], renderer._create_sparkle_texture())
+        assert np.array_equal(atlas[:, 64:128], renderer._create_fire_texture())
+        assert np.array_equal(atlas[:, 128:192], renderer._create_smoke_texture())
+    
+    def test_instance_staging(self, mock_gen_buffers, mock_gen_vaos):
+        """Test that active particles of every emitter are staged in order."""
+        renderer = ParticleRenderer(Mock(spec=ShaderManager))
+        first, second = ParticleArrays.allocate(4), ParticleArrays.allocate(4)
+        for arrays, count, offset in ((first, 2, 0.0), (second, 3, 10.0)):
+            arrays.positions[:] = np.arange(12).reshape(4, 3) + offset
+            arrays.colors[:] = 0.5
+            arrays.size[:] = np.arange(4) + offset
+            arrays.rotation[:] = 0.25
+            arrays.pack_colors(0, 4)
+            arrays.active_count = count
+        
+        count = renderer._stage_instances([first, second])
+        
+        staged = renderer._instance_buf[:count]
+        assert count == 5
+        assert staged.dtype == np.float32
+        assert staged[:, 0:3].tolist() == np.vstack(
+            [first.positions[:2], second.positions[:3]]).tolist()
+        assert staged[:, 4].tolist() == [0.0, 1.0, 10.0, 11.0, 12.0]
+        assert np.all(staged[:, 5] == 0.25)
+        assert np.all(staged[:, 8] == -1.0)
+        
+        # Every emitter's rows carry its GPU effect slot
+        renderer._stage_instances([first, second], effect_slots=[3, -1])
+        assert staged[:, 8].tolist() == [3.0, 3.0, -1.0, -1.0, -1.0]
+        
+        # Color is packed into one word as rounded RGBA8 bytes
+        color_bytes = renderer._instance_bytes[:count, 12:16]
+        assert np.all(color_bytes == 128)
+        second.colors[0] = (1.5, -0.2, 0.0, 1.0)
+        second.pack_colors(0, 1)
+        renderer._stage_instances([second])
+        assert renderer._instance_bytes[0, 12:16].tolist() == [255, 0, 0, 255]
+        
+        # Staging stops at the renderer capacity
+        renderer.max_particles = 4
+        assert renderer._stage_instances([first, second]) == 4
+    
+    def test_depth_sort_orders_back_to_front(self, mock_gen_buffers, mock_gen_vaos):
+        """Test that staged instances are sorted farthest first along the view axis."""
+        renderer = ParticleRenderer(Mock(spec=ShaderManager))
+        arrays = ParticleArrays.allocate(4)
+        arrays.positions[:] = [(0.0, 0.0, -1.0), (0.0, 0.0, -9.0), (0.0, 0.0, 2.0), (0.0, 0.0, -4.0)]
+        arrays.size[:] = np.arange(4)
+        arrays.active_count = 4
+        count = renderer._stage_instances([arrays])
+        
+        # Camera at the origin looking down -z: farther particles have lower z
+        ordered = renderer._sort_instances(count, np.eye(4))
+        assert ordered[:, 2].tolist() == [-9.0, -4.0, -1.0, 2.0]
+        assert ordered[:, 4].tolist() == [1.0, 3.0, 0.0, 2.0]
+        
+        # Looking down +z instead reverses the order
+        flipped = np.diag([-1.0, 1.0, -1.0, 1.0])
+        ordered = renderer._sort_instances(count, flipped)
+        assert ordered[:, 2].tolist() == [2.0, -1.0, -4.0, -9.0]
+    
+    def test_render_writes_into_mapped_instance_buffer(self, mock_gen_buffers, mock_gen_vaos):
+        """Test that sorted instances are written straight into the mapped buffer."""
+        mock_shader_manager = Mock(spec=ShaderManager)
+        mock_shader_manager.get_program.return_value = None
+        renderer = ParticleRenderer(mock_shader_manager)
+        renderer._is_initialized = True
+        arrays = ParticleArrays.allocate(8)
+        arrays.positions[:3, 2] = (-1.0, -5.0, -3.0)
+        arrays.size[:3] = (1.0, 2.0, 3.0)
+        arrays.active_count = 3
+        driver_memory = np.zeros((8, _INSTANCE_FLOATS), dtype=np.float32)
+        
+        gl_calls = Mock()
+        gl_calls.glMapBufferRange.return_value = driver_memory.ctypes.data
+        gl_calls.glUnmapBuffer.return_value = True
+        with patch('OpenGL.GL.glBindBuffer'), \
+             patch('OpenGL.GL.glMapBufferRange', gl_calls.glMapBufferRange), \
+             patch('OpenGL.GL.glUnmapBuffer', gl_calls.glUnmapBuffer), \
+             patch('OpenGL.GL.glBufferSubData', gl_calls.glBufferSubData), \
+             patch('OpenGL.GL.glEnable'), \
+             patch('OpenGL.GL.glBlendFunc'), \
+             patch('OpenGL.GL.glDepthMask'), \
+             patch('OpenGL.GL.glBindVertexArray'), \
+             patch('OpenGL.GL.glDrawArraysInstanced', gl_calls.glDrawArraysInstanced), \
+             patch('OpenGL.GL.glDisable'):
+            renderer.render_particles([arrays], np.eye(4), np.eye(4))
+        
+        names = [name for name, args, kwargs in gl_calls.mock_calls]
+        assert names == ['glMapBufferRange', 'glUnmapBuffer', 'glDrawArraysInstanced']
+        assert gl_calls.glMapBufferRange.call_args[0][2] == 3 * _INSTANCE_FLOATS * 4
+        assert driver_memory[:3, 2].tolist() == [-5.0, -3.0, -1.0]
+        assert driver_memory[:3, 4].tolist() == [2.0, 3.0, 1.0]
+        assert not driver_memory[3:].any()
+    
+    def test_render_orphans_instance_buffer(self, mock_gen_buffers, mock_gen_vaos):
+        """Test that each frame re-specifies the instance buffer when it cannot be mapped."""
+        mock_shader_manager = Mock(spec=ShaderManager)
+        mock_shader_manager.get_program.return_value = None
+        renderer = ParticleRenderer(mock_shader_manager)
+        renderer._is_initialized = True
+        arrays = ParticleArrays.allocate(8)
+        arrays.active_count = 5
+        
+        gl_calls = Mock()
+        with patch('OpenGL.GL.glBindBuffer'), \
+             patch('OpenGL.GL.glMapBufferRange', return_value=None), \
+             patch('OpenGL.GL.glBufferData', gl_calls.glBufferData), \
+             patch('OpenGL.GL.glBufferSubData', gl_calls.glBufferSubData), \
+             patch('OpenGL.GL.glEnable'), \
+             patch('OpenGL.GL.glBlendFunc'), \
+             patch('OpenGL.GL.glDepthMask'), \
+             patch('OpenGL.GL.glBindVertexArray'), \
+             patch('OpenGL.GL.glDrawArraysInstanced', gl_calls.glDrawArraysInstanced), \
+             patch('OpenGL.GL.glDisable'):
+            renderer.render_particles([arrays], np.eye(4), np.eye(4))
+        
+        names = [name for name, args, kwargs in gl_calls.mock_calls]
+        assert names == ['glBufferData', 'glBufferSubData', 'glDrawArraysInstanced']
+        buffer_data_args = gl_calls.glBufferData.call_args[0]
+        assert buffer_data_args[1] == renderer._instance_buf.nbytes
+        assert buffer_data_args[2] is None
+        assert gl_calls.glBufferSubData.call_args[0][2] == 5 * _INSTANCE_FLOATS * 4
+        assert gl_calls.glDrawArraysInstanced.call_args[0][3] == 5
 
 
 class TestParticleSystem:
@@ -525,6 +1020,149 @@ class TestParticleSystem:
         
         assert system.get_total_particle_count() == 0
     
+    def test_gpu_effects_match_cpu_effects(self):
+        """Test that the shader effect parameters reproduce the CPU effects."""
+        def shader_effect(texture_index, params, rate, life, rotation, color, size):
+            # Python mirror of applyParticleEffect in particle_vertex.glsl
+            phase, amplitude, alpha, base_size = params
+            red, green, blue, _ = color
+            if texture_index == 0:
+                brightness = 1.0 + amplitude * np.sin(rotation + phase)
+                return (red, green, blue, brightness * alpha * life), size
+            if texture_index == 1:
+                heat = life * (1.0 - (1.0 - life) * rate)
+                flicker = 1.0 + amplitude * np.sin(rotation * 2.0 + phase)
+                return ((min(1.0, flicker), min(1.0, (0.2 + 0.8 * heat) * flicker),
+                         min(1.0, max(0.0, heat - 0.5) * 2.0 * flicker), life * alpha),
+                        base_size * (0.5 + 0.5 * heat))
+            age = 1.0 - life
+            return ((red, green, blue, alpha * (life * (1.0 - age * 0.5))),
+                    base_size * (1.0 + age * rate) * 0.5)
+        
+        system = ParticleSystem(Mock(spec=ShaderManager))
+        system.create_sparkle_effect("sparkle", (0.0, 0.0, 0.0), emission_rate=200.0)
+        system.create_fire_effect("fire", (0.0, 0.0, 0.0), emission_rate=200.0)
+        system.create_smoke_effect("smoke", (0.0, 0.0, 0.0), emission_rate=200.0)
+        
+        for emitter in system.emitters.values():
+            emitter.update(0.1, current_time=1234.5)
+            params, rate = emitter.gpu_effect_parameters(1234.5)
+            assert 0.0 <= params[0] < 2.0 * np.pi
+            assert emitter.get_particle_count() > 0
+            for particle in emitter.particles:
+                color, size = shader_effect(emitter.texture_index, params, rate, particle.life,
+                                            particle.rotation, particle.color, particle.size)
+                assert color == pytest.approx(particle.color, abs=1e-6)
+                assert size == pytest.approx(particle.size)
+        
+        # With GPU effects the emitters keep spawn colors, packed only at spawn
+        system.set_gpu_effects(True)
+        system.create_fire_effect("fire2", (0.0, 0.0, 0.0), emission_rate=200.0)
+        fire = system.emitters["fire2"]
+        assert fire.effects_on_gpu
+        fire.update(0.1)
+        assert all(particle.color[0] == 1.0 for particle in fire.particles)
+        assert np.all(fire.arrays.rgba8[:fire.get_particle_count(), 3] == 204)
+        fire.config.emission_rate = 0.0
+        with patch.object(fire.arrays, 'pack_colors') as mock_pack:
+            fire.update(0.1)
+        mock_pack.assert_not_called()
+        assert all(particle.color[3] == pytest.approx(0.8) for particle in fire.particles)
+    
+    def test_gpu_effect_slots_per_emitter(self):
+        """Test that emitters of one type keep their own GPU effect parameters."""
+        system = ParticleSystem(Mock(spec=ShaderManager))
+        system._is_initialized = True
+        system.set_gpu_effects(True)
+        for emitter_id in ("small", "large", "small2"):
+            system.create_fire_effect(emitter_id, (0.0, 0.0, 0.0), emission_rate=100.0)
+        system.emitters["large"].config.size_max = 60.0
+        system.emitters["large"].config.color_start = (1.0, 0.3, 0.0, 0.4)
+        system.update(0.1, current_time=2.0)
+        
+        with patch.object(system.renderer, 'render_particles') as render_particles:
+            system.render(np.eye(4), np.eye(4))
+        particle_arrays, _, _, table, slots = render_particles.call_args[0]
+        
+        # Equal parameters share a slot, different ones get their own
+        assert len(particle_arrays) == 3
+        assert slots == [0, 1, 0]
+        emitters = list(system.emitters.values())
+        for emitter, slot in zip(emitters, slots):
+            assert table[slot] == emitter.gpu_effect_parameters(2.0)
+        assert table[0][0][2:] == pytest.approx((0.8, 14.0))
+        assert table[1][0][2:] == pytest.approx((0.4, 34.0))
+        
+        # Past the slot limit emitters fall back to CPU effects for the frame
+        for index in range(_MAX_EFFECT_SLOTS):
+            system.create_fire_effect(f"extra{index}", (0.0, 0.0, 0.0), emission_rate=100.0)
+            system.emitters[f"extra{index}"].config.size_max = 21.0 + index
+        system.update(0.1, current_time=2.1)
+        with patch.object(system.renderer, 'render_particles') as render_particles:
+            system.render(np.eye(4), np.eye(4))
+        _, _, _, table, slots = render_particles.call_args[0]
+        assert len(table) == _MAX_EFFECT_SLOTS
+        assert slots[-1] == -1
+        last = system.emitters[f"extra{_MAX_EFFECT_SLOTS - 1}"]
+        expected = last.arrays.colors[:last.get_particle_count(), 3].copy()
+        last.effects_on_gpu = False
+        last._apply_effects(last.get_particle_count(), 2.1)
+        np.testing.assert_allclose(last.arrays.colors[:last.get_particle_count(), 3], expected)
+    
+    def test_update_shares_one_frame_time(self):
+        """Test that every emitter updates with the same frame time."""
+        system = ParticleSystem(Mock(spec=ShaderManager))
+        system._is_initialized = True
+        system.create_sparkle_effect("sparkle", (0.0, 0.0, 0.0))
+        system.create_fire_effect("fire", (10.0, 0.0, 0.0))
+        for emitter in system.emitters.values():
+            emitter.update = Mock()
+        
+        system.update(0.1, current_time=5.0)
+        
+        assert system.current_time == 5.0
+        for emitter in system.emitters.values():
+            emitter.update.assert_called_once_with(0.1, 5.0)
+        
+        # Without a frame time one monotonic sample is taken for all emitters
+        with patch('src.effects.particle_system.time.perf_counter', return_value=7.5) as clock:
+            system.update(0.1)
+        clock.assert_called_once()
+        assert system.emitters["fire"].update.call_args[0] == (0.1, 7.5)
+    
+    def test_emitter_config_overrides_type_defaults(self):
+        """Test that physics parameters override the shared type defaults."""
+        system = ParticleSystem(Mock(spec=ShaderManager))
+        effect = ParticleEffect(ParticleType.FIRE, 30.0, 1.0, None,
+                                {'max_particles': 40, 'unknown': 1.0})
+        
+        config = system._create_emitter_config(effect, (1.0, 2.0, 3.0))
+        default_config = system._create_emitter_config(
+            ParticleEffect(ParticleType.FIRE, 30.0, 1.0, None, {}), (0.0, 0.0, 0.0))
+        
+        assert config.max_particles == 40
+        assert config.size_max == 20.0
+        assert config.position == (1.0, 2.0, 3.0)
+        assert default_config.max_particles == 250
+    
+    def test_seeded_systems_spawn_identically(self):
+        """Test that a seeded system seeds its emitters reproducibly."""
+        systems = [ParticleSystem(Mock(spec=ShaderManager), seed=7) for _ in range(2)]
+        for system in systems:
+            system.create_sparkle_effect("sparkle", (0.0, 0.0, 0.0), emission_rate=100.0)
+            system.create_smoke_effect("smoke", (10.0, 0.0, 0.0), emission_rate=100.0)
+            for emitter in system.emitters.values():
+                emitter.update(0.1, current_time=1.0)
+        
+        first, second = (system.emitters for system in systems)
+        for emitter_id in ("sparkle", "smoke"):
+            assert first[emitter_id].get_particle_count() == 10
+            for array, other in zip(first[emitter_id].arrays.fields(),
+                                    second[emitter_id].arrays.fields()):
+                np.testing.assert_array_equal(array, other)
+        assert not np.array_equal(first["sparkle"].arrays.positions,
+                                  first["smoke"].arrays.positions)
+    
     def test_cleanup(self):
         """Test system cleanup."""
         mock_shader_manager = Mock(spec=ShaderManager)
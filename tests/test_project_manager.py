@@ -216,8 +216,11 @@ class TestProjectManager:
         assert str(updated_dir) == new_dir
         assert os.path.exists(new_dir)
     
-    def test_validate_project_compatibility(self):
+    def test_validate_project_compatibility(self, monkeypatch):
         """Test project compatibility validation."""
+        # Keep capability reports out of the user's real cache
+        monkeypatch.setattr('src.core.validation._CAPABILITY_CACHE_PATH',
+                            Path(self.temp_dir) / 'opengl_caps.json')
         project = self.project_manager.create_project(self.test_video_path)
         
         # Validate compatibility
@@ -78,6 +78,24 @@ class TestTimelineEngine:
         self.timeline.video_asset = new_video
         assert self.timeline.video_asset == new_video
         assert self.timeline.duration == 20.0
+        
+        # Frame conversion follows the new frame rate
+        assert self.timeline.get_frame_from_time(1.0) == 60
+        assert self.timeline.sync_to_video_frame(120) == 2.0
+    
+    def test_video_asset_without_frame_rate(self):
+        """Test that an unprobed asset with fps 0 is accepted and reported."""
+        unprobed = VideoAsset(path="pending.mp4", duration=10.0, fps=0.0,
+                              resolution=(1920, 1080), codec="h264")
+        
+        timeline = TimelineEngine(unprobed)
+        assert timeline.sync_to_video_frame(30) == 0.0
+        
+        self.timeline.video_asset = unprobed
+        assert self.timeline.sync_to_video_frame(30) == 0.0
+        validation = self.timeline.validate_timeline()
+        assert not validation.is_valid
+        assert "frame rate" in validation.error_message
     
     def test_audio_asset_management(self):
         """Test audio asset management."""
@@ -188,6 +206,135 @@ class TestTimelineEngine:
         props = self.timeline.interpolate_properties("track1", 5.0)
         assert props["opacity"] == 1.0  # Should use last keyframe
     
+    def test_fast_property_interpolation(self):
+        """Test array-based property interpolation with a fixed layout."""
+        track = SubtitleTrack(
+            id="track1",
+            elements=[],
+            keyframes=[],
+            start_time=0.0,
+            end_time=10.0
+        )
+        self.timeline.add_subtitle_track(track)
+        
+        self.timeline.add_keyframe("track1", 1.0, {"opacity": 0.0, "scale": 1.0, "text": "a"})
+        self.timeline.add_keyframe("track1", 3.0, {"opacity": 1.0, "scale": 2.0, "text": "b"})
+        
+        # Layout is fixed at first insert and only holds numeric properties
+        assert track.property_layout == ("opacity", "scale")
+        
+        values = self.timeline.interpolate_properties_fast("track1", 2.0)
+        assert isinstance(values, np.ndarray)
+        np.testing.assert_allclose(values, [0.5, 1.5])
+        
+        np.testing.assert_allclose(self.timeline.interpolate_properties_fast("track1", 0.5), [0.0, 1.0])
+        np.testing.assert_allclose(self.timeline.interpolate_properties_fast("track1", 5.0), [1.0, 2.0])
+        assert self.timeline.interpolate_properties_fast("missing", 2.0).size == 0
+        
+        # Non-numeric values in a layout property count as missing, as the dict path steps them
+        self.timeline.add_keyframe("track1", 5.0, {"opacity": "full", "scale": None})
+        assert self.timeline.interpolate_properties("track1", 4.5)["opacity"] == "full"
+        np.testing.assert_allclose(self.timeline.interpolate_properties_fast("track1", 4.0), [1.0, 2.0])
+        values = self.timeline.interpolate_properties_fast("track1", 6.0)
+        assert np.isnan(values).all()
+    
+    def test_schema_uniform_track_interpolation(self):
+        """Test the matrix fast path for keyframes sharing one numeric schema."""
+        track = SubtitleTrack(id="track1", elements=[], keyframes=[],
+                              start_time=0.0, end_time=10.0)
+        self.timeline.add_subtitle_track(track)
+        self.timeline.add_keyframe("track1", 0.0, {"opacity": 0.0, "scale": 1})
+        self.timeline.add_keyframe("track1", 2.0, {"opacity": 1.0, "scale": 3})
+        self.timeline.add_keyframe("track1", 4.0, {"opacity": 0.5, "scale": 2})
+        
+        props = self.timeline.interpolate_properties("track1", 3.0)
+        assert props == {"opacity": 0.75, "scale": 2.5}
+        assert type(props["scale"]) is float
+        np.testing.assert_allclose(self.timeline.interpolate_properties_fast("track1", 1.0), [0.5, 2.0])
+        
+        # A keyframe with a different schema falls back to per-key interpolation
+        self.timeline.add_keyframe("track1", 6.0, {"opacity": 1.0, "text": "x"})
+        props = self.timeline.interpolate_properties("track1", 5.0)
+        assert props == {"opacity": 0.75, "scale": 2, "text": "x"}
+        np.testing.assert_allclose(self.timeline.interpolate_properties_fast("track1", 5.0), [0.75, 2.0])
+    
+    def test_keyframe_edits_rebuild_lookup_cache(self):
+        """Test that edits keeping the keyframe count invalidate cached lookups."""
+        track = SubtitleTrack(id="track1", elements=[], keyframes=[],
+                              start_time=0.0, end_time=10.0)
+        self.timeline.add_subtitle_track(track)
+        self.timeline.add_keyframe("track1", 0.0, {"opacity": 0.0, "scale": 1.0})
+        self.timeline.add_keyframe("track1", 2.0, {"opacity": 1.0, "scale": 3.0})
+        self.timeline.add_keyframe("track1", 4.0, {"opacity": 0.0, "scale": 1.0})
+        assert self.timeline.interpolate_properties("track1", 1.0) == {"opacity": 0.5, "scale": 2.0}
+        
+        # Changing a value through the engine
+        assert self.timeline.update_keyframe("track1", 2.0, properties={"opacity": 0.5})
+        assert self.timeline.interpolate_properties("track1", 1.0) == {"opacity": 0.25, "scale": 2.0}
+        np.testing.assert_allclose(self.timeline.interpolate_properties_fast("track1", 1.0),
+                                   [0.25, 2.0])
+        
+        # Moving a keyframe through the engine
+        assert self.timeline.update_keyframe("track1", 2.0, new_time=1.0)
+        assert self.timeline.interpolate_properties("track1", 1.0) == {"opacity": 0.5, "scale": 3.0}
+        np.testing.assert_allclose(self.timeline.interpolate_properties_fast("track1", 2.5),
+                                   [0.25, 2.0])
+        assert not self.timeline.update_keyframe("track1", 1.0, new_time=20.0)
+        assert not self.timeline.update_keyframe("track1", 3.0, properties={"opacity": 1.0})
+        
+        # Editing keyframe objects in place and marking the track
+        track.keyframes[1].properties["scale"] = 5.0
+        track.keyframes[2] = Keyframe(4.0, {"opacity": 1.0, "scale": 5.0}, InterpolationType.LINEAR)
+        track.mark_keyframes_changed()
+        assert self.timeline.interpolate_properties("track1", 2.5) == {"opacity": 0.75, "scale": 5.0}
+        np.testing.assert_allclose(self.timeline.interpolate_properties_fast("track1", 0.5),
+                                   [0.25, 3.0])
+    
+    def test_interpolation_with_differing_property_keys(self):
+        """Test interpolation when adjacent keyframes animate different properties."""
+        track = SubtitleTrack(id="track1", elements=[], keyframes=[],
+                              start_time=0.0, end_time=10.0)
+        self.timeline.add_subtitle_track(track)
+        self.timeline.add_keyframe("track1", 1.0, {"opacity": 0.0, "scale": 1.0})
+        self.timeline.add_keyframe("track1", 3.0, {"opacity": 1.0, "rotation": 90.0})
+        
+        # Repeated lookups reuse the cached key union for the pair
+        for _ in range(2):
+            props = self.timeline.interpolate_properties("track1", 2.0)
+            assert props == {"opacity": 0.5, "scale": 1.0, "rotation": 90.0}
+        
+        # Editing keyframes invalidates the cached key union
+        self.timeline.add_keyframe("track1", 3.0, {"opacity": 1.0, "blur": 2.0})
+        props = self.timeline.interpolate_properties("track1", 2.0)
+        assert props == {"opacity": 0.5, "scale": 1.0, "blur": 2.0}
+    
+    def test_value_interpolation_dispatch(self):
+        """Test per-type value interpolation in the timeline engine."""
+        assert self.timeline._interpolate_value(0, 10, 0.25) == 2.5
+        assert self.timeline._interpolate_value((0.0, 1.0), (1.0, 3.0), 0.5) == (0.5, 2.0)
+        assert self.timeline._interpolate_value([0, "a"], [2, "b"], 0.5) == [1.0, "b"]
+        assert self.timeline._interpolate_value(False, True, 0.4) is False
+        assert self.timeline._interpolate_value("a", "b", 0.5) == "b"
+        assert self.timeline._interpolate_value(1.0, "b", 0.2) == 1.0
+        assert self.timeline._interpolate_value(np.float64(1.0), 3.0, 0.5) == 2.0
+    
+    def test_keyframe_lookup_uniform_and_irregular_tracks(self):
+        """Test keyframe bracketing on evenly and unevenly spaced tracks."""
+        for track_id, times in (("uniform", [0.5 * i for i in range(20)]),
+                                ("irregular", [0.0, 0.1, 0.15, 2.0, 2.05, 7.5, 9.0])):
+            track = SubtitleTrack(id=track_id, elements=[], keyframes=[],
+                                  start_time=0.0, end_time=10.0)
+            self.timeline.add_subtitle_track(track)
+            for t in times:
+                self.timeline.add_keyframe(track_id, t, {"value": t})
+            
+            # Linear keyframes with value == time interpolate to the query time
+            for query in (0.0, 0.12, 0.3, 1.75, 2.02, 4.9, 8.99):
+                props = self.timeline.interpolate_properties(track_id, query)
+                assert props["value"] == pytest.approx(query)
+            
+            assert self.timeline.interpolate_properties(track_id, 9.9)["value"] == times[-1]
+    
     def test_keyframe_copy_paste(self):
         """Test keyframe copy and paste operations."""
         track = SubtitleTrack(
@@ -286,6 +433,17 @@ class TestTimelineEngine:
         assert self.timeline.current_time == 10.0
         assert not self.timeline.is_playing()  # Should auto-pause
     
+    def test_timeline_update_while_paused(self):
+        """Test that update is a no-op when paused or given a zero delta."""
+        self.timeline.current_time = 2.0
+        self.timeline.update(0.5)
+        assert self.timeline.current_time == 2.0
+        
+        self.timeline.play()
+        self.timeline.update(0.0)
+        assert self.timeline.current_time == 2.0
+        assert self.timeline.is_playing()
+    
     def test_seek_operation(self):
         """Test seek functionality."""
         self.timeline.seek(5.0)
@@ -376,6 +534,29 @@ class TestTimelineEngine:
         validation = self.timeline.validate_timeline()
         assert not validation.is_valid
         assert "Track" in validation.error_message
+    
+    def test_timeline_validation_overlapping_keyframes(self):
+        """Test that duplicate keyframe times are reported as warnings."""
+        track = SubtitleTrack(
+            id="track1",
+            elements=[],
+            keyframes=[
+                Keyframe(1.0, {"opacity": 0.0}, InterpolationType.LINEAR),
+                Keyframe(1.0, {"opacity": 1.0}, InterpolationType.LINEAR),
+                Keyframe(2.0, {"opacity": 0.5}, InterpolationType.LINEAR),
+            ],
+            start_time=0.0,
+            end_time=5.0
+        )
+        self.timeline.add_subtitle_track(track)
+        
+        validation = self.timeline.validate_timeline()
+        assert validation.is_valid
+        assert "Track track1 has overlapping keyframes" in validation.warnings
+        
+        self.timeline.remove_keyframe("track1", 1.0)
+        validation = self.timeline.validate_timeline()
+        assert "Track track1 has overlapping keyframes" not in validation.warnings
 
 
 class TestKeyframeSystem: